@@ -0,0 +1,353 @@
+"""Job state and event storage for the API server.
+
+When ``REDIS_URL`` is set and the ``redis`` package is installed, jobs are kept
+in Redis (one hash per job, Pub/Sub channel per job for workflow events) so the
+API can run with several uvicorn workers and jobs survive restarts. Otherwise an
+in-process store with the same interface is used.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _dumps(obj: Any) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+# Jobs (and their event backlog) expire after one day
+JOB_TTL_SECONDS = 86400
+# Per-job/per-client event queues are bounded; log events are the first to go on overflow
+EVENT_QUEUE_MAXSIZE = 1000
+# Most events a subscription hands out per get_many() call
+GET_MANY_MAX = 64
+
+
+def _is_log_event(event: Optional[Dict[str, Any]]) -> bool:
+    return isinstance(event, dict) and event.get("event") in ("log", "logs")
+
+
+def put_event_nowait(queue: asyncio.Queue, event: Optional[Dict[str, Any]]) -> bool:
+    """Enqueue an event without blocking on a bounded queue.
+
+    When the queue is full, log events are dropped; step/status events and the end-of-stream
+    marker evict the oldest queued item instead. Returns False if ``event`` was dropped.
+    """
+    try:
+        queue.put_nowait(event)
+        return True
+    except asyncio.QueueFull:
+        if _is_log_event(event):
+            return False
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        queue.put_nowait(event)
+        return True
+
+
+class InMemoryJobStore:
+    """Process-local job store (dev installs without Redis).
+
+    The replay backlog keeps every step/status event but at most ``max_backlog_logs`` log events.
+    """
+
+    def __init__(self, ttl: int = JOB_TTL_SECONDS, max_backlog_logs: int = EVENT_QUEUE_MAXSIZE // 2) -> None:
+        self.ttl = ttl
+        self.max_backlog_logs = max_backlog_logs
+        self._backlog_logs: Dict[str, int] = {}
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._created: Dict[str, float] = {}
+        self._events: Dict[str, List[Optional[Dict[str, Any]]]] = {}
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.ttl
+        for job_id in [j for j, ts in self._created.items() if ts < cutoff]:
+            self._jobs.pop(job_id, None)
+            self._created.pop(job_id, None)
+            self._events.pop(job_id, None)
+            self._backlog_logs.pop(job_id, None)
+            self._subscribers.pop(job_id, None)
+
+    async def create(self, job_id: str, fields: Dict[str, Any]) -> None:
+        self._prune()
+        self._jobs[job_id] = dict(fields)
+        self._created[job_id] = time.time()
+        self._events[job_id] = []
+        self._backlog_logs[job_id] = 0
+        self._subscribers[job_id] = []
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+    async def update(self, job_id: str, **fields: Any) -> None:
+        if job_id in self._jobs:
+            self._jobs[job_id].update(fields)
+
+    async def list(self, offset: int = 0, limit: Optional[int] = None, fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Jobs in creation order, optionally paged and projected onto ``fields``."""
+        stop = None if limit is None else offset + limit
+        page = itertools.islice(self._jobs.values(), offset, stop)
+        if fields is None:
+            return [dict(j) for j in page]
+        keys = tuple(fields)
+        return [{k: j.get(k) for k in keys} for j in page]
+
+    async def request_cancel(self, job_id: str) -> None:
+        await self.update(job_id, cancel_requested=True)
+
+    async def is_cancelled(self, job_id: str) -> bool:
+        return bool((self._jobs.get(job_id) or {}).get("cancel_requested"))
+
+    async def publish(self, job_id: str, event: Optional[Dict[str, Any]]) -> None:
+        """Append an event to the job stream; ``None`` marks end of stream."""
+        if job_id not in self._events:
+            return
+        if not _is_log_event(event):
+            self._events[job_id].append(event)
+        elif self._backlog_logs[job_id] < self.max_backlog_logs:
+            self._events[job_id].append(event)
+            self._backlog_logs[job_id] += 1
+        for q in self._subscribers[job_id]:
+            put_event_nowait(q, event)
+
+    async def publish_many(self, job_id: str, events: List[Optional[Dict[str, Any]]]) -> None:
+        for event in events:
+            await self.publish(job_id, event)
+
+    def subscribe(self, job_id: str) -> "_MemorySubscription":
+        return _MemorySubscription(self, job_id)
+
+
+class _MemorySubscription:
+    def __init__(self, store: InMemoryJobStore, job_id: str) -> None:
+        self._store = store
+        self._job_id = job_id
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+        # Replay events published before the client connected
+        for evt in store._events.get(job_id, []):
+            put_event_nowait(self._queue, evt)
+        store._subscribers.setdefault(job_id, []).append(self._queue)
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Next event (``None`` at end of stream); raises ``asyncio.TimeoutError``."""
+        return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+
+    async def get_many(self, timeout: float, max_items: int = GET_MANY_MAX) -> List[Optional[Dict[str, Any]]]:
+        """Next event plus any already queued behind it, up to ``max_items`` or end of stream."""
+        events = [await self.get(timeout)]
+        while events[-1] is not None and len(events) < max_items and not self._queue.empty():
+            events.append(self._queue.get_nowait())
+        return events
+
+    async def close(self) -> None:
+        subs = self._store._subscribers.get(self._job_id) or []
+        if self._queue in subs:
+            subs.remove(self._queue)
+
+
+class RedisJobStore:
+    """Redis-backed job store.
+
+    Keys: ``job:{id}`` hash (JSON-encoded field values), ``job:{id}:backlog``
+    list of already published ``{"seq", "event"}`` entries, ``job:{id}:seq`` and
+    ``job:{id}:logs`` counters of published events and log events, ``jobs`` sorted
+    set of job ids by creation time. Live events go through the ``job:{id}:events``
+    channel. Like the in-memory store, the backlog keeps every step/status event but
+    at most ``max_backlog_logs`` log events.
+    """
+
+    def __init__(self, url: str, ttl: int = JOB_TTL_SECONDS, max_backlog_logs: int = EVENT_QUEUE_MAXSIZE // 2) -> None:
+        import redis.asyncio as aioredis  # type: ignore
+
+        self.ttl = ttl
+        self.max_backlog_logs = max_backlog_logs
+        self.redis = aioredis.from_url(url, decode_responses=True)
+
+    async def create(self, job_id: str, fields: Dict[str, Any]) -> None:
+        now = time.time()
+        key = f"job:{job_id}"
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={k: _dumps(v) for k, v in fields.items()})
+            pipe.expire(key, self.ttl)
+            pipe.zadd("jobs", {job_id: now})
+            pipe.zremrangebyscore("jobs", "-inf", now - self.ttl)
+            await pipe.execute()
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self.redis.hgetall(f"job:{job_id}")
+        if not raw:
+            return None
+        return {k: _loads(v) for k, v in raw.items()}
+
+    async def update(self, job_id: str, **fields: Any) -> None:
+        if fields:
+            await self.redis.hset(f"job:{job_id}", mapping={k: _dumps(v) for k, v in fields.items()})
+
+    async def list(self, offset: int = 0, limit: Optional[int] = None, fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Jobs in creation order, optionally paged and projected onto ``fields`` (HMGET)."""
+        stop = -1 if limit is None else offset + limit - 1
+        # Expired ids are dropped here too, so listing does not depend on new jobs being created
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore("jobs", "-inf", time.time() - self.ttl)
+            pipe.zrange("jobs", offset, stop)
+            _, job_ids = await pipe.execute()
+        keys = tuple(fields) if fields is not None else None
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                if keys is None:
+                    pipe.hgetall(f"job:{job_id}")
+                else:
+                    pipe.hmget(f"job:{job_id}", keys)
+            rows = await pipe.execute()
+        out: List[Dict[str, Any]] = []
+        missing: List[str] = []
+        for job_id, row in zip(job_ids, rows):
+            if keys is None:
+                if row:
+                    out.append({k: _loads(v) for k, v in row.items()})
+                else:
+                    missing.append(job_id)
+            elif any(v is not None for v in row):
+                out.append({k: _loads(v) if v is not None else None for k, v in zip(keys, row)})
+        if missing:
+            # Hash already expired (or was deleted) while its id was still indexed
+            await self.redis.zrem("jobs", *missing)
+        return out
+
+    async def request_cancel(self, job_id: str) -> None:
+        await self.update(job_id, cancel_requested=True)
+
+    async def is_cancelled(self, job_id: str) -> bool:
+        return bool(_loads(await self.redis.hget(f"job:{job_id}", "cancel_requested") or "false"))
+
+    async def publish(self, job_id: str, event: Optional[Dict[str, Any]]) -> None:
+        """Append an event to the job stream; ``None`` marks end of stream."""
+        await self.publish_many(job_id, [event])
+
+    async def publish_many(self, job_id: str, events: List[Optional[Dict[str, Any]]]) -> None:
+        """Append several events with one round trip for the counters and one for backlog and Pub/Sub."""
+        if not events:
+            return
+        keys = (f"job:{job_id}:backlog", f"job:{job_id}:seq", f"job:{job_id}:logs")
+        n_logs = sum(1 for e in events if _is_log_event(e))
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.incrby(keys[1], len(events))
+            pipe.incrby(keys[2], n_logs)
+            last, logs_total = await pipe.execute()
+        logs_seen = logs_total - n_logs
+        entries: List[str] = []
+        kept: List[str] = []
+        for seq, event in enumerate(events, last - len(events) + 1):
+            entry = _dumps({"seq": seq, "event": event})
+            entries.append(entry)
+            if _is_log_event(event):
+                logs_seen += 1
+                if logs_seen > self.max_backlog_logs:
+                    continue
+            kept.append(entry)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if kept:
+                pipe.rpush(keys[0], *kept)
+            for key in keys:
+                pipe.expire(key, self.ttl)
+            for entry in entries:
+                pipe.publish(f"job:{job_id}:events", entry)
+            await pipe.execute()
+
+    def subscribe(self, job_id: str) -> "_RedisSubscription":
+        return _RedisSubscription(self, job_id)
+
+
+class _RedisSubscription:
+    def __init__(self, store: RedisJobStore, job_id: str) -> None:
+        self._store = store
+        self._job_id = job_id
+        self._pubsub = None
+        self._pending: List[Optional[Dict[str, Any]]] = []
+        self._seen = 0
+
+    async def _start(self) -> None:
+        # Subscribe before reading the backlog so nothing published in between is lost;
+        # live messages already covered by the backlog are skipped by sequence number.
+        self._pubsub = self._store.redis.pubsub()
+        await self._pubsub.subscribe(f"job:{self._job_id}:events")
+        backlog = [_loads(x) for x in await self._store.redis.lrange(f"job:{self._job_id}:backlog", 0, -1)]
+        self._pending = [entry.get("event") for entry in backlog]
+        self._seen = int(backlog[-1]["seq"]) if backlog else 0
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Next event (``None`` at end of stream); raises ``asyncio.TimeoutError``."""
+        if self._pubsub is None:
+            await self._start()
+        if self._pending:
+            return self._pending.pop(0)
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            found, event = await self._next_live(remaining)
+            if found:
+                return event
+
+    async def _next_live(self, timeout: float) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        # (False, None) when nothing new arrived within timeout (0 = don't wait)
+        msg = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if not msg or msg.get("type") != "message":
+            return False, None
+        data = _loads(msg["data"])
+        if int(data.get("seq", 0)) <= self._seen:
+            return False, None
+        self._seen = int(data["seq"])
+        return True, data.get("event")
+
+    async def get_many(self, timeout: float, max_items: int = GET_MANY_MAX) -> List[Optional[Dict[str, Any]]]:
+        """Next event plus any already delivered behind it, up to ``max_items`` or end of stream."""
+        events = [await self.get(timeout)]
+        while events[-1] is not None and len(events) < max_items:
+            if self._pending:
+                events.append(self._pending.pop(0))
+                continue
+            found, event = await self._next_live(0)
+            if not found:
+                break
+            events.append(event)
+        return events
+
+    async def close(self) -> None:
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe()
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+
+
+def create_job_store(url: Optional[str] = None):
+    """Return a Redis store when ``url``/``REDIS_URL`` is set and redis is installed, else in-memory."""
+    url = url or os.environ.get("REDIS_URL")
+    if url:
+        try:
+            return RedisJobStore(url)
+        except ImportError:
+            pass
+    return InMemoryJobStore()
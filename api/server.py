@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import gzip
+import hashlib
 import json
+import mimetypes
 import os
-import tempfile
+import shutil
+import stat
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -11,19 +16,121 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 import re
 import subprocess
 import sys
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
 
 try:
-    from fastapi import FastAPI, HTTPException, BackgroundTasks
+    import httpx
+    from fastapi import FastAPI, HTTPException, BackgroundTasks, Header, Query
     from fastapi.responses import StreamingResponse, RedirectResponse
     from fastapi.staticfiles import StaticFiles
     from pydantic import BaseModel
+    import anyio.to_thread
+    from starlette.datastructures import Headers
+    from starlette.responses import FileResponse
+    from starlette.staticfiles import NotModifiedResponse
 except ImportError:
-    raise ImportError("FastAPI and pydantic required for API server. pip install fastapi uvicorn")
+    raise ImportError("FastAPI, pydantic and httpx required for API server. pip install fastapi uvicorn httpx")
+
+from api.job_store import EVENT_QUEUE_MAXSIZE, RedisJobStore, create_job_store, put_event_nowait
+from src.pipeline import normalize_level
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    # One reusable encoder for all SSE frames
+    _msgspec_encoder = msgspec.json.Encoder(enc_hook=str)
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+def _json_loads(data: str | bytes) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_dumpb(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes (msgspec, then orjson, then stdlib json)."""
+    if MSGSPEC_AVAILABLE:
+        return _msgspec_encoder.encode(obj)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+try:
+    from watchfiles import awatch
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Shared outbound HTTP client (connection pooling); opened/closed with the app lifespan
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        try:
+            _http_client = httpx.AsyncClient(http2=True, timeout=20.0)
+        except ImportError:
+            # http2 needs the optional 'h2' package
+            _http_client = httpx.AsyncClient(timeout=20.0)
+    return _http_client
+
+
+@asynccontextmanager
+async def lifespan(_app: "FastAPI"):
+    # Raise anyio's default worker-thread limit (40) used for sync endpoints/dependencies
+    try:
+        import anyio.to_thread
+        anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+    except Exception:
+        pass
+    _get_http_client()
+    # Spawn the Arelle worker processes up front so the first job doesn't wait for them
+    from src.validation.arelle_runner import get_worker_pool
+    pool = get_worker_pool()
+    if pool is not None:
+        try:
+            await asyncio.get_running_loop().run_in_executor(_io_pool, pool.warm)
+        except Exception:
+            pass
+    try:
+        yield
+    finally:
+        if _http_client is not None:
+            await _http_client.aclose()
+        from src.validation.arelle_runner import _worker_pool
+        if _worker_pool is not None:
+            _worker_pool.shutdown()
+
 
 # --- App setup
-app = FastAPI(title="XBRL Validator API", version="1.0.0")
-_executor = ThreadPoolExecutor(max_workers=2)
+app = FastAPI(title="XBRL Validator API", version="1.0.0", lifespan=lifespan)
+# Arelle runs (CPU-bound) and cache priming/downloads (I/O-bound) use separate pools so
+# a long validation never queues unrelated I/O work behind it.
+_cpu_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 2, thread_name_prefix="arelle")
+_io_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="io")
 
 # Serve lightweight UI
 STATIC_DIR = Path(__file__).parent / "static"
@@ -55,7 +162,7 @@ async def about():
     try:
         meta_path = Path("artifacts/arelle.json")
         if meta_path.exists():
-            info["arelleMeta"] = json.loads(meta_path.read_text(encoding="utf-8"))
+            info["arelleMeta"] = _json_loads(meta_path.read_bytes())
     except Exception:
         pass
     # License status (non-sensitive)
@@ -68,8 +175,8 @@ async def about():
     return info
 
 
-# In-memory job store (use Redis/DB for production)
-jobs: Dict[str, Dict[str, Any]] = {}
+# Job store: Redis when REDIS_URL is set (shared across workers), in-memory otherwise
+job_store = create_job_store()
 
 
 # --- Models
@@ -97,6 +204,9 @@ class JobStatus(BaseModel):
     log_path: Optional[str] = None
 
 
+_JOB_STATUS_FIELDS = tuple(JobStatus.model_fields)
+
+
 # --- Simple CLI job endpoints (kept for compatibility)
 @app.post("/validate", response_model=JobStatus)
 async def submit_validation(request: ValidationRequest, background_tasks: BackgroundTasks):
@@ -111,33 +221,97 @@ async def submit_validation(request: ValidationRequest, background_tasks: Backgr
         "summary": None,
         "log_path": None,
     }
-    jobs[job_id] = job
+    await job_store.create(job_id, job)
     background_tasks.add_task(_run_cli_validation_job, job_id, request)
     return JobStatus(**job)
 
 
 @app.get("/jobs/{job_id}", response_model=JobStatus)
 async def get_job_status(job_id: str):
-    if job_id not in jobs:
+    job = await job_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    job = jobs[job_id]
-    return JobStatus(**{k: v for k, v in job.items() if k in JobStatus.__fields__})
+    return JobStatus(**{k: v for k, v in job.items() if k in JobStatus.model_fields})
 
 
 @app.get("/jobs", response_model=List[JobStatus])
-async def list_jobs():
-    return [JobStatus(**{k: v for k, v in job.items() if k in JobStatus.__fields__}) for job in jobs.values()]
+async def list_jobs(limit: int = Query(100, ge=1, le=1000), cursor: int = Query(0, ge=0)):
+    """List jobs in creation order, ``limit`` at a time; pass ``cursor`` = previous cursor + page length."""
+    rows = await job_store.list(offset=cursor, limit=limit, fields=_JOB_STATUS_FIELDS)
+    return [JobStatus(**row) for row in rows]
+
+
+# format=json returns the whole log inline; larger logs must be streamed
+_LOG_JSON_MAX_BYTES = 10 * 1024 * 1024
+_LOG_CHUNK = 64 * 1024
+
+
+def _parse_byte_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """Parse a single ``bytes=`` range into inclusive (start, end); None if unsatisfiable."""
+    m = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header or "")
+    if not m or (not m.group(1) and not m.group(2)) or size == 0:
+        return None
+    if not m.group(1):
+        # Suffix range: last N bytes
+        start, end = max(0, size - int(m.group(2))), size - 1
+    else:
+        start = int(m.group(1))
+        end = min(int(m.group(2)), size - 1) if m.group(2) else size - 1
+    if start >= size or start > end:
+        return None
+    return start, end
+
+
+async def _iter_file_range(path: Path, start: int, end: int) -> AsyncGenerator[bytes, None]:
+    remaining = end - start + 1
+    if AIOFILES_AVAILABLE:
+        async with aiofiles.open(path, "rb") as f:
+            await f.seek(start)
+            while remaining > 0:
+                chunk = await f.read(min(_LOG_CHUNK, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+    else:
+        with path.open("rb") as f:
+            f.seek(start)
+            while remaining > 0:
+                chunk = await asyncio.to_thread(f.read, min(_LOG_CHUNK, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
 
 
 @app.get("/jobs/{job_id}/log")
-async def get_job_log(job_id: str):
-    if job_id not in jobs:
+async def get_job_log(job_id: str, format: Optional[str] = None, range_header: Optional[str] = Header(None, alias="Range")):
+    """Stream the job's JSONL log (HTTP Range supported); ``?format=json`` returns it inline."""
+    job = await job_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    job = jobs[job_id]
     log_path = job.get("log_path")
     if not log_path or not Path(log_path).exists():
         raise HTTPException(status_code=404, detail="Log not found")
-    return {"log_path": log_path, "content": Path(log_path).read_text(encoding="utf-8")}
+    path = Path(log_path)
+    size = path.stat().st_size
+    if format == "json":
+        if size > _LOG_JSON_MAX_BYTES:
+            raise HTTPException(status_code=413, detail="Log too large for format=json; request it without format (Range supported)")
+        content = b"".join([chunk async for chunk in _iter_file_range(path, 0, size - 1)])
+        return {"log_path": log_path, "content": content.decode("utf-8")}
+    headers = {"Accept-Ranges": "bytes"}
+    status_code = 200
+    start, end = 0, size - 1
+    if range_header:
+        rng = _parse_byte_range(range_header, size)
+        if rng is None:
+            raise HTTPException(status_code=416, detail="Range not satisfiable", headers={"Content-Range": f"bytes */{size}"})
+        start, end = rng
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(_iter_file_range(path, start, end), status_code=status_code, media_type="application/x-ndjson", headers=headers)
 
 
 # --- Workflow (live) endpoints
@@ -153,12 +327,13 @@ class WorkflowRequest(BaseModel):
     calc_decimals: bool = False
     apply_filing_rules: bool = True
     filing_rules_excel: Optional[str] = None
+    reports: bool = False  # Excel/PDF reports in the Exports step (CSV/JSON are always written)
 
 
 @app.post("/workflow/run")
 async def workflow_run(request: WorkflowRequest):
     job_id = str(uuid.uuid4())
-    jobs[job_id] = {
+    await job_store.create(job_id, {
         "job_id": job_id,
         "status": "pending",
         "created_at": datetime.now().isoformat(),
@@ -166,14 +341,30 @@ async def workflow_run(request: WorkflowRequest):
         "return_code": None,
         "summary": None,
         "log_path": None,
-        "events_queue": asyncio.Queue(),
-        "cancel_event": asyncio.Event(),
         "exports_dir": str(Path("exports") / job_id),
-    }
-    asyncio.create_task(_run_workflow(job_id, request))
+    })
+    actor = _workflow_actor()
+    if actor is not None:
+        actor.send(job_id, request.dict())
+    else:
+        asyncio.create_task(_run_workflow(job_id, request))
     return {"job_id": job_id}
 
 
+def _workflow_actor():
+    """Return the Dramatiq actor when workflows are offloaded to workers (WORKFLOW_QUEUE=dramatiq).
+
+    Requires the Redis job store so workers and API processes share job state and events.
+    """
+    if os.environ.get("WORKFLOW_QUEUE", "").lower() != "dramatiq" or not isinstance(job_store, RedisJobStore):
+        return None
+    try:
+        from api.worker import run_workflow_job
+    except ImportError:
+        return None
+    return run_workflow_job
+
+
 class SummarizeRequest(BaseModel):
     texts: List[str]
     severity: Optional[str] = None
@@ -195,7 +386,6 @@ async def summarize(req: SummarizeRequest):
         "Language: " + (req.language or "en") + ".\n\nMessages:\n" + "\n".join(req.texts[:20])
     )
     try:
-        import requests  # already in requirements
         payload = {
             "model": "gpt-4o-mini",
             "messages": [
@@ -205,14 +395,13 @@ async def summarize(req: SummarizeRequest):
             "temperature": 0.2,
             "max_tokens": 180,
         }
-        resp = requests.post(
+        resp = await _get_http_client().post(
             "https://api.openai.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
             },
             json=payload,
-            timeout=20,
         )
         if resp.status_code != 200:
             raise RuntimeError(f"OpenAI API error: {resp.status_code} {resp.text[:200]}")
@@ -225,48 +414,47 @@ async def summarize(req: SummarizeRequest):
 
 @app.get("/workflow/{job_id}/events")
 async def workflow_events(job_id: str):
-    if job_id not in jobs:
+    if await job_store.get(job_id) is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    queue: asyncio.Queue = jobs[job_id]["events_queue"]
 
     async def event_stream() -> AsyncGenerator[bytes, None]:
-        # Initial heartbeat
-        yield b"event: ping\ndata: {}\n\n"
-        while True:
-            try:
-                item = await asyncio.wait_for(queue.get(), timeout=30.0)
-            except asyncio.TimeoutError:
-                yield b"event: ping\ndata: {}\n\n"
-                continue
-            if item is None:
-                break
-            payload = json.dumps(item, ensure_ascii=False)
-            yield f"data: {payload}\n\n".encode("utf-8")
+        sub = job_store.subscribe(job_id)
+        try:
+            # Initial heartbeat
+            yield b"event: ping\ndata: {}\n\n"
+            while True:
+                try:
+                    items = await sub.get_many(timeout=30.0)
+                except asyncio.TimeoutError:
+                    yield b"event: ping\ndata: {}\n\n"
+                    continue
+                # Everything already available goes out as one write
+                chunk = b"".join(b"data: " + _json_dumpb(item) + b"\n\n" for item in items if item is not None)
+                if chunk:
+                    yield chunk
+                if items[-1] is None:
+                    break
+        finally:
+            await sub.close()
 
     return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
 @app.post("/workflow/{job_id}/cancel")
 async def workflow_cancel(job_id: str):
-    if job_id not in jobs:
+    if await job_store.get(job_id) is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    jobs[job_id]["cancel_event"].set()
-    # Try to kill running process if present
-    proc: Optional[subprocess.Popen] = jobs[job_id].get("proc")
-    if proc and proc.poll() is None:
-        try:
-            proc.terminate()
-        except Exception:
-            pass
-    jobs[job_id]["status"] = "cancelled"
+    # The run polls the store for this flag (_watch_cancel) and stops its steps
+    await job_store.request_cancel(job_id)
+    await job_store.update(job_id, status="cancelled")
     return {"ok": True}
 
 
 @app.get("/workflow/{job_id}/summary")
 async def workflow_summary(job_id: str):
-    if job_id not in jobs:
+    job = await job_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    job = jobs[job_id]
     return {
         "job_id": job_id,
         "status": job.get("status"),
@@ -276,78 +464,144 @@ async def workflow_summary(job_id: str):
     }
 
 
+# Pre-compressed companions served by ExportFiles, in order of preference
+_PRECOMPRESSED = ((".br", "br"), (".gz", "gzip"))
+# Text exports worth compressing (xlsx/pdf are already compressed)
+_PRECOMPRESS_SUFFIXES = (".csv", ".json", ".jsonl", ".html", ".txt")
+
+
+def _accepted_encodings(header: str) -> set:
+    out = set()
+    for part in header.split(","):
+        name, _, params = part.partition(";")
+        q = params.strip().replace(" ", "")
+        if q.startswith("q=") and q[2:].strip("0.") == "":
+            continue  # q=0: explicitly refused
+        out.add(name.strip().lower())
+    return out
+
+
+@functools.lru_cache(maxsize=1024)
+def _content_etag(path: str, mtime_ns: int, size: int) -> str:
+    """Strong ETag from the file content; cached per (path, mtime, size)."""
+    h = hashlib.blake2b(digest_size=8)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return f'"{h.hexdigest()}"'
+
+
+class ExportFiles(StaticFiles):
+    """StaticFiles for exports with ``Cache-Control``, content ETags and pre-compressed variants.
+
+    ``x.csv`` is answered from ``x.csv.br``/``x.csv.gz`` (with ``Content-Encoding`` and the
+    original media type) when such a companion exists, is not older than ``x.csv`` and the
+    client accepts the encoding.
+    """
+
+    cache_control = "public, max-age=3600"
+
+    def _lookup_file(self, path: str):
+        try:
+            full_path, st = self.lookup_path(path)
+        except (OSError, ValueError):
+            return None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            return None
+        return full_path, st
+
+    def _resolve(self, path: str, accepted: set):
+        found = self._lookup_file(path)
+        if found is None:
+            return None
+        full_path, st = found
+        encoding = None
+        for suffix, enc in _PRECOMPRESSED:
+            if enc not in accepted:
+                continue
+            companion = self._lookup_file(path + suffix)
+            # A companion older than the file was compressed from a previous version of it
+            if companion is not None and companion[1].st_mtime_ns >= st.st_mtime_ns:
+                (full_path, st), encoding = companion, enc
+                break
+        return full_path, st, encoding, _content_etag(full_path, st.st_mtime_ns, st.st_size)
+
+    async def get_response(self, path: str, scope) -> Any:
+        if scope["method"] in ("GET", "HEAD"):
+            request_headers = Headers(scope=scope)
+            accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+            found = await anyio.to_thread.run_sync(self._resolve, path, accepted)
+            if found is not None:
+                full_path, st, encoding, etag = found
+                headers = {"Cache-Control": self.cache_control, "ETag": etag, "Vary": "Accept-Encoding"}
+                media_type = None
+                if encoding:
+                    headers["Content-Encoding"] = encoding
+                    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                response = FileResponse(full_path, stat_result=st, headers=headers, media_type=media_type)
+                if self.is_not_modified(response.headers, request_headers):
+                    return NotModifiedResponse(response.headers)
+                return response
+        # Directories, 404/405 and path errors: default behaviour
+        return await super().get_response(path, scope)
+
+
+def _precompress_exports(exports_dir: Path) -> None:
+    """Write ``.br`` (``.gz`` without brotli) companions of the text exports in ``exports_dir``."""
+    for p in exports_dir.iterdir():
+        if not p.is_file() or p.suffix.lower() not in _PRECOMPRESS_SUFFIXES:
+            continue
+        suffix = ".br" if BROTLI_AVAILABLE else ".gz"
+        out = p.with_name(p.name + suffix)
+        tmp = out.with_name(out.name + ".part")
+        with open(p, "rb") as src, open(tmp, "wb") as dst:
+            if BROTLI_AVAILABLE:
+                comp = brotli.Compressor(quality=5)
+                for chunk in iter(lambda: src.read(1 << 20), b""):
+                    dst.write(comp.process(chunk))
+                dst.write(comp.finish())
+            else:
+                with gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=6) as gz:
+                    shutil.copyfileobj(src, gz, 1 << 20)
+        os.replace(tmp, out)
+
+
 # Also expose exports directory for download
 EXPORTS_DIR = Path("exports")
 EXPORTS_DIR.mkdir(parents=True, exist_ok=True)
-app.mount("/exports", StaticFiles(directory=str(EXPORTS_DIR)), name="exports")
+app.mount("/exports", ExportFiles(directory=str(EXPORTS_DIR)), name="exports")
 
 
 # --- Helpers
+async def _forward_events(store, job_id: str, queue: asyncio.Queue) -> None:
+    """Publish events queued by ``_emit`` to the job store until the end-of-stream marker.
+
+    This is the job's only writer: events that queue up while a batch is being written are
+    published together on the next round, so a slow store never stalls the workflow itself.
+    """
+    while True:
+        batch = [await queue.get()]
+        while batch[-1] is not None and not queue.empty():
+            batch.append(queue.get_nowait())
+        await store.publish_many(job_id, batch)
+        if batch[-1] is None:
+            break
+
+
+async def _watch_cancel(store, job_id: str, cancel: asyncio.Event, interval: float = 0.5) -> None:
+    """Set ``cancel`` once a cancellation has been requested through the job store."""
+    while not cancel.is_set():
+        if await store.is_cancelled(job_id):
+            cancel.set()
+            break
+        await asyncio.sleep(interval)
+
+
 def _emit(queue: asyncio.Queue, step: str, status: str, message: str = "", extra: Optional[Dict[str, Any]] = None) -> None:
     evt = {"ts": datetime.now().isoformat(), "step": step, "status": status, "message": message}
     if extra:
         evt.update(extra)
-    queue.put_nowait(evt)
-
-
-def _detect_eba_from_instance(instance_path: str) -> tuple[Optional[str], Optional[str]]:
-    """Detect EBA version (3.4/3.5) and framework (corep/finrep/dora/fc/mrel/rem) from schemaRef hrefs.
-    Fallback: infer from filename tokens.
-    """
-    try:
-        from xml.etree import ElementTree as ET
-        ns = {"xlink": "http://www.w3.org/1999/xlink", "link": "http://www.xbrl.org/2003/linkbase"}
-        tree = ET.parse(instance_path)
-        hrefs: list[str] = []
-        for ref in tree.findall(".//link:schemaRef", ns):
-            href = ref.get("{" + ns["xlink"] + "}href") or ""
-            if href:
-                hrefs.append(href.lower())
-        blob = " ".join(hrefs)
-        fw: Optional[str] = None
-        if "/fws/dora/" in blob:
-            fw = "dora"
-        elif "/fws/corep/" in blob:
-            fw = "corep"
-        elif "/fws/finrep/" in blob:
-            fw = "finrep"
-        elif "/fws/fc/" in blob:
-            fw = "fc"
-        elif "/fws/mrel" in blob:
-            fw = "mrel"
-        elif "/fws/rem" in blob:
-            fw = "rem"
-        ver: Optional[str] = None
-        if "/3.5/" in blob or "2024-07-11" in blob or "/3.5" in blob:
-            ver = "3.5"
-        elif "/3.4/" in blob or "2019-04-30" in blob or "/3.4" in blob:
-            ver = "3.4"
-        # fallback on filename
-        if fw is None or ver is None:
-            name = Path(instance_path).name.lower()
-            if fw is None:
-                for token, f in (("dora", "dora"), ("corep", "corep"), ("finrep", "finrep"), ("mrel", "mrel"), ("fc", "fc"), ("rem", "rem")):
-                    if token in name:
-                        fw = f
-                        break
-            if ver is None:
-                if "3.5" in name or "2024-07-11" in name:
-                    ver = "3.5"
-                elif "3.4" in name or "2019-04-30" in name:
-                    ver = "3.4"
-        return ver, fw
-    except Exception:
-        try:
-            name = Path(instance_path).name.lower()
-            ver = "3.5" if ("3.5" in name or "2024-07-11" in name) else ("3.4" if ("3.4" in name or "2019-04-30" in name) else None)
-            fw = None
-            for token, f in (("dora", "dora"), ("corep", "corep"), ("finrep", "finrep"), ("mrel", "mrel"), ("fc", "fc"), ("rem", "rem")):
-                if token in name:
-                    fw = f
-                    break
-            return ver, fw
-        except Exception:
-            return None, None
+    put_event_nowait(queue, evt)
 
 
 def _build_arelle_args(instance: str, taxonomy_packages: Optional[List[str]], validate: bool, offline: bool, cache_dir: Optional[str], extra_args: Optional[List[str]]) -> List[str]:
@@ -371,6 +625,7 @@ def _prime_cache_from_packages(packages: List[str], cache_dir: str) -> None:
     """Copy relevant members from taxonomy zips into assets/cache/http/... to satisfy offline lookups.
     This avoids HTTP when Arelle tries to dereference eurofiling/eba URLs.
     """
+    import zipfile
     http_root = Path(cache_dir) / "http"
     http_root.mkdir(parents=True, exist_ok=True)
     # Candidate prefixes Arelle often requests
@@ -388,23 +643,19 @@ def _prime_cache_from_packages(packages: List[str], cache_dir: str) -> None:
         if not zpath.exists():
             continue
         try:
-            import zipfile
             with zipfile.ZipFile(str(zpath), "r") as zf:
+                # Only mirror members that contain known HTTP host roots, and strip any zip wrapper
+                candidates: List[tuple[str, str]] = []
                 for name in zf.namelist():
                     low = name.lower()
                     if not low.endswith((".xsd", ".xml")):
                         continue
-                    # Only mirror members that contain known HTTP host roots, and strip any zip wrapper
-                    idx = -1
-                    roots_l = tuple(r.lower() for r in wanted_roots)
-                    for root in roots_l:
-                        j = low.find(root)
-                        if j >= 0:
-                            idx = j
+                    for root in wanted_roots:
+                        idx = low.find(root)
+                        if idx >= 0:
+                            candidates.append((name, name[idx:]))
                             break
-                    if idx < 0:
-                        continue
-                    rel = name[idx:]
+                for name, rel in candidates:
                     target = http_root / rel
                     if target.exists():
                         continue
@@ -416,52 +667,269 @@ def _prime_cache_from_packages(packages: List[str], cache_dir: str) -> None:
                     except Exception:
                         # As a last resort, attempt to clear conflicting path
                         try:
-                            __import__('os').remove(str(parent))
+                            os.remove(str(parent))
                         except Exception:
                             pass
                         parent.mkdir(parents=True, exist_ok=True)
                     with zf.open(name, "r") as src, open(target, "wb") as dst:
-                        dst.write(src.read())
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
         except Exception:
             # Best effort; continue
             continue
 
 
-async def _tail_jsonl(path: Path, queue: asyncio.Queue, cancel: asyncio.Event, tag: str) -> None:
+_URL_RE = re.compile(r"https?://[^\s'\"]+")
+
+
+def _collect_missing_urls(log: "_JsonlReader") -> List[str]:
+    """Collect absolute URLs mentioned in a JSONL log (message text and docUri), in first-seen order.
+
+    Only lines appended since the reader's last call are parsed.
+    """
+    urls: Dict[str, None] = {}
     try:
-        # Tail file and emit log events
-        last_size = 0
-        while not cancel.is_set():
-            if not path.exists():
-                await asyncio.sleep(0.25)
+        log.read_new()
+        for rec in log.records:
+            msg = (rec.get('message') or rec.get('msg') or '').lower()
+            doc = rec.get('docUri') or rec.get('docURI') or ''
+            # Arelle often logs Forbidden retrieving/IOerror retrieving messages with absolute URLs
+            for u in _URL_RE.findall(msg):
+                urls.setdefault(u, None)
+            if doc.startswith(('http://', 'https://')):
+                urls.setdefault(doc, None)
+    except Exception:
+        pass
+    return list(urls)
+
+
+async def _download_to_cache(client: httpx.AsyncClient, sem: asyncio.Semaphore, u: str, cache_dir: str) -> bool:
+    """Fetch ``u`` into ``<cache_dir>/http/<host>/<path>``; False if skipped or failed."""
+    part: Optional[Path] = None
+    try:
+        from urllib.parse import urlparse
+        pr = urlparse(u)
+        rel = (pr.netloc + pr.path).lstrip('/')
+        if not rel:
+            return False
+        target = Path(cache_dir) / 'http' / rel
+        if target.exists():
+            # Already cached; downloading again would not change the retry outcome
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Stream to a side file in 1 MiB chunks and move it into place once complete
+        part = target.with_name(target.name + '.part')
+        async with sem:
+            async with client.stream('GET', u) as r:
+                if r.status_code != 200:
+                    return False
+                if AIOFILES_AVAILABLE:
+                    async with aiofiles.open(part, 'wb') as fp:
+                        async for chunk in r.aiter_bytes(1024 * 1024):
+                            await fp.write(chunk)
+                else:
+                    with open(part, 'wb') as fp:
+                        async for chunk in r.aiter_bytes(1024 * 1024):
+                            await asyncio.to_thread(fp.write, chunk)
+        os.replace(part, target)
+        return True
+    except Exception:
+        if part is not None:
+            try:
+                part.unlink(missing_ok=True)
+            except Exception:
+                pass
+        return False
+
+
+async def _download_all_to_cache(urls: List[str], cache_dir: str, concurrency: int = 16) -> int:
+    """Download ``urls`` concurrently (at most ``concurrency`` in flight); returns the number fetched."""
+    if not urls:
+        return 0
+    sem = asyncio.Semaphore(concurrency)
+    # Own client per batch (keep-alive across the batch's requests to the same EBA/XBRL hosts);
+    # this may run on a worker thread's event loop, not the API's
+    transport = httpx.AsyncHTTPTransport(retries=2)
+    async with httpx.AsyncClient(transport=transport, timeout=20.0, follow_redirects=True, limits=httpx.Limits(max_connections=concurrency)) as client:
+        results = await asyncio.gather(*(_download_to_cache(client, sem, u, cache_dir) for u in urls))
+    return sum(1 for ok in results if ok)
+
+
+class _JsonlReader:
+    """Incremental reader for a JSONL log that is still being appended to.
+
+    Keeps one file handle and the byte offset reached; each ``read_new`` parses only complete
+    lines appended since the previous call and accumulates them in ``records``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.records: List[Dict[str, Any]] = []
+        self._fh = None
+        self._pending = b""
+
+    def read_new(self) -> List[Dict[str, Any]]:
+        if self._fh is None:
+            if not self.path.exists():
+                return []
+            self._fh = self.path.open("rb")
+        chunk = self._fh.read()
+        if not chunk:
+            return []
+        lines = (self._pending + chunk).split(b"\n")
+        self._pending = lines.pop()
+        new: List[Dict[str, Any]] = []
+        for line in lines:
+            # Parse the raw bytes slice (trailing whitespace is fine for the parser); only
+            # indented lines pay for a stripped copy
+            if not line.startswith(b"{"):
+                line = line.lstrip()
+                if not line.startswith(b"{"):
+                    continue
+            try:
+                rec = _json_loads(line)
+            except Exception:
                 continue
-            size = path.stat().st_size
-            if size > last_size:
-                with path.open("r", encoding="utf-8") as f:
-                    f.seek(last_size)
-                    chunk = f.read()
-                last_size = size
-                for line in chunk.splitlines():
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        rec = json.loads(line)
-                    except Exception:
-                        continue
-                    queue.put_nowait({"event": "log", "phase": tag, "entry": rec})
-            await asyncio.sleep(0.25)
+            new.append(rec)
+        self.records.extend(new)
+        return new
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+async def _run_on_arelle_worker(fn, *args: Any, **kwargs: Any) -> Any:
+    """Run a module-level function on the shared warm Arelle worker-process pool.
+
+    Falls back to the CPU thread pool when the pool is disabled (``XBRL_ARELLE_WORKERS=0``)
+    or cannot start workers. If a worker dies mid-run the pool is recycled and
+    ``BrokenProcessPool`` propagates: the run may already have appended to its JSONL log, so
+    it is not retried.
+    """
+    from src.validation.arelle_runner import get_worker_pool
+    pool = get_worker_pool()
+    if pool is not None:
+        try:
+            fut = pool.submit_call(fn, *args, **kwargs)
+        except Exception:
+            fut = None
+        if fut is not None:
+            try:
+                return await asyncio.wrap_future(fut)
+            except BrokenProcessPool:
+                pool.reset()
+                raise
+    return await asyncio.get_running_loop().run_in_executor(_cpu_pool, functools.partial(fn, *args, **kwargs))
+
+
+async def _run_arelle(**kwargs: Any) -> Dict[str, Any]:
+    """In-process ``run_validation`` on the Arelle worker pool."""
+    from src.validation.arelle_runner import run_validation
+    return await _run_on_arelle_worker(run_validation, use_subprocess=False, **kwargs)
+
+
+async def _stop_task(task: asyncio.Task) -> None:
+    """Cancel ``task`` and wait until it has actually finished."""
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+def _start_tail(stack: AsyncExitStack, log: "_JsonlReader", queue: asyncio.Queue, cancel: asyncio.Event, tag: str) -> asyncio.Task:
+    """Start tailing ``log``; the task is stopped (and awaited) when ``stack`` unwinds."""
+    task = asyncio.create_task(_tail_jsonl(log, queue, cancel, tag=tag))
+    stack.push_async_callback(_stop_task, task)
+    return task
+
+
+# Max log records per "logs" SSE event. Records read in one wake-up are sent together; the
+# watcher's 250ms debounce already coalesces bursts of writes into a single wake-up.
+_LOG_BATCH = 50
+
+
+async def _tail_jsonl(log: _JsonlReader, queue: asyncio.Queue, cancel: asyncio.Event, tag: str) -> None:
+    """Tail a JSONL log and emit each complete record as a log event.
+
+    Wakes on filesystem notifications via watchfiles when installed, otherwise polls every 250ms.
+    When the task is cancelled (the run finished), records written since the last wake-up are
+    flushed without blocking before it exits.
+    """
+    path = log.path
+    unsent: List[Dict[str, Any]] = []
+
+    async def _drain() -> None:
+        # Batched, and awaited so a burst of log lines waits for the forwarder instead of piling up
+        unsent.extend(log.read_new())
+        while unsent:
+            batch = unsent[:_LOG_BATCH]
+            await queue.put({"event": "logs", "phase": tag, "entries": batch})
+            del unsent[:len(batch)]
+
+    # awatch sets its stop_event when it is cancelled, so it gets its own event relayed from
+    # the job's cancel event rather than the cancel event itself
+    stop = asyncio.Event()
+    relay = asyncio.create_task(cancel.wait())
+    relay.add_done_callback(lambda _t: stop.set())
+    try:
+        await _drain()
+        if WATCHFILES_AVAILABLE:
+            async for _changes in awatch(
+                path.parent,
+                watch_filter=lambda _change, changed: os.path.basename(changed) == path.name,
+                stop_event=stop,
+                debounce=250,
+                recursive=False,
+            ):
+                await _drain()
+        else:
+            while not cancel.is_set():
+                await asyncio.sleep(0.25)
+                await _drain()
+    except asyncio.CancelledError:
+        try:
+            unsent.extend(log.read_new())
+            for i in range(0, len(unsent), _LOG_BATCH):
+                put_event_nowait(queue, {"event": "logs", "phase": tag, "entries": unsent[i:i + _LOG_BATCH]})
+        except Exception:
+            pass
+        raise
     except Exception:
         # Non-fatal
         pass
+    finally:
+        relay.cancel()
+
 
+async def _run_workflow(job_id: str, req: WorkflowRequest, store=None) -> None:
+    """Run the full workflow for a job, publishing step events through ``store``.
+
+    ``store`` defaults to the API process store; workers pass their own (see ``api.worker``).
+    """
+    store = store or job_store
+    job = await store.get(job_id) or {"exports_dir": str(Path("exports") / job_id)}
+    queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+    cancel = asyncio.Event()
+    forwarder = asyncio.create_task(_forward_events(store, job_id, queue))
+    watcher = asyncio.create_task(_watch_cancel(store, job_id, cancel))
+    try:
+        await _run_workflow_steps(job_id, req, job, queue, cancel, store)
+    finally:
+        await _stop_task(watcher)
+        await store.update(job_id, **{k: job.get(k) for k in ("status", "summary", "log_path", "return_code")})
+        # Close stream
+        put_event_nowait(queue, None)
+        await forwarder
 
-async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
-    job = jobs[job_id]
-    queue: asyncio.Queue = job["events_queue"]
-    cancel: asyncio.Event = job["cancel_event"]
+
+async def _run_workflow_steps(job_id: str, req: WorkflowRequest, job: Dict[str, Any], queue: asyncio.Queue, cancel: asyncio.Event, store) -> None:
+    # Paths used across the steps, built (and the cache dir resolved) once
     exports_dir = Path(job["exports_dir"])
     exports_dir.mkdir(parents=True, exist_ok=True)
+    log_dts = exports_dir / "taxonomy_load.jsonl"
+    log_val = exports_dir / "validation.jsonl"
+    log_val_str = str(log_val)
+    cache_dir = str(Path("assets/cache").resolve())
 
     steps = [
         "Cache priming", "Inputs", "Taxonomy load (DTS)", "Parse data", "Core checks", "Formula checks", "Filing rules", "DPM mapping", "Results", "Exports",
@@ -470,18 +938,21 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
         _emit(queue, s, "not_started")
 
     job["status"] = "running"
-    
+    await store.update(job_id, status="running")
+
     # Step 0: Cache priming (ensure EBA formulas work)
     _emit(queue, "Cache priming", "running")
     try:
-        import subprocess
-        import sys
-        cache_cmd = [sys.executable, "-m", "scripts.cache_prime"]
-        cache_result = subprocess.run(cache_cmd, capture_output=True, text=True, check=False, timeout=60)
-        if cache_result.returncode != 0:
-            _emit(queue, "Cache priming", "warning", f"Cache priming had issues: {cache_result.stderr[:100]}")
+        from scripts.cache_prime import main as cache_prime_main
+        # In-process instead of a `python -m scripts.cache_prime` subprocess; the workflow stops
+        # waiting after 60s (as the subprocess timeout did) while the copy finishes in the background.
+        rc = await asyncio.wait_for(asyncio.get_running_loop().run_in_executor(_io_pool, cache_prime_main), timeout=60)
+        if rc != 0:
+            _emit(queue, "Cache priming", "warning", f"Cache priming had issues (exit code {rc})")
         else:
             _emit(queue, "Cache priming", "succeeded")
+    except asyncio.TimeoutError:
+        _emit(queue, "Cache priming", "warning", "Cache priming timed out; continuing")
     except Exception as e:
         _emit(queue, "Cache priming", "warning", f"Cache priming failed: {str(e)[:100]}")
     
@@ -515,24 +986,17 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
     await asyncio.sleep(0.2)
     _emit(queue, "Inputs", "succeeded")
 
-    # Prepare JSONL logs
-    log_dts = exports_dir / "taxonomy_load.jsonl"
-    log_val = exports_dir / "validation.jsonl"
-
     # Build taxonomy list from explicit packages or config stack if provided
     taxonomy_paths: List[str] = list(req.taxonomy_packages or [])
     # Auto-detect version/framework if not provided
+    from app.validate import _detect_eba_from_instance
     detected_ver, detected_fw = _detect_eba_from_instance(req.instance_file)
     if detected_ver or detected_fw:
         _emit(queue, "Inputs", "info", message="Auto-detected framework/version", extra={"version": detected_ver, "framework": detected_fw})
     use_ver = str(req.eba_version) if req.eba_version else (detected_ver or None)
     if not taxonomy_paths and use_ver:
-        try:
-            cfg = json.loads(Path("config/taxonomy.json").read_text(encoding="utf-8"))
-            key = "eba_3_4" if str(use_ver) == "3.4" else "eba_3_5"
-            taxonomy_paths = [str(p) for p in (cfg.get("stacks", {}).get(key, []) or [])]
-        except Exception:
-            taxonomy_paths = []
+        from app.validate import _load_taxonomy_stack
+        taxonomy_paths = _load_taxonomy_stack(use_ver)
 
     # Step 2: Taxonomy load (no --validate)
     _emit(queue, "Taxonomy load (DTS)", "running")
@@ -540,85 +1004,37 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
         # Prime offline cache from taxonomy packages so http URLs map to local files
         if req.offline:
             try:
-                _prime_cache_from_packages(taxonomy_paths, cache_dir=str(Path("assets/cache").resolve()))
+                _prime_cache_from_packages(taxonomy_paths, cache_dir=cache_dir)
             except Exception:
                 pass
-        # Use in-process runner to guarantee JSONL writes via handler
-        from src.validation.arelle_runner import run_validation as run_val
-        tail_task = asyncio.create_task(_tail_jsonl(log_dts, queue, cancel, tag="dts"))
-        loop = asyncio.get_running_loop()
-        def _run_dts():
-            return run_val(
-                input_path=req.instance_file,
-                taxonomy_paths=taxonomy_paths,
-                plugins=["formula"],
-                log_jsonl_path=str(log_dts),
-                validate=False,
-                offline=req.offline,
-                cache_dir=str(Path("assets/cache").resolve()),
-                extra_args=[],
-                use_subprocess=False,
-            )
-        summary_dts = await loop.run_in_executor(_executor, _run_dts)
-        # If online and errors indicate missing HTTP resources, try to fetch and retry once
-        def _collect_missing_urls(log_path: Path) -> List[str]:
-            urls: List[str] = []
-            try:
-                if log_path.exists():
-                    with log_path.open('r', encoding='utf-8') as f:
-                        for line in f:
-                            try:
-                                rec = json.loads(line)
-                            except Exception:
-                                continue
-                            msg = (rec.get('message') or rec.get('msg') or '').lower()
-                            doc = rec.get('docUri') or rec.get('docURI') or ''
-                            # Arelle often logs Forbidden retrieving/IOerror retrieving messages with absolute URLs
-                            m = re.findall(r"https?://[^\s'\"]+", msg)
-                            if m:
-                                for u in m:
-                                    if u not in urls:
-                                        urls.append(u)
-                            if (doc.startswith('http://') or doc.startswith('https://')) and doc not in urls:
-                                urls.append(doc)
-            except Exception:
-                pass
-            return urls
-        def _download_to_cache(u: str, cache_dir: str) -> bool:
-            try:
-                import requests
-                r = requests.get(u, timeout=20)
-                if r.status_code != 200:
-                    return False
-                # Map to assets/cache/http/<host>/<path>
-                from urllib.parse import urlparse
-                pr = urlparse(u)
-                rel = (pr.netloc + pr.path).lstrip('/')
-                if not rel:
-                    return False
-                target = Path(cache_dir) / 'http' / rel
-                target.parent.mkdir(parents=True, exist_ok=True)
-                with open(target, 'wb') as fp:
-                    fp.write(r.content)
-                return True
-            except Exception:
-                return False
-        if not req.offline and int(summary_dts.get('returnCode', 0)) != 0:
-            urls = _collect_missing_urls(log_dts)
-            fetched = 0
-            for u in urls:
-                if any(u.lower().endswith(ext) for ext in ('.xsd', '.xml')):
-                    if _download_to_cache(u, str(Path('assets/cache').resolve())):
-                        fetched += 1
-            if fetched:
-                # Retry once
-                tail_task = asyncio.create_task(_tail_jsonl(log_dts, queue, cancel, tag='dts'))
-                summary_dts = await loop.run_in_executor(_executor, _run_dts)
-                tail_task.cancel()
-        tail_task.cancel()
+        # Use in-process runner (in a warm worker process) to guarantee JSONL writes via handler
+        dts_args = dict(
+            input_path=req.instance_file,
+            taxonomy_paths=taxonomy_paths,
+            plugins=["formula"],
+            log_jsonl_path=str(log_dts),
+            validate=False,
+            offline=req.offline,
+            cache_dir=cache_dir,
+            extra_args=[],
+        )
+        async with AsyncExitStack() as stack:
+            dts_log = _JsonlReader(log_dts)
+            stack.callback(dts_log.close)
+            tail_task = _start_tail(stack, dts_log, queue, cancel, tag="dts")
+            summary_dts = await _run_arelle(**dts_args)
+            # If online and errors indicate missing HTTP resources, try to fetch and retry once
+            if not req.offline and int(summary_dts.get('returnCode', 0)) != 0:
+                urls = [u for u in _collect_missing_urls(dts_log) if u.lower().endswith(('.xsd', '.xml'))]
+                fetched = await _download_all_to_cache(urls, cache_dir)
+                if fetched:
+                    # Retry once; the first tail must be gone before a second one reads the same log
+                    await _stop_task(tail_task)
+                    tail_task = _start_tail(stack, dts_log, queue, cancel, tag="dts")
+                    summary_dts = await _run_arelle(**dts_args)
         if cancel.is_set():
             _emit(queue, "Taxonomy load (DTS)", "failed", "Cancelled")
-            jobs[job_id]["status"] = "cancelled"
+            job["status"] = "cancelled"
             return
         if int(summary_dts.get("returnCode", 0)) != 0:
             _emit(queue, "Taxonomy load (DTS)", "failed", f"Arelle exited with code {summary_dts.get('returnCode')}")
@@ -634,33 +1050,31 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
     for s in ("Parse data", "Core checks", "Formula checks"):
         _emit(queue, s, "running")
     try:
-        from src.validation.arelle_runner import run_validation as run_val
-        tail_task2 = asyncio.create_task(_tail_jsonl(log_val, queue, cancel, tag="validate"))
-        loop = asyncio.get_running_loop()
-        def _run_val():
-            return run_val(
-                input_path=req.instance_file,
-                taxonomy_paths=taxonomy_paths,
-                plugins=["formula"],
-                log_jsonl_path=str(log_val),
-                validate=True,
-                offline=req.offline,
-                cache_dir=str(Path("assets/cache").resolve()),
-                extra_args=( ["--calcDecimals"] if req.calc_decimals else [] ),
-                use_subprocess=False,
-            )
-        summary_val = await loop.run_in_executor(_executor, _run_val)
-        tail_task2.cancel()
+        val_args = dict(
+            input_path=req.instance_file,
+            taxonomy_paths=taxonomy_paths,
+            plugins=["formula"],
+            log_jsonl_path=log_val_str,
+            validate=True,
+            offline=req.offline,
+            cache_dir=cache_dir,
+            extra_args=( ["--calcDecimals"] if req.calc_decimals else [] ),
+        )
+        async with AsyncExitStack() as stack:
+            val_log = _JsonlReader(log_val)
+            stack.callback(val_log.close)
+            _start_tail(stack, val_log, queue, cancel, tag="validate")
+            summary_val = await _run_arelle(**val_args)
         if cancel.is_set():
             for s in ("Parse data", "Core checks", "Formula checks"):
                 _emit(queue, s, "failed", "Cancelled")
-            jobs[job_id]["status"] = "cancelled"
+            job["status"] = "cancelled"
             return
         if int(summary_val.get("returnCode", 0)) != 0:
             for s in ("Parse data", "Core checks", "Formula checks"):
                 _emit(queue, s, "failed", f"Arelle exited with code {summary_val.get('returnCode')}")
             job["status"] = "failed"
-            job["log_path"] = str(log_val)
+            job["log_path"] = log_val_str
             return
         for s in ("Parse data", "Core checks", "Formula checks"):
             _emit(queue, s, "succeeded")
@@ -681,12 +1095,15 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
         except Exception:
             modelXbrl = None  # type: ignore
         if modelXbrl is not None:
+            facts = getattr(modelXbrl, "factsInInstance", None) or getattr(modelXbrl, "facts", None) or []
+            contexts = getattr(modelXbrl, "contexts", None) or {}
+            units = getattr(modelXbrl, "units", None) or {}
             # Counters
-            facts_cnt = len(getattr(modelXbrl, "factsInInstance", []) or getattr(modelXbrl, "facts", []))
-            contexts_cnt = len(getattr(modelXbrl, "contexts", {}))
-            units_cnt = len(getattr(modelXbrl, "units", {}))
+            facts_cnt = len(facts)
+            contexts_cnt = len(contexts)
+            units_cnt = len(units)
             job["_counters"] = {"facts": facts_cnt, "contexts": contexts_cnt, "units": units_cnt}
-            queue.put_nowait({"event": "counters", "facts": facts_cnt, "contexts": contexts_cnt, "units": units_cnt})
+            put_event_nowait(queue, {"event": "counters", "facts": facts_cnt, "contexts": contexts_cnt, "units": units_cnt})
             # Basic checks
             if contexts_cnt < 1:
                 filing_messages.append({"level": "ERROR", "message": "No contexts present (must have at least one entity and period)."})
@@ -696,8 +1113,8 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
             try:
                 seen = set()
                 dups = 0
-                for cid, ctx in getattr(modelXbrl, "contexts", {}).items():
-                    dims = tuple(sorted([(str(dimQ), str(memQ)) for dimQ, memQ in getattr(ctx, "qnameDims", {}).items()]))
+                for ctx in contexts.values():
+                    dims = frozenset((str(dimQ), str(memQ)) for dimQ, memQ in getattr(ctx, "qnameDims", {}).items())
                     key = (getattr(ctx, "entityIdentifier", None), getattr(ctx, "period", None), dims)
                     if key in seen:
                         dups += 1
@@ -709,14 +1126,17 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
                 pass
             # Facts pointing to missing contexts/units
             try:
-                ctxt_ids = set(getattr(modelXbrl, "contexts", {}).keys())
-                unit_ids = set(getattr(modelXbrl, "units", {}).keys())
+                # Bound membership tests: this loop runs once per fact
+                has_ctx = set(contexts.keys()).__contains__
+                has_unit = set(units.keys()).__contains__
                 missing_ctx = 0
                 missing_unit = 0
-                for f in getattr(modelXbrl, "factsInInstance", []) or getattr(modelXbrl, "facts", []):
-                    if getattr(f, "contextID", None) and f.contextID not in ctxt_ids:
+                for f in facts:
+                    cid = getattr(f, "contextID", None)
+                    if cid and not has_ctx(cid):
                         missing_ctx += 1
-                    if getattr(f, "unitID", None) and f.unitID not in unit_ids:
+                    uid = getattr(f, "unitID", None)
+                    if uid and not has_unit(uid):
                         missing_unit += 1
                 if missing_ctx:
                     filing_messages.append({"level": "ERROR", "message": f"{missing_ctx} facts reference missing contexts."})
@@ -730,7 +1150,7 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
                     # Heuristic: if most facts are duration but period types are instant (or vice versa)
                     inst = 0
                     dur = 0
-                    for ctx in getattr(modelXbrl, "contexts", {}).values():
+                    for ctx in contexts.values():
                         if getattr(ctx, "isInstantPeriod", False):
                             inst += 1
                         else:
@@ -740,11 +1160,20 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
             except Exception:
                 pass
         # Emit filing messages
-        for m in filing_messages:
-            queue.put_nowait({"event": "log", "phase": "filing_rules", "entry": m})
+        for i in range(0, len(filing_messages), _LOG_BATCH):
+            put_event_nowait(queue, {"event": "logs", "phase": "filing_rules", "entries": filing_messages[i:i + _LOG_BATCH]})
         # Status color based on messages
-        has_err = any((m.get("level") or "").upper() in ("ERROR", "FATAL") for m in filing_messages)
-        has_warn = any((m.get("level") or "").upper() == "WARNING" for m in filing_messages)
+        has_err = has_warn = False
+        for m in filing_messages:
+            lv = normalize_level(m.get("level"))
+            if lv in ("ERROR", "FATAL"):
+                has_err = True
+                if has_warn:
+                    break
+            elif lv == "WARNING":
+                has_warn = True
+                if has_err:
+                    break
         if has_err or (req.fail_on_warnings and has_warn):
             _emit(queue, "Filing rules", "failed", "Issues found")
         elif has_warn:
@@ -757,7 +1186,7 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
     # Step 7-9: DPM mapping, Results, Exports
     from src.pipeline import ingest_jsonl, write_validation_messages_csv, write_results_by_file_json, write_formula_rollup_csv
     from src.reporting.reports import generate_reports
-    messages, rollup, by_file = ingest_jsonl(str(log_val), dpm_sqlite=req.dpm_sqlite, dpm_schema=req.dpm_schema, model_xbrl_path=req.instance_file)
+    messages, rollup, by_file = ingest_jsonl(log_val_str, dpm_sqlite=req.dpm_sqlite, dpm_schema=req.dpm_schema, model_xbrl_path=req.instance_file)
     # Apply EBA Filing Rules and merge results (if enabled and Excel available)
     try:
         from xbrl_validator.config import get_eba_rules_excel_path
@@ -775,46 +1204,31 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
             extra_msgs, coverage = (extra if isinstance(extra, tuple) else (extra, None))
             if extra_msgs:
                 messages.extend(extra_msgs)
+                # Fold the added messages into the ingest rollup rather than recounting them all
+                sev2 = Counter(rollup.get("bySeverity") or {})
+                sev2.update(normalize_level(m.get("level")) for m in extra_msgs)
+                rollup["bySeverity"] = dict(sev2)
+                rollup["total"] = sum(sev2.values())
             # Write coverage CSV if available
             try:
                 if coverage is not None:
-                    write_rules_coverage_csv(coverage, str(Path(job["exports_dir"]) / "rules_coverage.csv"))
+                    write_rules_coverage_csv(coverage, exports_dir / "rules_coverage.csv")
             except Exception:
                 pass
-            # Recompute severity rollup minimally
-            sev2: Dict[str, int] = {}
-            for m in messages:
-                lv = (m.get("level") or "INFO").upper()
-                sev2[lv] = sev2.get(lv, 0) + 1
-            rollup["bySeverity"] = sev2
-            rollup["total"] = len(messages)
     except Exception:
         # Never fail workflow due to filing rules post-processing
         pass
     # Determine overall severity
-    sev = {k.upper(): v for k, v in (rollup.get("bySeverity") or {}).items()}
+    # Keys are already upper-case: ingest and the filing-rules fold both canonicalize levels
+    sev = rollup.get("bySeverity") or {}
     errors = sev.get("ERROR", 0) + sev.get("FATAL", 0)
     warnings = sev.get("WARNING", 0)
 
     _emit(queue, "DPM mapping", "running")
-    # Mapping is attached in ingest step per message; emit small sample for panel
-    try:
-        sample_map = []
-        for m in messages:
-            mc = m.get("mappedCell")
-            if mc:
-                sample_map.append({
-                    "concept": (mc.get("concept") or m.get("modelObjectQname") or ""),
-                    "template": mc.get("template_id"),
-                    "table": mc.get("table_id"),
-                    "cell": mc.get("cell_id"),
-                })
-                if len(sample_map) >= 8:
-                    break
-        if sample_map:
-            queue.put_nowait({"event": "mapping", "rows": sample_map})
-    except Exception:
-        pass
+    # Mapping is attached in ingest step per message, which also collects a small sample for the panel
+    sample_map = rollup.get("mappedSample") or []
+    if sample_map:
+        put_event_nowait(queue, {"event": "mapping", "rows": sample_map})
     _emit(queue, "DPM mapping", "succeeded")
 
     _emit(queue, "Results", "running")
@@ -838,18 +1252,31 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
 
     _emit(queue, "Exports", "running")
     try:
-        # Write exports
-        write_validation_messages_csv(messages, str(exports_dir / "validation_messages.csv"))
-        write_results_by_file_json(by_file, str(exports_dir / "results_by_file.json"))
-        write_formula_rollup_csv(messages, str(exports_dir / "formula_rollup.csv"))
-        _ = generate_reports(messages=messages, exports_dir=str(exports_dir))
+        # Write exports: the writers are independent (reports only read rules_coverage.csv from
+        # the filing-rules step), so they run side by side off the event loop
+        loop = asyncio.get_running_loop()
+        writers = [
+            loop.run_in_executor(_io_pool, write_validation_messages_csv, messages, exports_dir / "validation_messages.csv"),
+            loop.run_in_executor(_io_pool, write_results_by_file_json, by_file, exports_dir / "results_by_file.json"),
+            loop.run_in_executor(_io_pool, write_formula_rollup_csv, messages, exports_dir / "formula_rollup.csv"),
+        ]
+        if req.reports:
+            writers.append(loop.run_in_executor(_io_pool, functools.partial(generate_reports, messages=messages, exports_dir=str(exports_dir))))
+        else:
+            put_event_nowait(queue, {"event": "reports", "status": "skipped"})
+        await asyncio.gather(*writers)
+        # Best effort: .br/.gz companions let /exports skip on-the-fly compression
+        try:
+            await loop.run_in_executor(_io_pool, _precompress_exports, exports_dir)
+        except Exception:
+            pass
         _emit(queue, "Exports", "succeeded")
         # Provide exports dir to client
-        queue.put_nowait({"event": "exports", "dir": str(exports_dir)})
+        put_event_nowait(queue, {"event": "exports", "dir": str(exports_dir)})
     except Exception as e:
         _emit(queue, "Exports", "failed", str(e))
 
-    job["log_path"] = str(log_val)
+    job["log_path"] = log_val_str
     # Finish
     if req.fail_on_warnings and warnings > 0:
         job["status"] = "completed"
@@ -858,53 +1285,58 @@ async def _run_workflow(job_id: str, req: WorkflowRequest) -> None:
         job["status"] = "completed"
         job["return_code"] = 0 if errors == 0 else 1
 
-    # Close stream
-    queue.put_nowait(None)
+
+async def _run_validate_cli(argv: List[str], timeout: float) -> int:
+    """Run ``app.validate`` with ``argv`` as its own subprocess, killing it once ``timeout`` elapses.
+
+    Not on the shared Arelle worker pool: killing a hung worker there would take down the
+    other jobs' workers with it. Raises ``asyncio.TimeoutError`` on timeout.
+    """
+    cmd = [sys.executable, "-m", "app.validate", *argv]
+    run = functools.partial(
+        subprocess.run, cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout
+    )
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(_io_pool, run)
+    except subprocess.TimeoutExpired:
+        raise asyncio.TimeoutError()
+    return result.returncode
 
 
 async def _run_cli_validation_job(job_id: str, request: ValidationRequest):
-    job = jobs[job_id]
-    job["status"] = "running"
-    # Create temp log file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        log_path = f.name
-    job["log_path"] = log_path
-    cmd = [
-        sys.executable, "-m", "app.validate",
+    # Log lives with the job's exports (kept for post-hoc debugging), like workflow runs
+    exports_dir = Path("exports") / job_id
+    exports_dir.mkdir(parents=True, exist_ok=True)
+    log_path = str(exports_dir / "validation.jsonl")
+    await job_store.update(job_id, status="running", log_path=log_path)
+    job: Dict[str, Any] = {}
+    # app.validate's CLI arguments; it runs as a subprocess (see _run_validate_cli)
+    argv = [
         "--file", request.file_path,
         "--out", log_path,
         "--plugins", request.plugins,
-        "--exports", f"exports/{job_id}",
+        "--exports", str(exports_dir),
     ]
     if request.eba_version:
-        cmd.extend(["--ebaVersion", request.eba_version])
+        argv.extend(["--ebaVersion", request.eba_version])
     if request.offline:
-        cmd.append("--offline")
+        argv.append("--offline")
     if request.severity_exit:
-        cmd.extend(["--severity-exit", request.severity_exit])
+        argv.extend(["--severity-exit", request.severity_exit])
     if request.calc_decimals:
-        cmd.append("--calcDecimals")
+        argv.append("--calcDecimals")
     if request.calc_precision:
-        cmd.append("--calcPrecision")
+        argv.append("--calcPrecision")
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)
-        summary = {"total": 0, "byLevel": {}, "returnCode": result.returncode}
-        if Path(log_path).exists():
-            with open(log_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            rec = json.loads(line.strip())
-                            summary["total"] += 1
-                            level = (rec.get("level") or "INFO").upper()
-                            summary["byLevel"][level] = summary["byLevel"].get(level, 0) + 1
-                        except Exception:
-                            pass
+        return_code = await _run_validate_cli(argv, timeout=1800)
+        from src.pipeline import iter_jsonl
+        by_level = Counter(normalize_level(rec.get("level")) for rec in iter_jsonl(log_path))
+        summary = {"total": sum(by_level.values()), "byLevel": dict(by_level), "returnCode": return_code}
         job["status"] = "completed"
-        job["return_code"] = result.returncode
+        job["return_code"] = return_code
         job["summary"] = summary
         job["completed_at"] = datetime.now().isoformat()
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         job["status"] = "failed"
         job["return_code"] = 124
         job["summary"] = {"error": "timeout"}
@@ -914,6 +1346,7 @@ async def _run_cli_validation_job(job_id: str, request: ValidationRequest):
         job["return_code"] = 1
         job["summary"] = {"error": str(e)}
         job["completed_at"] = datetime.now().isoformat()
+    await job_store.update(job_id, **job)
 
 
 if __name__ == "__main__":
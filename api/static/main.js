@@ -147,6 +147,13 @@ function appendLog(entry){
   updateLogView();
 }
 
+function appendLogs(batch){
+  for(const entry of (batch.entries || [])){
+    state.events.push({event: 'log', phase: batch.phase, entry});
+  }
+  updateLogView();
+}
+
 async function startRun(){
   document.getElementById('startBtn').disabled = true;
   document.getElementById('cancelBtn').disabled = false;
@@ -182,6 +189,7 @@ async function startRun(){
         }
       }
       if(ev.event === 'log'){ appendLog(ev); }
+      if(ev.event === 'logs'){ appendLogs(ev); }
       if(ev.event === 'mapping'){ state.mappingSample = ev.rows || []; }
       if(ev.event === 'counters'){
         document.getElementById('panelCounters').innerHTML = `<div class="kv"><span>Facts</span><strong>${ev.facts||0}</strong></div><div class="kv"><span>Contexts</span><strong>${ev.contexts||0}</strong></div><div class="kv"><span>Units</span><strong>${ev.units||0}</strong></div>`;
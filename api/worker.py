@@ -0,0 +1,42 @@
+"""Dramatiq worker that runs API workflows outside the ASGI process.
+
+Enable with ``WORKFLOW_QUEUE=dramatiq`` and ``REDIS_URL`` on the API, then start workers:
+
+    REDIS_URL=redis://localhost:6379/0 dramatiq api.worker
+
+Job state and step events are written to the Redis job store, where the API's
+SSE endpoint picks them up. Cancellation requested through the API is seen by
+the running workflow via the store.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from typing import Any, Dict
+
+import dramatiq
+from dramatiq.brokers.redis import RedisBroker
+
+from api.job_store import create_job_store
+from api.server import WorkflowRequest, _run_workflow
+
+dramatiq.set_broker(RedisBroker(url=os.environ.get("REDIS_URL", "redis://localhost:6379/0")))
+
+# Dramatiq runs actors on several threads; each keeps its own event loop and
+# Redis client, since asyncio clients cannot be shared across loops.
+_local = threading.local()
+
+
+def _thread_runtime():
+    if getattr(_local, "loop", None) is None:
+        _local.loop = asyncio.new_event_loop()
+        _local.store = create_job_store()
+    return _local.loop, _local.store
+
+
+@dramatiq.actor(time_limit=3_600_000, max_retries=0)
+def run_workflow_job(job_id: str, req_dict: Dict[str, Any]) -> None:
+    loop, store = _thread_runtime()
+    loop.run_until_complete(_run_workflow(job_id, WorkflowRequest(**req_dict), store=store))
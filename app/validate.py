@@ -1,10 +1,20 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
 import json
+import os
 import sys
+import threading
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
@@ -12,18 +22,127 @@ from src.validation.arelle_runner import run_validation
 from src.pipeline import ingest_jsonl, write_validation_messages_csv, write_results_by_file_json, write_formula_rollup_csv
 
 
+@functools.lru_cache(maxsize=4)
+def _taxonomy_config(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # Keyed on (mtime, size) so an edited config is picked up by long-lived processes
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
 def _load_taxonomy_stack(eba_version: str | None) -> List[str]:
     if not eba_version:
         return []
     try:
-        cfg = json.loads(Path("config/taxonomy.json").read_text(encoding="utf-8"))
+        cfg_path = Path("config/taxonomy.json").resolve()
+        st = cfg_path.stat()
+        cfg = _taxonomy_config(str(cfg_path), st.st_mtime_ns, st.st_size)
         key = "eba_3_4" if str(eba_version) == "3.4" else "eba_3_5"
         return [str(p) for p in (cfg.get("stacks", {}).get(key, []) or [])]
     except Exception:
         return []
 
 
-def main() -> int:
+_LINK_NS = "{http://www.xbrl.org/2003/linkbase}"
+_XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+_XBRLI_ROOT = "{http://www.xbrl.org/2003/instance}xbrl"
+
+
+def _schema_ref_hrefs(instance_path: str) -> List[str]:
+    """Return lowercased link:schemaRef hrefs, reading only as much of the file as needed.
+
+    For xbrli:xbrl instances the refs sit in the header, so parsing stops at the first
+    top-level element outside the linkbase namespace (i.e. the first context/unit/fact).
+    Other documents (e.g. inline XBRL) are streamed to the end with elements cleared.
+    """
+    try:
+        from lxml.etree import iterparse
+    except ImportError:
+        from xml.etree.ElementTree import iterparse
+    hrefs: List[str] = []
+    depth = 0
+    header_only = False
+    for event, elem in iterparse(instance_path, events=("start", "end")):
+        if event == "end":
+            depth -= 1
+            elem.clear()
+            continue
+        depth += 1
+        tag = elem.tag if isinstance(elem.tag, str) else ""
+        if depth == 1:
+            header_only = tag == _XBRLI_ROOT
+        elif tag == _LINK_NS + "schemaRef":
+            href = elem.get(_XLINK_HREF) or ""
+            if href:
+                hrefs.append(href.lower())
+        elif header_only and depth == 2 and not tag.startswith(_LINK_NS):
+            break
+    return hrefs
+
+
+def _detect_eba_from_instance(instance_path: str) -> tuple[Optional[str], Optional[str]]:
+    """Detect EBA version (3.4/3.5) and framework (corep/finrep/dora/fc/mrel/rem) from schemaRef hrefs.
+    Fallback: infer from filename tokens. Results are cached per (path, mtime, size).
+    """
+    try:
+        st = os.stat(instance_path)
+        sig: Optional[tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        sig = None
+    return _detect_eba_cached(str(instance_path), sig)
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_eba_cached(instance_path: str, _sig: Optional[tuple[int, int]]) -> tuple[Optional[str], Optional[str]]:
+    try:
+        hrefs = _schema_ref_hrefs(instance_path)
+        blob = " ".join(hrefs)
+        fw: Optional[str] = None
+        if "/fws/dora/" in blob:
+            fw = "dora"
+        elif "/fws/corep/" in blob:
+            fw = "corep"
+        elif "/fws/finrep/" in blob:
+            fw = "finrep"
+        elif "/fws/fc/" in blob:
+            fw = "fc"
+        elif "/fws/mrel" in blob:
+            fw = "mrel"
+        elif "/fws/rem" in blob:
+            fw = "rem"
+        ver: Optional[str] = None
+        if "/3.5/" in blob or "2024-07-11" in blob or "/3.5" in blob:
+            ver = "3.5"
+        elif "/3.4/" in blob or "2019-04-30" in blob or "/3.4" in blob:
+            ver = "3.4"
+        # fallback on filename
+        if fw is None or ver is None:
+            name = Path(instance_path).name.lower()
+            if fw is None:
+                for token, f in (("dora", "dora"), ("corep", "corep"), ("finrep", "finrep"), ("mrel", "mrel"), ("fc", "fc"), ("rem", "rem")):
+                    if token in name:
+                        fw = f
+                        break
+            if ver is None:
+                if "3.5" in name or "2024-07-11" in name:
+                    ver = "3.5"
+                elif "3.4" in name or "2019-04-30" in name:
+                    ver = "3.4"
+        return ver, fw
+    except Exception:
+        try:
+            name = Path(instance_path).name.lower()
+            ver = "3.5" if ("3.5" in name or "2024-07-11" in name) else ("3.4" if ("3.4" in name or "2019-04-30" in name) else None)
+            fw = None
+            for token, f in (("dora", "dora"), ("corep", "corep"), ("finrep", "finrep"), ("mrel", "mrel"), ("fc", "fc"), ("rem", "rem")):
+                if token in name:
+                    fw = f
+                    break
+            return ver, fw
+        except Exception:
+            return None, None
+
+
+def main(argv: List[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="XBRL validation CLI (Arelle-based)")
     ap.add_argument("--file", required=True, help="XBRL instance file path")
     ap.add_argument("--packages", action="append", default=[], help="Taxonomy package ZIP or zip#entry.xsd (repeatable)")
@@ -34,7 +153,7 @@ def main() -> int:
     ap.add_argument("--cacheDir", default="assets/cache", help="Cache directory for Arelle")
     ap.add_argument("--exports", default="exports", help="Exports directory for CSV/JSON reports")
     ap.add_argument("--severity-exit", default=None, help="Exit non-zero if severity present (e.g., ERROR)")
-    args, extra = ap.parse_known_args()
+    args, extra = ap.parse_known_args(argv)
 
     input_path = args.file
     plugins = [p for p in (args.plugins or "").split("|") if p]
@@ -43,7 +162,7 @@ def main() -> int:
         taxonomy_paths = _load_taxonomy_stack(args.eba_version)
 
     Path(args.cacheDir).mkdir(parents=True, exist_ok=True)
-    Path(Path(args.out).parent).mkdir(parents=True, exist_ok=True)
+    Path(args.out).parent.mkdir(parents=True, exist_ok=True)
 
     summary = run_validation(
         input_path=input_path,
@@ -57,7 +176,8 @@ def main() -> int:
         use_subprocess=False,
     )
 
-    # Generate exports
+    # Generate exports (the ingest rollup also serves the severity exit below)
+    roll = None
     try:
         msgs, roll, by_file = ingest_jsonl(str(args.out))
         exp_dir = Path(args.exports)
@@ -69,19 +189,32 @@ def main() -> int:
         pass
 
     # Severity-based exit if requested
-    if args.severity_exit:
+    if args.severity_exit and roll is not None:
         sev = (args.severity_exit or "").upper().strip()
-        try:
-            msgs, roll, _ = ingest_jsonl(str(args.out))
-            errs = sum(1 for m in msgs if (m.get("level") or "").upper() in (sev,))
-            if errs:
-                return 2
-        except Exception:
-            pass
+        if roll["bySeverity"].get(sev, 0):
+            return 2
 
     return int(summary.get("returnCode", 0) or 0)
 
 
+# redirect_stdout/stderr swap process-wide streams and Arelle runs share the "arelle"
+# logger handlers, so embedded runs in one process must not overlap
+_EMBEDDED_LOCK = threading.Lock()
+
+
+def run_embedded(argv: List[str]) -> int:
+    """``main(argv)`` for in-process callers (the API): console output is discarded and
+    argparse exits come back as return codes instead of ``SystemExit``.
+
+    Runs are serialised per process; use worker processes (or subprocesses) for concurrency.
+    """
+    with _EMBEDDED_LOCK, open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        try:
+            return main(argv)
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 1
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
 
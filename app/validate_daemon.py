@@ -0,0 +1,44 @@
+"""Long-lived ``app.validate`` runner used by the GUI.
+
+Reads one JSON request per line on stdin, ``{"argv": [...]}`` (``app.validate`` CLI
+arguments), runs it in-process and answers with one JSON line on stdout:
+``{"returnCode": int}`` or ``{"error": str}``. Arelle is imported once at startup, so
+only the first validation pays for it. The process exits when stdin is closed.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import IO
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def serve(inp: IO[str], out: IO[str]) -> None:
+    from app.validate import run_embedded
+    from src.validation.arelle_runner import _warm_worker
+
+    _warm_worker()
+    for line in inp:
+        if not line.strip():
+            continue
+        try:
+            req = json.loads(line)
+            resp = {"returnCode": run_embedded([str(a) for a in req["argv"]])}
+        except Exception as e:
+            resp = {"error": str(e)}
+        out.write(json.dumps(resp) + "\n")
+        out.flush()
+
+
+def main() -> int:
+    # Replies own the real stdout; anything else that gets printed goes to stderr
+    out = sys.stdout
+    sys.stdout = sys.stderr
+    serve(sys.stdin, out)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
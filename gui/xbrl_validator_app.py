@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import functools
+import heapq
+import json
+import re
+import subprocess
 import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
@@ -10,10 +15,8 @@ import sys
 # Ensure project root on sys.path for 'src' imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-# Import from correct paths
-from src.validation.arelle_runner import run_validation
-from src.pipeline import ingest_jsonl
-from src.validation.eba_rules import apply_eba_rules
+# The validation/pipeline modules (Arelle, openpyxl, ...) are imported on first use in
+# _validate_worker so the window opens without loading them
 try:
     from xbrl_validator.dpm import list_templates, list_tables_for_template  # type: ignore
     from xbrl_validator.taxonomy_package import list_entry_points, to_zip_entry_syntax  # type: ignore
@@ -34,20 +37,43 @@ except Exception:
         return f"{pkg_zip}#{entry_uri}"
 
 
+@functools.lru_cache(maxsize=1)
+def _license_info() -> tuple[str, Optional[str], bool, bool]:
+    """(licensed-to text, watermark, excel reports enabled, pdf reports enabled), read once per
+    session; cleared when a new license is applied."""
+    try:
+        from xbrl_validator.license import licensed_to_text, watermark_text, feature_enabled
+        return licensed_to_text(), watermark_text(), feature_enabled("reports-excel"), feature_enabled("reports-pdf")
+    except Exception:
+        return "", None, True, True
+
+
+def _python_executable() -> str:
+    # Prefer project venv311 interpreter if available for Arelle compatibility
+    venv_py = Path(__file__).resolve().parent.parent / ".venv311/bin/python"
+    return str(venv_py) if venv_py.exists() else sys.executable
+
+
 class XbrlValidatorGui(tk.Tk):
+    # Message rows are inserted into the tree in windows of this size as the user scrolls
+    MSG_BATCH = 500
+    # Delay before typing in a filter box re-filters the list
+    FILTER_DEBOUNCE_MS = 300
+
     def __init__(self) -> None:
         super().__init__()
-        try:
-            from xbrl_validator.license import licensed_to_text
-            lic = licensed_to_text()
-        except Exception:
-            lic = ""
+        lic = _license_info()[0]
         self.title(f"XBRL Validator{(' - ' + lic) if lic else ''}")
         self.geometry("800x600")
         self.instance_var = tk.StringVar()
         self.status_var = tk.StringVar(value="Ready")
         self.progress_var = tk.DoubleVar(value=0.0)
         self.export_buttons_visible = False
+        # Persistent app.validate_daemon process (Arelle imported once), started now so
+        # its startup overlaps with the user picking a file
+        self._daemon: Optional[subprocess.Popen] = None
+        self._daemon_lock = threading.Lock()
+        self._start_validate_daemon()
 
         self._build_widgets()
 
@@ -144,12 +170,14 @@ class XbrlValidatorGui(tk.Tk):
         self.msg_tree.column("message", width=500, anchor="w")
         self.msg_tree.column("table", width=160, anchor="w")
         self.msg_tree.column("cell", width=120, anchor="w")
+        self.msg_tree.configure(yscrollcommand=self._on_msg_scroll)
         self.msg_tree.pack(fill=tk.BOTH, expand=True, padx=4, pady=8)
         self.msg_tree.bind("<Double-1>", self._on_msg_open)
 
         # Per-table grouping panel
         grp = ttk.Frame(right_panel)
         grp.pack(fill=tk.X, padx=4, pady=6)
+        self._table_counts_frame = grp
         ttk.Label(grp, text="Per-table counts:").pack(side=tk.LEFT)
         self.table_counts_var = tk.StringVar(value="")
         self.table_counts_lbl = ttk.Label(grp, textvariable=self.table_counts_var, font=("Arial", 10))
@@ -172,7 +200,16 @@ class XbrlValidatorGui(tk.Tk):
         self.download_frame.pack_forget()
 
         self._msgs: list[dict] = []  # normalized messages from JSONL ingest
+        self._filtered: list[int] = []  # indices into _msgs passing the current filters
+        self._per_table: dict[str, dict[str, int]] = {}  # per-table level counts over _filtered
+        self._rendered = 0  # how many of _filtered are in msg_tree
+        self._render_pending = False
+        self._detached = False  # trees are out of the layout while _refresh_msgs rebuilds them
+        self._filter_after: str | None = None
         self._filter_table: str | None = None
+        self._reindex()  # per-message display/filter columns (self._idx)
+        self.filter_code.trace_add("write", self._schedule_filters)
+        self.filter_q.trace_add("write", self._schedule_filters)
         self._refresh_license_ui()
 
     def _upload_and_validate(self) -> None:
@@ -187,38 +224,43 @@ class XbrlValidatorGui(tk.Tk):
     def _validate_worker(self, path: str) -> None:
         try:
             from app.validate import _detect_eba_from_instance
+            from src.pipeline import iter_ingest_batches
+            from src.validation.arelle_runner import run_validation
             ver, fw = _detect_eba_from_instance(path)
             label = f"Detected: {(fw or '?').upper()} {ver or ''}".strip() if (ver or fw) else "Detected: —"
             self.detected_label_var.set(label)
             
-            # Step 1: Prime cache first to ensure EBA formulas work
+            # Step 1: Prime the cache for EBA formulas
             self.status_var.set("Priming cache...")
             self.progress_var.set(10)
             
             from pathlib import Path as _P
-            import subprocess, sys
 
-            # Prefer project venv311 interpreter if available for Arelle compatibility
-            _venv_py = (Path(__file__).resolve().parent.parent / ".venv311/bin/python")
-            _py = str(_venv_py) if _venv_py.exists() else sys.executable
+            _py = _python_executable()
+            # Child output goes to files, not pipes: nothing is buffered in the GUI process
+            log_dir = _P("assets/logs")
+            log_dir.mkdir(parents=True, exist_ok=True)
             
             # Prime cache if helper is available (optional)
+            cache_proc = None
+            cache_err_path = log_dir / "cache_prime.stderr"
             try:
                 cache_cmd = [_py, "-m", "scripts.cache_prime"]
-                cache_result = subprocess.run(cache_cmd, capture_output=True, text=True, check=False)
-                if cache_result.returncode != 0:
-                    print(f"[warn] cache priming failed: {cache_result.stderr}")
+                with cache_err_path.open("wb") as err:
+                    cache_proc = subprocess.Popen(cache_cmd, stdout=subprocess.DEVNULL, stderr=err)
             except Exception:
                 pass
+            # The offline run below reads the primed cache, so it must not start before priming ends
+            if cache_proc is not None and cache_proc.wait() != 0:
+                print(f"[warn] cache priming failed: {cache_err_path.read_text(errors='replace')}")
             
             self.progress_var.set(20)
             self.status_var.set("Validating...")
             
-            # Step 2: Run validation with offline mode (now cache is primed)
-            logp = _P("assets/logs/gui_run.jsonl")
+            # Step 2: Run validation with offline mode
+            logp = log_dir / "gui_run.jsonl"
             exp_dir = "exports"
-            cmd = [
-                _py, "-m", "app.validate",
+            argv = [
                 "--file", path,
                 "--ebaVersion", ver or "3.5",
                 "--out", str(logp),
@@ -227,9 +269,9 @@ class XbrlValidatorGui(tk.Tk):
                 "--cacheDir", "assets/cache",
                 "--exports", exp_dir
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            returncode = self._run_app_validate(argv, log_dir / "gui_run.stderr")
             self.progress_var.set(60)
-            if result.returncode != 0:
+            if returncode != 0:
                 # Fallback: run in-process validation to avoid dependency on app.validate
                 try:
                     # Resolve taxonomy packages from config if available
@@ -263,30 +305,94 @@ class XbrlValidatorGui(tk.Tk):
                     messagebox.showerror("Error", f"Validation failed: {_e}")
                     return
 
-            # Ingest results
-            from src.pipeline import ingest_jsonl
-            msgs, _, _ = ingest_jsonl(str(logp), dpm_sqlite=get_dpm_sqlite_path(), dpm_schema="dpm35_10", model_xbrl_path=path)
+            # Ingest results, streamed into the list batch by batch as they are parsed
+            self.after(0, self._begin_msgs_stream)
+            msgs = []
+            for batch in iter_ingest_batches(str(logp), dpm_sqlite=get_dpm_sqlite_path(), dpm_schema="dpm35_10", model_xbrl_path=path):
+                msgs.extend(batch)
+                self.after(0, self._append_msgs_batch, batch)
             self.progress_var.set(80)
 
             # Summary
             errors = sum(1 for m in msgs if (m.get("level") or "").upper() in ("ERROR", "FATAL"))
             warnings = sum(1 for m in msgs if (m.get("level") or "").upper() == "WARNING")
             summary = f"Validation complete: {errors} errors, {warnings} warnings, {len(msgs)} total messages"
-            self.summary_var.set(summary)
-
-            # Populate messages list
-            self._msgs = msgs
-            self._refresh_msgs()
-
-            self.progress_var.set(100)
-            self.status_var.set("Complete")
-            self.results_frame.pack(fill=tk.BOTH, expand=True)
-            self.download_frame.pack()
-            self.export_buttons_visible = True
+            self.after(0, self._finish_msgs, None, summary)
         except Exception as e:
             self.status_var.set("Error")
             messagebox.showerror("Error", str(e))
 
+    def _start_validate_daemon(self) -> None:
+        try:
+            self._daemon = subprocess.Popen(
+                [_python_executable(), "-m", "app.validate_daemon"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+            )
+        except Exception:
+            self._daemon = None
+
+    def _daemon_validate(self, argv: list[str]) -> Optional[int]:
+        """Run ``app.validate`` in the daemon; None if it is unavailable or died (it is restarted next time)."""
+        with self._daemon_lock:
+            if self._daemon is None or self._daemon.poll() is not None:
+                self._start_validate_daemon()
+            proc = self._daemon
+            if proc is None:
+                return None
+            try:
+                proc.stdin.write(json.dumps({"argv": argv}) + "\n")
+                proc.stdin.flush()
+                resp = json.loads(proc.stdout.readline() or "{}")
+            except Exception:
+                resp = {}
+            if "returnCode" not in resp:
+                if "error" not in resp:
+                    # No reply: the daemon crashed mid-run
+                    proc.kill()
+                    self._daemon = None
+                return None
+            return int(resp["returnCode"])
+
+    def _run_app_validate(self, argv: list[str], stderr_path: Path) -> int:
+        returncode = self._daemon_validate(argv)
+        if returncode is None:
+            # Per-run process, as before the daemon; stderr is kept on disk for debugging
+            with stderr_path.open("wb") as err:
+                returncode = subprocess.run([_python_executable(), "-m", "app.validate", *argv],
+                                            stdout=subprocess.DEVNULL, stderr=err, check=False).returncode
+        return returncode
+
+    def _begin_msgs_stream(self) -> None:
+        self._msgs = []
+        self._reindex()
+        self.msg_tree.delete(*self.msg_tree.get_children())
+        self._rendered = 0
+        self.status_var.set("Loading results...")
+        self.results_frame.pack(fill=tk.BOTH, expand=True)
+
+    def _append_msgs_batch(self, batch: list[dict]) -> None:
+        start = len(self._msgs)
+        self._msgs.extend(batch)
+        self._index_rows(batch)
+        self._compute_filtered(start)
+        # Only the first window is drawn while streaming; the rest loads on scroll
+        if self._rendered < self.MSG_BATCH:
+            self._render_window(self._rendered, self.MSG_BATCH)
+        self.status_var.set(f"Loading results... {len(self._msgs)} messages")
+
+    def _finish_msgs(self, msgs: Optional[list[dict]], summary: str) -> None:
+        # msgs is None after a stream: self._msgs and its index are already complete
+        if msgs is not None:
+            self._msgs = msgs
+            self._reindex()
+        self.summary_var.set(summary)
+        self._refresh_msgs()
+        self.progress_var.set(100)
+        self.status_var.set("Complete")
+        self.results_frame.pack(fill=tk.BOTH, expand=True)
+        self.download_frame.pack()
+        self.export_buttons_visible = True
+
     def _download_csv(self) -> None:
         self._download_report("exports/validation_messages.csv", "CSV")
 
@@ -306,7 +412,8 @@ class XbrlValidatorGui(tk.Tk):
             return
         import shutil
         try:
-            shutil.copy(default_path, path)
+            # copyfile takes the zero-copy path (sendfile on Linux, fcopyfile on macOS)
+            shutil.copyfile(default_path, path)
             messagebox.showinfo("Download", f"{filetype} saved to {path}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save: {e}")
@@ -321,65 +428,161 @@ class XbrlValidatorGui(tk.Tk):
         out = filedialog.asksaveasfilename(title="Save bundle", defaultextension=".zip", filetypes=[("ZIP", "*.zip")])
         if not out:
             return
+        self.btn_bundle.state(["disabled"])
+        self.status_var.set("Exporting bundle...")
+        self.progress_var.set(0)
+        threading.Thread(target=self._export_bundle_worker, args=(exp_dir, out), daemon=True).start()
+
+    def _export_bundle_worker(self, exp_dir: Path, out: str) -> None:
+        # Runs off the Tk loop; UI updates go through after()
         try:
             import zipfile
-            with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-                for p in exp_dir.rglob("*"):
-                    if p.is_file():
-                        zf.write(p, p.relative_to(exp_dir))
-            messagebox.showinfo("Export", f"Bundle saved to {out}")
+            # Fast deflate for text exports; already-compressed files are stored as-is
+            stored = {".xlsx", ".pdf", ".zip", ".gz", ".br", ".png", ".jpg"}
+            files = [p for p in exp_dir.rglob("*") if p.is_file()]
+            with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+                for i, p in enumerate(files, 1):
+                    ctype = zipfile.ZIP_STORED if p.suffix.lower() in stored else zipfile.ZIP_DEFLATED
+                    zf.write(p, p.relative_to(exp_dir), compress_type=ctype)
+                    self.after(0, self.progress_var.set, 100 * i / len(files))
+            self.after(0, self.status_var.set, "Bundle saved")
+            self.after(0, messagebox.showinfo, "Export", f"Bundle saved to {out}")
         except Exception as e:
-            messagebox.showerror("Export", str(e))
+            self.after(0, self.status_var.set, "Export failed")
+            self.after(0, messagebox.showerror, "Export", str(e))
+        finally:
+            self.after(0, self.btn_bundle.state, ["!disabled"])
+
+    def _schedule_filters(self, *_args) -> None:
+        # Debounce keystrokes in the filter boxes
+        if self._filter_after is not None:
+            self.after_cancel(self._filter_after)
+        self._filter_after = self.after(self.FILTER_DEBOUNCE_MS, self._apply_filters)
 
     def _apply_filters(self) -> None:
+        if self._filter_after is not None:
+            self.after_cancel(self._filter_after)
+            self._filter_after = None
         self._refresh_msgs()
 
-    def _refresh_msgs(self) -> None:
-        # Clear
-        for i in self.msg_tree.get_children():
-            self.msg_tree.delete(i)
+    def _reindex(self) -> None:
+        """Precompute per-message columns (parallel to ``self._msgs``) so filtering does no per-row dict lookups."""
+        self._idx = {"lvl": [], "code": [], "blob": [], "table": [], "iid": [], "row": []}
+        self._index_rows(self._msgs)
+
+    def _index_rows(self, rows: list[dict]) -> None:
+        """Append the columns for ``rows`` (the tail of ``self._msgs``) to ``self._idx``."""
+        ix = self._idx
+        lvl, codes, blob, table, iid, row = ix["lvl"], ix["code"], ix["blob"], ix["table"], ix["iid"], ix["row"]
+        for i, m in enumerate(rows, len(iid)):
+            code = m.get("code") or ""
+            message = m.get("message") or ""
+            mc = m.get("mappedCell") or {}
+            lv = (m.get("level") or "").upper()
+            tbl = mc.get("table_id") or (m.get("dpm_table") or "")
+            cell = mc.get("cell_id") or (m.get("dpm_cell") or "")
+            msg_short = message.replace("\n", " ")
+            if len(msg_short) > 160:
+                msg_short = msg_short[:157] + "..."
+            lvl.append(lv)
+            codes.append(code)
+            blob.append(f"{code} {message}")
+            table.append(tbl)
+            # Tree iid and column values, built once and handed straight to insert()
+            iid.append(str(i))
+            row.append((lv, code, msg_short, tbl, cell))
+
+    def _compute_filtered(self, start: int = 0) -> dict[str, dict[str, int]]:
+        """Fill ``self._filtered`` with the indices of messages passing the filters; return per-table counts.
+
+        With ``start`` > 0 only messages from ``start`` on are checked and appended (streamed batches).
+        """
         sev = (self.filter_sev.get() or "ALL").upper()
-        q = (self.filter_q.get() or "").strip().lower()
-        per_table: dict[str, dict[str, int]] = {}
-        for idx, m in enumerate(self._msgs):
-            lvl = (m.get("level") or "").upper()
-            if sev != "ALL" and lvl != sev:
+        sev = None if sev == "ALL" else sev
+        # Case-insensitive matchers compiled once per refresh; every "Contains" word must match
+        words = (self.filter_q.get() or "").split()
+        q_pats = [re.compile(re.escape(w), re.IGNORECASE).search for w in words]
+        codef = (self.filter_code.get() or "").strip()
+        code_pat = re.compile(re.escape(codef), re.IGNORECASE).search if codef else None
+        ftable = self._filter_table
+        ix = self._idx
+        lvls, codes, blobs, tables = ix["lvl"], ix["code"], ix["blob"], ix["table"]
+        filtered: list[int] = self._filtered if start else []
+        per_table: dict[str, dict[str, int]] = self._per_table if start else {}
+        append = filtered.append
+        for i in range(start, len(lvls)):
+            lvl = lvls[i]
+            if sev is not None and lvl != sev:
                 continue
             # Code filter (exact match or substring)
-            codef = (self.filter_code.get() or "").strip().lower()
-            codev = (m.get('code') or '').strip().lower()
-            if codef and codef not in codev:
+            if code_pat is not None and code_pat(codes[i]) is None:
                 continue
-            blob = f"{m.get('code','')} {m.get('message','')}".lower()
-            if q and q not in blob:
+            if q_pats and not all(p(blobs[i]) for p in q_pats):
                 continue
-            mc = m.get("mappedCell") or {}
-            table = mc.get("table_id") or (m.get("dpm_table") or "")
-            if self._filter_table and table and self._filter_table != table:
+            table = tables[i]
+            if ftable and table and ftable != table:
                 continue
-            cell = mc.get("cell_id") or (m.get("dpm_cell") or "")
-            msg_short = (m.get("message") or "").replace("\n", " ")
-            if len(msg_short) > 160:
-                msg_short = msg_short[:157] + "..."
-            self.msg_tree.insert("", "end", iid=str(idx), values=(lvl, m.get("code") or "", msg_short, table, cell))
+            append(i)
             # accumulate per-table counts
             if table:
                 d = per_table.setdefault(table, {"ERROR": 0, "WARNING": 0, "INFO": 0, "FATAL": 0})
                 d[lvl] = d.get(lvl, 0) + 1
+        self._filtered = filtered
+        self._per_table = per_table
+        return per_table
+
+    def _render_window(self, start: int, end: int) -> None:
+        """Insert rows ``start:end`` of ``self._filtered`` into the message tree."""
+        self._render_pending = False
+        iids, rows = self._idx["iid"], self._idx["row"]
+        insert = self.msg_tree.insert
+        for i in self._filtered[start:end]:
+            insert("", "end", iid=iids[i], values=rows[i])
+        self._rendered = min(end, len(self._filtered))
+
+    def _on_msg_scroll(self, first: str, last: str) -> None:
+        # Stream the next window in once the view nears the end of what is rendered
+        if self._detached or self._render_pending:
+            return
+        if float(last) >= 0.9 and self._rendered < len(self._filtered):
+            self._render_pending = True
+            self.after_idle(self._render_next)
+
+    def _render_next(self) -> None:
+        self._render_window(self._rendered, self._rendered + self.MSG_BATCH)
+
+    def _refresh_msgs(self) -> None:
+        # Take both trees out of the layout while they are rebuilt so Tk redraws once, not per insert
+        self._detached = True
+        self.msg_tree.pack_forget()
+        self.group_tree.pack_forget()
+        try:
+            self._rebuild_trees()
+        finally:
+            self.group_tree.pack(fill=tk.Y, expand=False)
+            self.msg_tree.pack(fill=tk.BOTH, expand=True, padx=4, pady=8, before=self._table_counts_frame)
+            self._detached = False
+            self.update_idletasks()
+
+    def _rebuild_trees(self) -> None:
+        # Clear
+        self.msg_tree.delete(*self.msg_tree.get_children())
+        self._rendered = 0
+        per_table = self._compute_filtered()
+        self._render_window(0, self.MSG_BATCH)
 
         # Update per-table summary string (top 8 tables by ERROR then WARNING)
         def sort_key(item: tuple[str, dict[str, int]]):
             k, v = item
             return (-(v.get("ERROR", 0) + v.get("FATAL", 0)), -v.get("WARNING", 0), k)
-        items = sorted(per_table.items(), key=sort_key)[:8]
+        items = heapq.nsmallest(8, per_table.items(), key=sort_key)
         parts: list[str] = []
         for t, v in items:
             parts.append(f"{t}: E{v.get('ERROR',0)+v.get('FATAL',0)}/W{v.get('WARNING',0)}")
         self.table_counts_var.set("  |  ".join(parts))
 
         # Rebuild group tree
-        for i in self.group_tree.get_children():
-            self.group_tree.delete(i)
+        self.group_tree.delete(*self.group_tree.get_children())
         for t, v in sorted(per_table.items(), key=lambda kv: -(kv[1].get("ERROR", 0) + kv[1].get("FATAL", 0))):
             parent = self.group_tree.insert("", "end", iid=f"table:{t}", text=t, values=(sum(v.values()),))
             for lvl in ("ERROR", "WARNING", "INFO", "FATAL"):
@@ -498,6 +701,7 @@ class XbrlValidatorGui(tk.Tk):
             try:
                 if set_license_path:
                     set_license_path(p)
+                _license_info.cache_clear()
                 self._refresh_license_ui()
                 messagebox.showinfo("License", "License path saved and applied.")
             except Exception as e:
@@ -507,24 +711,16 @@ class XbrlValidatorGui(tk.Tk):
         _ttk.Button(btns, text="Apply", command=apply).pack(side=tk.RIGHT)
 
     def _refresh_license_ui(self) -> None:
-        try:
-            from xbrl_validator.license import licensed_to_text, watermark_text, feature_enabled
-            lic = licensed_to_text()
-            wm = watermark_text()
-        except Exception:
-            lic = ""
-            wm = None
-            def feature_enabled(_n: str) -> bool:
-                return True
+        lic, wm, excel_ok, pdf_ok = _license_info()
         # Title and watermark
         self.title(f"XBRL Validator{(' - ' + lic) if lic else ''}")
         self.wm_label.configure(text=(wm or ""))
         # Feature gating for reports
         try:
             if hasattr(self, 'btn_excel'):
-                self.btn_excel.state(["!disabled"] if feature_enabled("reports-excel") else ["disabled"])
+                self.btn_excel.state(["!disabled"] if excel_ok else ["disabled"])
             if hasattr(self, 'btn_pdf'):
-                self.btn_pdf.state(["!disabled"] if feature_enabled("reports-pdf") else ["disabled"])
+                self.btn_pdf.state(["!disabled"] if pdf_ok else ["disabled"])
         except Exception:
             pass
         # Status text
@@ -567,8 +763,7 @@ class XbrlValidatorGui(tk.Tk):
         tbl_tree.pack(fill=tk.BOTH, expand=True)
 
         def do_search() -> None:
-            for i in tmpl_tree.get_children():
-                tmpl_tree.delete(i)
+            tmpl_tree.delete(*tmpl_tree.get_children())
             try:
                 templates = list_templates("/Users/omarfrix/Desktop/untitled folder 12/assets/dpm.sqlite", schema_prefix=schema.get(), like=q.get().strip() or None)
             except Exception as e:
@@ -582,8 +777,7 @@ class XbrlValidatorGui(tk.Tk):
             if not sel:
                 return
             templateid = sel[0]
-            for i in tbl_tree.get_children():
-                tbl_tree.delete(i)
+            tbl_tree.delete(*tbl_tree.get_children())
             try:
                 tables = list_tables_for_template("/Users/omarfrix/Desktop/untitled folder 12/assets/dpm.sqlite", templateid=templateid, schema_prefix=schema.get())
             except Exception as e:
@@ -18,6 +18,7 @@ hidden = [
     'cryptography',
     'cryptography.hazmat',
     'cryptography.hazmat.primitives.asymmetric.ed25519',
+    'orjson',
 ]
 
 a = Analysis([
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
 import subprocess
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import argparse
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
 
 BASE = Path(__file__).resolve().parents[1]
@@ -43,52 +55,99 @@ def run_case(case: Case, exports_dir: Path, core_only: bool = False) -> Tuple[in
     if core_only:
         cmd.append("--noFilingRules")
     print("[run]", " ".join(cmd))
-    res = subprocess.run(cmd, capture_output=True, text=True)
+    # Validator output goes straight to a per-case log file; only its tail is shown on failure
+    log = exports_dir / f"{case.name}.log"
+    with log.open("wb") as log_fp:
+        res = subprocess.run(cmd, stdout=log_fp, stderr=subprocess.STDOUT)
     if res.returncode != 0:
-        print(res.stdout)
-        print(res.stderr)
+        with log.open("rb") as f:
+            f.seek(max(0, log.stat().st_size - 4096))
+            print(f.read().decode("utf-8", errors="replace"))
     return res.returncode, out
 
 
-def load_jsonl(path: Path) -> List[dict]:
+def load_jsonl(path: Path) -> Sequence[dict]:
+    """Parsed records of a JSONL file (empty if missing), cached per (path, mtime, size).
+
+    The cached rows are shared between callers and must not be mutated.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return ()
+    return _load_jsonl_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_jsonl_cached(path: str, _mtime_ns: int, _size: int) -> Tuple[dict, ...]:
     rows: List[dict] = []
-    if not path.exists():
-        return rows
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
+
+    def _parse(block: bytes) -> None:
+        # Blank or whitespace-only lines simply fail to parse and are skipped
+        for line in block.split(b"\n"):
+            if line:
+                try:
+                    rows.append(_loads(line))
+                except Exception:
+                    pass
+
+    # Read 1 MiB chunks and split only the complete lines; the partial last line carries over
+    buf = b""
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            buf += chunk
+            nl = buf.rfind(b"\n")
+            if nl < 0:
                 continue
-            try:
-                rows.append(json.loads(line))
-            except Exception:
-                pass
-    return rows
+            _parse(buf[:nl])
+            buf = buf[nl + 1:]
+    _parse(buf)
+    return tuple(rows)
 
 
-def assert_deterministic(current: Path, expected: Path, ignore_codes: set[str] | None = None, check_fields: bool = False) -> None:
+def assert_deterministic(
+    current: Path, expected: Path, ignore_codes: set[str] | None = None, check_fields: bool = False
+) -> Tuple[Sequence[dict], Sequence[dict]]:
+    """Assert ``current`` matches the ``expected`` baseline; returns both parsed logs for further checks."""
     cur = load_jsonl(current)
     exp = load_jsonl(expected)
-    # Basic assertions: length and top-10 codes histogram
-    def by_code(rows: List[dict]) -> dict:
-        h: dict[str, int] = {}
-        for m in rows:
-            c = (m.get("code") or "").strip()
-            if c:
-                if ignore_codes and c in ignore_codes:
-                    continue
-                h[c] = h.get(c, 0) + 1
-        return dict(sorted(h.items(), key=lambda kv: kv[1], reverse=True)[:10])
+    # Basic assertions: length first (cheap), then the top-10 codes histogram
     assert len(cur) == len(exp), f"message count differs: {len(cur)} != {len(exp)}"
+    if not cur:
+        return cur, exp
+
+    def by_code(rows: Sequence[dict]) -> dict:
+        codes = ((m.get("code") or "").strip() for m in rows)
+        h = Counter(c for c in codes if c and not (ignore_codes and c in ignore_codes))
+        return dict(h.most_common(10))
     assert by_code(cur) == by_code(exp), "top codes histogram differs"
     if check_fields:
         # Compare distribution of (docUri,line,col) tuples for first 200 entries (ignoring message text)
-        def sig(rows: List[dict]) -> List[tuple[str, int, int]]:
+        def sig(rows: Sequence[dict]) -> List[tuple[str, int, int]]:
             out: List[tuple[str, int, int]] = []
             for m in rows[:200]:
                 out.append((str(m.get("docUri") or ""), int(m.get("line") or 0), int(m.get("col") or 0)))
             return out
         assert sig(cur) == sig(exp), "docUri/line/col signature differs in first 200 messages"
+    return cur, exp
+
+
+def build_cases(runs: Sequence[dict]) -> List[Case]:
+    """Cases for the acceptance matrix, named after the instance file stem.
+
+    Logs, exports and per-case thresholds are keyed by that name, so two inputs with the same
+    stem would overwrite each other's outputs (also when run in parallel); raises ValueError.
+    """
+    cases: List[Case] = []
+    by_name: dict = {}
+    for r in runs:
+        p = Path(os.path.abspath(r["path"]))
+        name = p.stem
+        if name in by_name:
+            raise ValueError(f"duplicate case name {name!r}: {by_name[name]} and {p}")
+        by_name[name] = p
+        cases.append(Case(name=name, file=p, eba_version=str(r["eba_version"]), expected_jsonl=Path(os.path.abspath(r["jsonl"]))))
+    return cases
 
 
 def main() -> int:
@@ -99,6 +158,7 @@ def main() -> int:
     ap.add_argument("--check-fields", action="store_true", help="Also compare docUri/line/col for first N messages")
     ap.add_argument("--expect-csv", action="store_true", help="Require rules_coverage.csv to exist in exports for filing runs")
     ap.add_argument("--expect-json", default="", help="Path to expected outcomes JSON (per-table thresholds)")
+    ap.add_argument("--jobs", type=int, default=0, help="Validator runs in parallel (default: one per CPU, capped at the number of cases)")
     args = ap.parse_args()
     # Load acceptance matrix from artifacts/coverage.json if present
     cov_path = BASE / "artifacts/coverage.json"
@@ -122,16 +182,16 @@ def main() -> int:
             },
         ]
     else:
-        data = json.loads(cov_path.read_text(encoding="utf-8"))
+        data = _loads(cov_path.read_bytes())
         runs = []
         for r in data.get("runs", []):
             runs.append({"path": r.get("path"), "eba_version": r.get("eba_version") or "3.5", "jsonl": r.get("jsonl")})
 
-    cases: List[Case] = []
-    for r in runs:
-        p = Path(r["path"]).resolve()
-        name = p.stem
-        cases.append(Case(name=name, file=p, eba_version=str(r["eba_version"]), expected_jsonl=Path(r["jsonl"]).resolve()))
+    try:
+        cases = build_cases(runs)
+    except ValueError as e:
+        print(f"[ERR] {e}")
+        return 2
 
     exports_dir = BASE / "exports" / "acceptance"
     exports_dir.mkdir(parents=True, exist_ok=True)
@@ -142,7 +202,7 @@ def main() -> int:
         p = Path(args.ignore_codes)
         if p.exists():
             try:
-                data = json.loads(p.read_text(encoding="utf-8"))
+                data = _loads(p.read_bytes())
                 if isinstance(data, list):
                     ignore_codes = {str(x) for x in data}
             except Exception:
@@ -155,13 +215,19 @@ def main() -> int:
         p = Path(args.expect_json)
         if p.exists():
             try:
-                expected = json.loads(p.read_text(encoding="utf-8"))
+                expected = _loads(p.read_bytes())
             except Exception:
                 expected = {}
 
-    for c in cases:
+    # Validator subprocesses are independent, so they run side by side (threads suffice: the
+    # work happens in the children); results are then checked serially in case order.
+    jobs = args.jobs if args.jobs > 0 else min(len(cases), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as ex:
+        results = [ex.submit(run_case, c, exports_dir, args.mode == "core") for c in cases]
+    for c, fut in zip(cases, results):
         print(f"[case] {c.name}")
-        rc, out = run_case(c, exports_dir, core_only=(args.mode == "core"))
+        rc, out = fut.result()
+        cur_rows: Sequence[dict] | None = None
         if rc != 0:
             print(f"[FAIL] validator exit code {rc} for {c.name}")
             failures += 1
@@ -177,7 +243,7 @@ def main() -> int:
                 failures += 1
         else:
             try:
-                assert_deterministic(out, c.expected_jsonl, ignore_codes=ignore_codes, check_fields=args.check_fields)
+                cur_rows, _ = assert_deterministic(out, c.expected_jsonl, ignore_codes=ignore_codes, check_fields=args.check_fields)
                 print(f"[OK] {c.name}")
                 if args.expect_csv and args.mode == "filing":
                     exp_dir = exports_dir / c.name
@@ -191,24 +257,20 @@ def main() -> int:
         # Optional expected outcomes check (table-level thresholds)
         if expected and args.mode == "filing":
             try:
-                cur_msgs = load_jsonl(out)
+                # Reuse the log parsed by assert_deterministic (load_jsonl is cached anyway)
+                cur_msgs = cur_rows if cur_rows is not None else load_jsonl(out)
                 # Compute per-table counts by severity
-                by_table: dict[str, dict[str, int]] = {}
-                for m in cur_msgs:
+                def table_level(m: dict) -> tuple[str, str]:
                     mc = m.get("mappedCell") or {}
-                    table = mc.get("table_id") or (m.get("dpm_table") or "")
-                    lvl = (m.get("level") or "INFO").upper()
-                    if not table:
-                        continue
-                    d = by_table.setdefault(table, {})
-                    d[lvl] = d.get(lvl, 0) + 1
+                    return mc.get("table_id") or (m.get("dpm_table") or ""), (m.get("level") or "INFO").upper()
+                by_table = Counter(tl for tl in map(table_level, cur_msgs) if tl[0])
                 # Evaluate thresholds
                 exp_for_case = expected.get(c.name) or {}
                 for table, th in exp_for_case.items():
-                    cur = by_table.get(table, {})
                     for lvl, min_val in th.items():
-                        if cur.get(lvl, 0) < int(min_val):
-                            print(f"[DIFF] {c.name}: table {table} {lvl} below expected {min_val} (got {cur.get(lvl,0)})")
+                        got = by_table[(table, lvl)]
+                        if got < int(min_val):
+                            print(f"[DIFF] {c.name}: table {table} {lvl} below expected {min_val} (got {got})")
                             failures += 1
             except Exception as e:
                 print(f"[warn] expected check failed: {e}")
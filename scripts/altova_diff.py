@@ -10,12 +10,19 @@ import csv
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
-from dataclasses import dataclass
-from collections import defaultdict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from collections import Counter
+from operator import attrgetter
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationMessage:
     """Normalized validation message for comparison."""
     level: str
@@ -25,18 +32,20 @@ class ValidationMessage:
     line: Optional[int] = None
     column: Optional[int] = None
     element: Optional[str] = None
+    _sim_key: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        # Normalize level
-        self.level = self.level.upper() if self.level else "UNKNOWN"
+        # Normalize level (interned: few distinct levels/codes shared by many messages)
+        self.level = sys.intern(self.level.upper()) if self.level else "UNKNOWN"
         # Normalize code
-        self.code = self.code.strip() if self.code else ""
+        self.code = sys.intern(self.code.strip()) if self.code else ""
         # Normalize message (remove extra whitespace)
         self.message = " ".join(self.message.split()) if self.message else ""
+        self._sim_key = f"{self.level}|{self.code}|{self.message[:100]}"
     
     def similarity_key(self) -> str:
         """Key for matching similar messages across tools."""
-        return f"{self.level}|{self.code}|{self.message[:100]}"
+        return self._sim_key
     
     def __str__(self) -> str:
         location = ""
@@ -47,6 +56,46 @@ class ValidationMessage:
         return f"[{self.level}] {self.code}: {self.message[:80]}{location}"
 
 
+def _csv_rows(f) -> Tuple[Dict[str, int], Iterator[List[str]]]:
+    """Split a CSV file into its header (column name -> index) and the data rows.
+
+    Rows are plain lists (no per-row dict); blank rows are skipped and short rows are
+    padded with '' so every header index is valid.
+    """
+    reader = csv.reader(f)
+    header = next(reader, [])
+    width = len(header)
+
+    def rows() -> Iterator[List[str]]:
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            yield row
+
+    return {name: i for i, name in enumerate(header)}, rows()
+
+
+def _column_getter(header: Dict[str, int], candidates: Tuple[str, ...]) -> Callable[[List[str]], str]:
+    """Return row -> first non-empty value among the ``candidates`` columns present in the header."""
+    cols = [header[c] for c in candidates if c in header]
+    if not cols:
+        return lambda row: ''
+    if len(cols) == 1:
+        i = cols[0]
+        return lambda row: row[i]
+    return lambda row: next((row[i] for i in cols if row[i]), '')
+
+
+def _int_column_getter(header: Dict[str, int], name: str) -> Callable[[List[str]], Optional[int]]:
+    """Return row -> int value of column ``name`` when it holds digits, else None."""
+    if name not in header:
+        return lambda row: None
+    i = header[name]
+    return lambda row: int(row[i]) if row[i].isdigit() else None
+
+
 class ValidationResultLoader:
     """Load validation results from different formats."""
     
@@ -55,17 +104,24 @@ class ValidationResultLoader:
         """Load our validation_messages.csv format."""
         messages = []
         try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
+            with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+                header, rows = _csv_rows(f)
+                level_of = _column_getter(header, ('level',))
+                code_of = _column_getter(header, ('code',))
+                message_of = _column_getter(header, ('message',))
+                file_of = _column_getter(header, ('docUri',))
+                line_of = _int_column_getter(header, 'line')
+                column_of = _int_column_getter(header, 'col')
+                element_of = _column_getter(header, ('modelObjectQname',))
+                for row in rows:
                     msg = ValidationMessage(
-                        level=row.get('level', ''),
-                        code=row.get('code', ''),
-                        message=row.get('message', ''),
-                        file_path=row.get('docUri', ''),
-                        line=int(row['line']) if row.get('line') and row['line'].isdigit() else None,
-                        column=int(row['col']) if row.get('col') and row['col'].isdigit() else None,
-                        element=row.get('modelObjectQname', '')
+                        level=level_of(row),
+                        code=code_of(row),
+                        message=message_of(row),
+                        file_path=file_of(row),
+                        line=line_of(row),
+                        column=column_of(row),
+                        element=element_of(row)
                     )
                     messages.append(msg)
         except Exception as e:
@@ -77,27 +133,25 @@ class ValidationResultLoader:
         """Load Altova CSV format (assumed structure)."""
         messages = []
         try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Try common Altova column names
-                    level = (row.get('Severity') or row.get('Level') or 
-                            row.get('Type') or row.get('severity') or '').upper()
-                    code = (row.get('Code') or row.get('ErrorCode') or 
-                           row.get('MessageCode') or row.get('code') or '')
-                    message = (row.get('Message') or row.get('Description') or 
-                              row.get('Text') or row.get('message') or '')
-                    file_path = (row.get('File') or row.get('Document') or 
-                                row.get('Uri') or row.get('file') or '')
-                    
+            with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+                header, rows = _csv_rows(f)
+                # Resolve the common Altova column names once against the header
+                level_of = _column_getter(header, ('Severity', 'Level', 'Type', 'severity'))
+                code_of = _column_getter(header, ('Code', 'ErrorCode', 'MessageCode', 'code'))
+                message_of = _column_getter(header, ('Message', 'Description', 'Text', 'message'))
+                file_of = _column_getter(header, ('File', 'Document', 'Uri', 'file'))
+                line_of = _int_column_getter(header, 'Line')
+                column_of = _int_column_getter(header, 'Column')
+                element_of = _column_getter(header, ('Element', 'QName'))
+                for row in rows:
                     msg = ValidationMessage(
-                        level=level,
-                        code=code,
-                        message=message,
-                        file_path=file_path,
-                        line=int(row['Line']) if row.get('Line') and str(row['Line']).isdigit() else None,
-                        column=int(row['Column']) if row.get('Column') and str(row['Column']).isdigit() else None,
-                        element=row.get('Element') or row.get('QName') or ''
+                        level=level_of(row).upper(),
+                        code=code_of(row),
+                        message=message_of(row),
+                        file_path=file_of(row),
+                        line=line_of(row),
+                        column=column_of(row),
+                        element=element_of(row)
                     )
                     messages.append(msg)
         except Exception as e:
@@ -109,8 +163,8 @@ class ValidationResultLoader:
         """Load Altova JSON format (assumed structure)."""
         messages = []
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            raw = Path(json_path).read_bytes()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 
             # Handle different JSON structures
             if isinstance(data, list):
@@ -139,6 +193,17 @@ class ValidationResultLoader:
         return messages
 
 
+def _level_code_counts(messages: List[ValidationMessage]) -> Tuple[Counter, Counter]:
+    """Count messages by level and by code from a single (level, code) pass."""
+    pairs = Counter(zip(map(attrgetter('level'), messages), map(attrgetter('code'), messages)))
+    by_level: Counter = Counter()
+    by_code: Counter = Counter()
+    for (level, code), n in pairs.items():
+        by_level[level] += n
+        by_code[code] += n
+    return by_level, by_code
+
+
 class ValidationDiff:
     """Compare validation results between tools."""
     
@@ -146,48 +211,36 @@ class ValidationDiff:
         self.our_messages = our_messages
         self.altova_messages = altova_messages
         
-        # Build indices for efficient comparison
-        self.our_by_key = {msg.similarity_key(): msg for msg in our_messages}
-        self.altova_by_key = {msg.similarity_key(): msg for msg in altova_messages}
+        # Build indices for efficient comparison (keys precomputed on each message);
+        # the dict_keys views already support set operations, so no set copies
+        self.our_by_key = {msg._sim_key: msg for msg in our_messages}
+        self.altova_by_key = {msg._sim_key: msg for msg in altova_messages}
         
-        self.our_keys = set(self.our_by_key.keys())
-        self.altova_keys = set(self.altova_by_key.keys())
+        self.our_keys = self.our_by_key.keys()
+        self.altova_keys = self.altova_by_key.keys()
     
     def analyze(self) -> Dict[str, Any]:
         """Perform comprehensive diff analysis."""
         
-        # Basic counts
+        # Basic counts (the differences follow from the one intersection)
+        common = len(self.our_keys & self.altova_keys)
         analysis = {
             "our_total": len(self.our_messages),
             "altova_total": len(self.altova_messages),
-            "common_messages": len(self.our_keys & self.altova_keys),
-            "our_unique": len(self.our_keys - self.altova_keys),
-            "altova_unique": len(self.altova_keys - self.our_keys),
+            "common_messages": common,
+            "our_unique": len(self.our_keys) - common,
+            "altova_unique": len(self.altova_keys) - common,
         }
         
-        # Severity breakdown
-        our_by_level = defaultdict(int)
-        altova_by_level = defaultdict(int)
-        
-        for msg in self.our_messages:
-            our_by_level[msg.level] += 1
-        for msg in self.altova_messages:
-            altova_by_level[msg.level] += 1
+        # Severity and code breakdowns from one (level, code) count per tool;
+        # most_common(10) is a heap selection, not a full sort
+        our_by_level, our_by_code = _level_code_counts(self.our_messages)
+        altova_by_level, altova_by_code = _level_code_counts(self.altova_messages)
         
         analysis["our_by_level"] = dict(our_by_level)
         analysis["altova_by_level"] = dict(altova_by_level)
-        
-        # Code breakdown
-        our_by_code = defaultdict(int)
-        altova_by_code = defaultdict(int)
-        
-        for msg in self.our_messages:
-            our_by_code[msg.code] += 1
-        for msg in self.altova_messages:
-            altova_by_code[msg.code] += 1
-        
-        analysis["our_top_codes"] = dict(sorted(our_by_code.items(), key=lambda x: x[1], reverse=True)[:10])
-        analysis["altova_top_codes"] = dict(sorted(altova_by_code.items(), key=lambda x: x[1], reverse=True)[:10])
+        analysis["our_top_codes"] = dict(our_by_code.most_common(10))
+        analysis["altova_top_codes"] = dict(altova_by_code.most_common(10))
         
         # Calculate similarity score
         if analysis["our_total"] + analysis["altova_total"] > 0:
@@ -201,11 +254,9 @@ class ValidationDiff:
     def get_unique_messages(self, ours_only: bool = True) -> List[ValidationMessage]:
         """Get messages unique to one tool."""
         if ours_only:
-            unique_keys = self.our_keys - self.altova_keys
-            return [self.our_by_key[key] for key in unique_keys]
+            return [msg for key, msg in self.our_by_key.items() if key not in self.altova_keys]
         else:
-            unique_keys = self.altova_keys - self.our_keys
-            return [self.altova_by_key[key] for key in unique_keys]
+            return [msg for key, msg in self.altova_by_key.items() if key not in self.our_keys]
 
 
 def print_analysis(analysis: Dict[str, Any]) -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Add project root to path
@@ -25,20 +26,19 @@ def main():
     data = load_rules_from_excel(excel_path)
     print(f"✅ Total rules in Excel: {data['count']}")
 
-    # Count by framework
-    frameworks = {}
-    severities = {}
+    # Count by framework, severity and active flag in one C-level pass, then fold
+    triples = Counter(
+        (r.get('framework', 'unknown'), r.get('severity', 'UNKNOWN'), bool(r.get('active', True)))
+        for r in data['rules']
+    )
+    frameworks: Counter = Counter()
+    severities: Counter = Counter()
     active_count = 0
-    
-    for r in data['rules']:
-        fw = r.get('framework', 'unknown')
-        frameworks[fw] = frameworks.get(fw, 0) + 1
-        
-        sev = r.get('severity', 'UNKNOWN')
-        severities[sev] = severities.get(sev, 0) + 1
-        
-        if r.get('active', True):
-            active_count += 1
+    for (fw, sev, active), n in triples.items():
+        frameworks[fw] += n
+        severities[sev] += n
+        if active:
+            active_count += n
 
     print(f"\n📊 ANALYSIS:")
     print(f"  Total rules: {data['count']}")
@@ -46,11 +46,11 @@ def main():
     print(f"  Inactive rules: {data['count'] - active_count}")
 
     print(f"\n🏛️ Rules by framework:")
-    for fw, count in sorted(frameworks.items(), key=lambda x: x[1], reverse=True):
+    for fw, count in frameworks.most_common():
         print(f"  {fw}: {count}")
 
     print(f"\n⚠️ Rules by severity:")
-    for sev, count in sorted(severities.items(), key=lambda x: x[1], reverse=True):
+    for sev, count in severities.most_common():
         print(f"  {sev}: {count}")
     
     # Load curated rules
@@ -4,6 +4,10 @@ import re
 import sys
 from pathlib import Path
 
+_UNIT_REF = re.compile(rb'unitRef="([^"]+)"')
+_CONTEXT_REF = re.compile(rb'contextRef="([^"]+)"')
+_CONTEXT_BLOCK = re.compile(rb'<context\b.*?</context>', re.DOTALL | re.IGNORECASE)
+
 
 def main() -> int:
     if len(sys.argv) < 2:
@@ -17,15 +21,16 @@ def main() -> int:
     dst_dir.mkdir(parents=True, exist_ok=True)
     dst = dst_dir / (src.stem + ".broken" + src.suffix)
 
-    text = src.read_text(encoding="utf-8", errors="ignore")
+    # Work on raw bytes: the patterns are ASCII, so large instances skip a decode/encode round trip
+    text = src.read_bytes()
 
     # Intentionally break 1: make the first fact refer to an undefined unit
-    new_text, n1 = re.subn(r'unitRef="([^"]+)"', 'unitRef="MISSING_UNIT_XYZ"', text, count=1)
+    new_text, n1 = _UNIT_REF.subn(b'unitRef="MISSING_UNIT_XYZ"', text, count=1)
     changed = n1 > 0
 
     # Intentionally break 2: if no unitRef found, break contextRef instead
     if not changed:
-        new_text, n2 = re.subn(r'contextRef="([^"]+)"', 'contextRef="MISSING_CTX_ABC"', text, count=1)
+        new_text, n2 = _CONTEXT_REF.subn(b'contextRef="MISSING_CTX_ABC"', text, count=1)
         changed = n2 > 0
     
     # Intentionally break 3: try removing all <context> elements to force schema errors
@@ -33,11 +38,11 @@ def main() -> int:
         text2 = text
     else:
         text2 = new_text
-    text3 = re.sub(r'<context\b[\s\S]*?</context>', '', text2, flags=re.IGNORECASE)
+    text3 = _CONTEXT_BLOCK.sub(b'', text2)
     new_text = text3
     changed = True
 
-    dst.write_text(new_text if changed else text, encoding="utf-8")
+    dst.write_bytes(new_text if changed else text)
     if changed:
         print(f"[info] wrote broken copy: {dst}")
     else:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
@@ -12,7 +13,8 @@ def main() -> int:
         print(f"[error] spec not found: {spec}")
         return 2
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])  # ensure installed
+        if importlib.util.find_spec("PyInstaller") is None:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])  # ensure installed
         cmd = [sys.executable, "-m", "PyInstaller", str(spec), "--noconfirm"]
         print("[build]", " ".join(cmd))
         subprocess.check_call(cmd)
@@ -1,13 +1,51 @@
 from __future__ import annotations
 
+import os
+import re
+import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, List
 
+_COPY_BUFSIZE = 1 << 20
+# Below this many entries a package is extracted on the calling thread
+_PARALLEL_MIN_ENTRIES = 64
 
-def prime_from_packages(packages: Iterable[str], cache_dir: str = "assets/cache") -> int:
+# Zip entry names (lower-cased) that mirror an HTTP resource; the bare host names also
+# cover their www. variants, so one compiled pattern replaces the per-marker scans
+HTTP_RESOURCE_RE = re.compile(r"(?:eba\.europa\.eu|eurofiling\.info|xbrl\.org|w3\.org)/")
+
+
+def _extract_entries(zip_path: Path, infos: List[zipfile.ZipInfo], http_root: Path) -> int:
+    """Extract ``infos`` under ``http_root`` through a ZipFile handle of its own (one per thread)."""
+    copied = 0
+    with zipfile.ZipFile(str(zip_path), "r") as zf:
+        for info in infos:
+            target = http_root / info.filename
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Write beside the target and rename, so readers never see a half-written file
+            part = target.with_name(target.name + ".part")
+            if info.file_size == 0:
+                part.touch()
+            else:
+                # Stream in 1 MiB chunks rather than reading whole entries into memory
+                with zf.open(info, "r") as src, open(part, "wb", buffering=_COPY_BUFSIZE) as dst:
+                    shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+            os.replace(part, target)
+            copied += 1
+    return copied
+
+
+def prime_from_packages(packages: Iterable[str], cache_dir: str = "assets/cache", workers: int | None = None) -> int:
+    """Copy the HTTP-mirrored XSD/XML entries of each package ZIP into ``<cache_dir>/http``.
+
+    Entries are inflated and written on ``workers`` threads (default: up to 8), each with
+    its own ZipFile handle; zlib releases the GIL, so extraction scales across cores.
+    """
     http_root = Path(cache_dir) / "http"
     http_root.mkdir(parents=True, exist_ok=True)
+    n_workers = max(1, workers if workers is not None else min(8, os.cpu_count() or 1))
     copied = 0
     for pkg in packages:
         base = str(pkg).split("#", 1)[0]
@@ -15,30 +53,25 @@ def prime_from_packages(packages: Iterable[str], cache_dir: str = "assets/cache"
         if not p.exists() or not p.suffix.lower() == ".zip":
             continue
         try:
+            todo: List[zipfile.ZipInfo] = []
             with zipfile.ZipFile(str(p), "r") as zf:
-                for name in zf.namelist():
-                    low = name.lower()
+                for info in zf.infolist():
+                    low = info.filename.lower()
                     if not low.endswith((".xsd", ".xml")):
                         continue
                     # More aggressive extraction - include any HTTP-style resource
-                    if not any(marker in low for marker in (
-                        "www.eba.europa.eu/",
-                        "www.eurofiling.info/", 
-                        "www.xbrl.org/",
-                        "www.w3.org/",
-                        "eba.europa.eu/",
-                        "eurofiling.info/",
-                        "xbrl.org/",
-                        "w3.org/",
-                    )):
+                    if not HTTP_RESOURCE_RE.search(low):
                         continue
-                    target = http_root / name
-                    if target.exists():
+                    if (http_root / info.filename).exists():
                         continue
-                    target.parent.mkdir(parents=True, exist_ok=True)
-                    with zf.open(name, "r") as src, open(target, "wb") as dst:
-                        dst.write(src.read())
-                        copied += 1
+                    todo.append(info)
+            if n_workers == 1 or len(todo) < _PARALLEL_MIN_ENTRIES:
+                copied += _extract_entries(p, todo, http_root)
+            else:
+                # Interleaved slices spread the large and small files of each directory
+                slices = [todo[i::n_workers] for i in range(n_workers)]
+                with ThreadPoolExecutor(max_workers=n_workers) as ex:
+                    copied += sum(ex.map(lambda part: _extract_entries(p, part, http_root), slices))
         except Exception:
             continue
     return copied
@@ -4,9 +4,14 @@ import argparse
 import os
 import sys
 import tempfile
+import time
 from pathlib import Path
+from typing import List
 import zipfile
 
+# Archives up to this uncompressed size are converted in memory (no temp extraction)
+_IN_MEMORY_LIMIT = 512 << 20
+
 
 def _find_taxonomy_root(extracted_dir: Path) -> Path:
     # Prefer directory containing taxonomyPackage.xml (or taxonomy-package.xml)
@@ -21,6 +26,43 @@ def _find_taxonomy_root(extracted_dir: Path) -> Path:
     return extracted_dir
 
 
+def _taxonomy_root_prefix(names: List[str]) -> str:
+    """Archive-name counterpart of ``_find_taxonomy_root``: the directory prefix ("" or "dir/")
+    closest to the root that holds taxonomyPackage.xml (or taxonomy-package.xml)."""
+    candidates = [
+        n.rsplit("/", 1)[0] + "/" if "/" in n else ""
+        for n in names
+        if n.rsplit("/", 1)[-1] in ("taxonomyPackage.xml", "taxonomy-package.xml")
+    ]
+    return min(candidates, key=len) if candidates else ""
+
+
+def _zip_from_memory(z, out_zip: Path) -> bool:
+    """Write the taxonomy ZIP straight from the 7z contents held in memory, skipping the
+    extract-to-disk and re-read round trip. Returns False (nothing written) when the archive
+    is larger than ``_IN_MEMORY_LIMIT`` or py7zr has no ``readall``; the caller then extracts."""
+    if not hasattr(z, "readall"):
+        return False
+    entries = [e for e in z.list() if not e.is_directory]
+    if sum(e.uncompressed or 0 for e in entries) > _IN_MEMORY_LIMIT:
+        return False
+    names = [e.filename.replace("\\", "/") for e in entries]
+    prefix = _taxonomy_root_prefix(names)
+    stamps = {n: e.creationtime for n, e in zip(names, entries)}
+    out_zip.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(str(out_zip), "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, bio in sorted(z.readall().items()):
+            name = name.replace("\\", "/")
+            if name not in stamps or not name.startswith(prefix):
+                continue
+            ts = stamps[name]
+            date_time = ts.timetuple()[:6] if ts and ts.year >= 1980 else time.localtime()[:6]
+            zinfo = zipfile.ZipInfo(name[len(prefix):], date_time=date_time)
+            zinfo.external_attr = 0o644 << 16
+            zf.writestr(zinfo, bio.getvalue(), compress_type=zipfile.ZIP_DEFLATED)
+    return True
+
+
 def _zip_dir(src_dir: Path, out_zip: Path) -> None:
     out_zip.parent.mkdir(parents=True, exist_ok=True)
     with zipfile.ZipFile(str(out_zip), "w", compression=zipfile.ZIP_DEFLATED) as zf:
@@ -49,6 +91,12 @@ def main() -> int:
         print("[ERROR] py7zr is required. Install with: python3 -m pip install --break-system-packages py7zr", file=sys.stderr)
         return 2
 
+    if not args.workdir:
+        with py7zr.SevenZipFile(str(in_path), mode="r") as z:
+            if _zip_from_memory(z, out_path):
+                print(f"[OK] Wrote taxonomy ZIP: {out_path}")
+                return 0
+
     if args.workdir:
         tdir = Path(args.workdir)
         tdir.mkdir(parents=True, exist_ok=True)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import heapq
 import json
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Set
 
@@ -9,12 +12,24 @@ from typing import Any, Dict, List, Set
 BASE = Path(__file__).resolve().parents[1]
 
 
+@functools.lru_cache(maxsize=4)
+def _json_file(path: str, mtime_ns: int, size: int) -> Any:
+    # Keyed on (mtime, size) so an edited or regenerated file is parsed again
+    return json.loads(Path(path).read_bytes())
+
+
+def _load_json(p: Path) -> Any:
+    st = p.stat()
+    return _json_file(str(p), st.st_mtime_ns, st.st_size)
+
+
 def load_rules() -> List[Dict[str, Any]]:
     cache = BASE / "assets/cache/eba_rules_cache.json"
     if cache.exists():
         try:
-            data = json.loads(cache.read_text(encoding="utf-8"))
-            return list(data.get("rules", []))
+            data = _load_json(cache)
+            # Copy each rule: the parsed file is cached and shared between calls
+            return [dict(r) for r in data.get("rules", [])]
         except Exception:
             pass
     # Fallback: try loading via loader if available
@@ -44,17 +59,20 @@ def load_aliases() -> Dict[str, str]:
     if not p.exists():
         return {}
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
+        data = _load_json(p)
         return {str(k): str(v) for k, v in (data.get("aliases", {}) or {}).items()}
     except Exception:
         return {}
 
 
 def curate(rules: List[Dict[str, Any]], count: int, focus: List[str]) -> List[str]:
-    focus_low = [f.lower() for f in focus]
+    # One compiled alternation replaces the per-keyword substring scans
+    focus_re = re.compile("|".join(re.escape(f.lower()) for f in focus)) if focus else None
     aliases = load_aliases()
     # Score rules: severity weight + focus table match
     sev_weight = {"FATAL": 3, "ERROR": 3, "WARNING": 2, "INFO": 1}
+    # Rules share a small set of tables, so the focus bonus is computed once per table
+    table_bonus: Dict[str, int] = {}
     scored: List[tuple[int, str]] = []
     seen: Set[str] = set()
     for r in rules:
@@ -65,20 +83,21 @@ def curate(rules: List[Dict[str, Any]], count: int, focus: List[str]) -> List[st
         sev = str(r.get("severity") or "").upper()
         base = sev_weight.get(sev, 1)
         table = str(r.get("table") or "")
-        tnorm = table
-        if table:
-            low = table.lower()
-            tnorm = aliases.get(low, table)
-        bonus = 0
-        for kw in focus_low:
-            if (tnorm and kw in str(tnorm).lower()) or (table and kw in table.lower()):
-                bonus = 5
-                break
+        bonus = table_bonus.get(table)
+        if bonus is None:
+            bonus = 0
+            if table and focus_re is not None:
+                low = table.lower()
+                tnorm = str(aliases.get(low, table)).lower()
+                if focus_re.search(tnorm) or focus_re.search(low):
+                    bonus = 5
+            table_bonus[table] = bonus
         # Prefer rules with conditions
         cond_bonus = 1 if (r.get("condition") or r.get("cond_expr")) else 0
         scored.append((base + bonus + cond_bonus, rid))
-    scored.sort(key=lambda kv: (-kv[0], kv[1]))
-    return [rid for _score, rid in scored[:count]]
+    # Top `count` by score, ties by id: a heap selection rather than a full sort
+    top = heapq.nsmallest(count, scored, key=lambda kv: (-kv[0], kv[1]))
+    return [rid for _score, rid in top]
 
 
 def main() -> int:
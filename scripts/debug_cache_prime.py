@@ -2,9 +2,17 @@
 """Debug cache priming to see what's happening."""
 from __future__ import annotations
 
+import sys
 import zipfile
 from pathlib import Path
 
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.cache_prime import HTTP_RESOURCE_RE
+
 
 def debug_prime_from_packages(packages: list[str], cache_dir: str = "assets/cache") -> int:
     http_root = Path(cache_dir) / "http"
@@ -35,16 +43,7 @@ def debug_prime_from_packages(packages: list[str], cache_dir: str = "assets/cach
                 http_files = []
                 for name in xml_files:
                     low = name.lower()
-                    if any(marker in low for marker in (
-                        "www.eba.europa.eu/",
-                        "www.eurofiling.info/", 
-                        "www.xbrl.org/",
-                        "www.w3.org/",
-                        "eba.europa.eu/",
-                        "eurofiling.info/",
-                        "xbrl.org/",
-                        "w3.org/",
-                    )):
+                    if HTTP_RESOURCE_RE.search(low):
                         http_files.append(name)
                 
                 print(f"  HTTP XSD/XML files: {len(http_files)}")
@@ -6,12 +6,18 @@ from typing import Optional
 
 import requests
 
+_CHUNK_SIZE = 1 << 20
+
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: the whole read/update loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        buf = memoryview(bytearray(1 << 20))
+        while n := f.readinto(buf):
+            h.update(buf[:n])
     return h.hexdigest()
 
 
@@ -21,14 +27,15 @@ def download(url: str, out_path: Path) -> None:
         r.raise_for_status()
         total = int(r.headers.get("Content-Length", "0")) or None
         written = 0
-        with out_path.open("wb") as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    written += len(chunk)
-                    if total:
-                        pct = (written / total) * 100
-                        print(f"\rDownloading: {written}/{total} bytes ({pct:.1f}%)", end="")
+        # Read the raw stream (content-decoded) in 1 MiB blocks; progress is printed once per block
+        r.raw.decode_content = True
+        with out_path.open("wb", buffering=_CHUNK_SIZE) as f:
+            while chunk := r.raw.read(_CHUNK_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+                if total:
+                    pct = (written / total) * 100
+                    print(f"\rDownloading: {written}/{total} bytes ({pct:.1f}%)", end="")
     print("\nDownload complete:", out_path)
 
 
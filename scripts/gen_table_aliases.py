@@ -4,6 +4,11 @@ import json
 import sqlite3
 from pathlib import Path
 
+# Every character str.strip() removes, bound as the SQLite TRIM() argument. LOWER() stays
+# SQLite's ASCII-only one (no ICU): DPM table and template codes are ASCII, so the keys
+# match str.lower() for them; a non-ASCII code would only get its ASCII letters folded.
+_WS = "".join(c for c in map(chr, range(0x110000)) if c.isspace())
+
 
 def build_aliases(sqlite_path: str, schema_prefix: str = "dpm35_10") -> dict:
     aliases: dict[str, str] = {}
@@ -11,31 +16,40 @@ def build_aliases(sqlite_path: str, schema_prefix: str = "dpm35_10") -> dict:
         return {"aliases": aliases}
     try:
         conn = sqlite3.connect(sqlite_path)
-        conn.row_factory = sqlite3.Row
     except Exception:
         return {"aliases": aliases}
     try:
-        # Common mapping: originaltablecode -> xbrltablecode (or canonical code)
+        # Common mapping: xbrl/version/template code variants -> xbrltablecode (or version code).
+        # SQLite emits every (key, canonical) pair; per key the pair from the earliest row/variant
+        # wins, in first-seen order, exactly as the former per-row Python loop did.
+        variants = ("xbrl", "LOWER(xbrl)", "ver", "LOWER(ver)", "templ", "LOWER(templ)", "REPLACE(templ, ' ', '')")
+        pairs_sql = "\n                UNION ALL ".join(
+            f"SELECT rn * 8 + {i} AS ord, {expr} AS k, canonical FROM base" for i, expr in enumerate(variants)
+        )
         rows = conn.execute(
             f"""
-            SELECT TV.tableversioncode, TV.tableversionlabel, TV.xbrltablecode,
-                   T.templatecode, T.templatelabel
-            FROM {schema_prefix}_tableversion AS TV
-            LEFT JOIN {schema_prefix}_template AS T ON T.conceptid = TV.conceptid
-            """
+            WITH raw AS (
+                SELECT ROW_NUMBER() OVER () AS rn,
+                       TRIM(COALESCE(TV.xbrltablecode, ''), :ws) AS xbrl,
+                       TRIM(COALESCE(TV.tableversioncode, ''), :ws) AS ver,
+                       TRIM(COALESCE(T.templatecode, ''), :ws) AS templ
+                FROM {schema_prefix}_tableversion AS TV
+                LEFT JOIN {schema_prefix}_template AS T ON T.conceptid = TV.conceptid
+            ),
+            base AS (
+                SELECT rn, xbrl, ver, templ, CASE WHEN xbrl <> '' THEN xbrl ELSE ver END AS canonical FROM raw
+            ),
+            pairs AS (
+                {pairs_sql}
+            )
+            SELECT k, canonical, MIN(ord) FROM pairs
+            WHERE k <> '' AND canonical <> ''
+            GROUP BY k
+            ORDER BY MIN(ord)
+            """,
+            {"ws": _WS},
         ).fetchall()
-        for r in rows:
-            orig = ""  # not present in this schema
-            xbrl = (r["xbrltablecode"] or "").strip()
-            ver = (r["tableversioncode"] or "").strip()
-            templ = (r["templatecode"] or "").strip()
-            canonical = xbrl or ver or orig
-            if not canonical:
-                continue
-            # Normalize typical forms to canonical
-            for k in (xbrl, xbrl.lower(), ver, ver.lower(), templ, templ.lower(), templ.replace(" ", "")):
-                if k and k not in aliases:
-                    aliases[k] = canonical
+        aliases = {k: canonical for k, canonical, _ord in rows}
     except Exception:
         pass
     finally:
@@ -9,13 +9,20 @@ import sys
 import tempfile
 import zipfile
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 try:
     from openpyxl import load_workbook
 except Exception:  # pragma: no cover
     load_workbook = None  # type: ignore
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    PYARROW_AVAILABLE = False
+
 
 def sanitize_table_name(name: str) -> str:
     base = re.sub(r"[^A-Za-z0-9_]+", "_", name)
@@ -47,21 +54,64 @@ def read_csv_records(path: Path) -> Tuple[List[str], Iterable[List[str]]]:
     return headers, row_iter()
 
 
+def read_csv_headers(path: Path) -> List[str]:
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        return next(csv.reader(f))
+
+
+def read_csv_rows_arrow(path: Path, width: int) -> Iterator[tuple]:
+    """Rows of a CSV (header skipped) parsed by pyarrow's multi-threaded reader, all cells as text.
+
+    Raises ``pyarrow.ArrowInvalid`` on rows whose field count differs from ``width``.
+    """
+    names = [f"c{i}" for i in range(width)]
+    reader = pa_csv.open_csv(
+        str(path),
+        read_options=pa_csv.ReadOptions(block_size=1 << 22, skip_rows=1, column_names=names),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(column_types={n: pa.string() for n in names}),
+    )
+    for batch in reader:
+        yield from zip(*(col.to_pylist() for col in batch.columns))
+
+
+def import_csv(conn: sqlite3.Connection, table: str, path: Path) -> int:
+    """Create ``table`` for the CSV at ``path`` and insert its rows (uncommitted)."""
+    if PYARROW_AVAILABLE:
+        headers = read_csv_headers(path)
+        ensure_table(conn, table, headers)
+        try:
+            return bulk_insert(conn, table, headers, read_csv_rows_arrow(path, len(headers)))
+        except pa.ArrowInvalid:
+            # Ragged rows: drop the partial load and redo it with the csv module, which pads/truncates
+            conn.rollback()
+    headers, rows = read_csv_records(path)
+    ensure_table(conn, table, headers)
+    return bulk_insert(conn, table, headers, rows)
+
+
+def _cell_text(v) -> str:
+    return "" if v is None else str(v)
+
+
 def read_xlsx_records(path: Path) -> Iterable[Tuple[str, List[str], Iterable[List[str]]]]:
     if load_workbook is None:
         return []
     wb = load_workbook(filename=str(path), read_only=True, data_only=True)
-    for ws in wb.worksheets:
-        # Assume first row is header
-        rows_iter = ws.iter_rows(values_only=True)
-        try:
-            headers = [str(c) if c is not None else "" for c in next(rows_iter)]
-        except StopIteration:
-            continue
-        def row_iter():
-            for row in rows_iter:
-                yield ["" if v is None else str(v) for v in row]
-        yield (ws.title, headers, row_iter())
+    try:
+        for ws in wb.worksheets:
+            # Assume first row is header
+            rows_iter = ws.iter_rows(values_only=True)
+            try:
+                headers = [_cell_text(c) for c in next(rows_iter)]
+            except StopIteration:
+                continue
+            # Most DPM cells are already text; only other cell types pay for a str() call
+            rows = ([v if v.__class__ is str else _cell_text(v) for v in row] for row in rows_iter)
+            yield (ws.title, headers, rows)
+    finally:
+        # Read-only workbooks keep the file open until closed
+        wb.close()
 
 
 def ensure_table(conn: sqlite3.Connection, table: str, headers: List[str]) -> None:
@@ -80,28 +130,27 @@ def ensure_table(conn: sqlite3.Connection, table: str, headers: List[str]) -> No
     conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({cols_sql});')
 
 
-def bulk_insert(conn: sqlite3.Connection, table: str, headers: List[str], rows: Iterable[List[str]], batch: int = 1000) -> int:
+def bulk_insert(conn: sqlite3.Connection, table: str, headers: List[str], rows: Iterable[List[str]], batch: int = 50000) -> int:
+    """Insert rows in ``executemany`` batches; the caller commits (one transaction per source file)."""
     cols = [sanitize_table_name(h or f"col{i}") for i, h in enumerate(headers)]
-    placeholders = ",".join(["?"] * len(cols))
+    width = len(cols)
+    placeholders = ",".join(["?"] * width)
     cols_sql = ",".join([f'"{c}"' for c in cols])
     sql = f'INSERT INTO "{table}" ({cols_sql}) VALUES ({placeholders})'
     count = 0
     buf: List[List[str]] = []
     for r in rows:
         # Pad/truncate row to headers length
-        if len(r) < len(cols):
-            r = r + ([None] * (len(cols) - len(r)))
-        elif len(r) > len(cols):
-            r = r[: len(cols)]
+        n = len(r)
+        if n != width:
+            r = r + ([None] * (width - n)) if n < width else r[:width]
         buf.append(r)
         if len(buf) >= batch:
             conn.executemany(sql, buf)
-            conn.commit()
             count += len(buf)
             buf.clear()
     if buf:
         conn.executemany(sql, buf)
-        conn.commit()
         count += len(buf)
     return count
 
@@ -134,19 +183,43 @@ def export_accdb_to_csvs(accdb_path: Path, out_dir: Path) -> None:
 
 
 def import_zip_to_sqlite(zip_path: Path, sqlite_path: Path, schema_prefix: str) -> None:
+    """Load the CSV/XLSX (and mdbtools-exported ACCDB) tables in ``zip_path`` into ``sqlite_path``.
+
+    The load runs without fsync or an on-disk journal, so a crash midway can corrupt the file
+    being written, including tables it already held. It therefore goes into a working copy
+    next to ``sqlite_path`` (a copy of the existing database, if any) that replaces it with
+    ``os.replace`` only once every table is committed; until then ``sqlite_path`` is untouched.
+    """
     tmpdir = Path(tempfile.mkdtemp(prefix="dpm_zip_"))
+    work_path = sqlite_path.with_name(sqlite_path.name + ".importing")
     try:
         with zipfile.ZipFile(str(zip_path), "r") as zf:
             zf.extractall(tmpdir)
-        conn = sqlite3.connect(str(sqlite_path))
+        # A leftover from an interrupted import is never resumed
+        work_path.unlink(missing_ok=True)
+        if sqlite_path.exists():
+            # The backup API also picks up pages still in a WAL file, unlike a plain file copy
+            src, dst = sqlite3.connect(str(sqlite_path)), sqlite3.connect(str(work_path))
+            try:
+                src.backup(dst)
+            finally:
+                dst.close()
+                src.close()
+            shutil.copymode(sqlite_path, work_path)
+        conn = sqlite3.connect(str(work_path))
         try:
+            # Bulk-load settings for this connection: no fsync per commit, rollback journal and
+            # temp data in memory, ~200 MB page cache. Safe only because this is the working copy.
+            conn.executescript(
+                "PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY; PRAGMA temp_store=MEMORY;"
+                " PRAGMA cache_size=-200000; PRAGMA locking_mode=EXCLUSIVE;"
+            )
             # Scan for CSV and XLSX
             for p in tmpdir.rglob("*"):
                 if p.is_file() and p.suffix.lower() == ".csv":
                     table = sanitize_table_name(f"{schema_prefix}_{p.stem}")
-                    headers, rows = read_csv_records(p)
-                    ensure_table(conn, table, headers)
-                    n = bulk_insert(conn, table, headers, rows)
+                    n = import_csv(conn, table, p)
+                    conn.commit()
                     print(f"[csv] {p.name} -> {table}: {n} rows")
                 elif p.is_file() and p.suffix.lower() in (".xlsx", ".xlsm"):
                     if load_workbook is None:
@@ -156,6 +229,7 @@ def import_zip_to_sqlite(zip_path: Path, sqlite_path: Path, schema_prefix: str)
                         table = sanitize_table_name(f"{schema_prefix}_{p.stem}_{sheet_name}")
                         ensure_table(conn, table, headers)
                         n = bulk_insert(conn, table, headers, rows)
+                        conn.commit()
                         print(f"[xlsx] {p.name}!{sheet_name} -> {table}: {n} rows")
                 elif p.is_file() and p.suffix.lower() == ".accdb":
                     # Attempt export via mdbtools then re-scan for CSVs
@@ -164,20 +238,21 @@ def import_zip_to_sqlite(zip_path: Path, sqlite_path: Path, schema_prefix: str)
                     export_accdb_to_csvs(p, export_dir)
                     for c in export_dir.glob("*.csv"):
                         table = sanitize_table_name(f"{schema_prefix}_{c.stem}")
-                        headers, rows = read_csv_records(c)
-                        ensure_table(conn, table, headers)
-                        n = bulk_insert(conn, table, headers, rows)
+                        n = import_csv(conn, table, c)
+                        conn.commit()
                         print(f"[accdb-csv] {c.name} -> {table}: {n} rows")
         finally:
             conn.close()
+        os.replace(work_path, sqlite_path)
     finally:
+        work_path.unlink(missing_ok=True)
         shutil.rmtree(tmpdir, ignore_errors=True)
 
 
 def main() -> int:
     ap = argparse.ArgumentParser(description="Import EBA DPM (CSV/XLSX) into SQLite")
     ap.add_argument("--zip", required=True, help="Path to a DPM zip containing CSV/XLSX")
-    ap.add_argument("--sqlite", required=True, help="Output SQLite file path (will be created/updated)")
+    ap.add_argument("--sqlite", required=True, help="Output SQLite file path (created, or updated via a working copy that replaces it)")
     ap.add_argument("--schema", required=True, help="Schema prefix (e.g., dpm35_20)")
     args = ap.parse_args()
 
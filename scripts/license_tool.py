@@ -42,13 +42,18 @@ def gen_keypair(out_dir: Path) -> int:
     return 0
 
 
+def _canonical_json(data: Dict[str, Any]) -> bytes:
+    """Bytes that get signed/verified. Must stay byte-identical to xbrl_validator.license's encoding
+    (stdlib json: sorted keys, compact separators, ASCII escapes), so orjson is not used here."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
 def sign_license(private_key_b64: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
     priv = Ed25519PrivateKey.from_private_bytes(base64.b64decode(private_key_b64))
     data = dict(payload)
     data.pop("signature", None)
-    blob = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    sig = priv.sign(blob)
+    sig = priv.sign(_canonical_json(data))
     data["signature"] = base64.b64encode(sig).decode("ascii")
     return data
 
@@ -84,7 +89,7 @@ def cmd_verify(args) -> int:
         return 1
     signed = dict(lic)
     signed.pop("signature", None)
-    blob = json.dumps(signed, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    blob = _canonical_json(signed)
     sig = base64.b64decode(sig_b64)
     pub = Ed25519PublicKey.from_public_bytes(base64.b64decode(pub_b64))
     try:
@@ -1,5 +1,8 @@
 from .ingest_jsonl import (
     ingest_jsonl,
+    iter_ingest_batches,
+    iter_jsonl,
+    normalize_level,
     write_validation_messages_csv,
     write_results_by_file_json,
     write_formula_rollup_csv,
@@ -7,6 +10,9 @@ from .ingest_jsonl import (
 
 __all__ = [
     "ingest_jsonl",
+    "iter_ingest_batches",
+    "iter_jsonl",
+    "normalize_level",
     "write_validation_messages_csv",
     "write_results_by_file_json",
     "write_formula_rollup_csv",
@@ -1,32 +1,62 @@
 from __future__ import annotations
 
 import csv
+import itertools
 import json
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union
 
 from src.dpm import DpmDb, map_instance, MappedCell
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def _stream_jsonl(path: Path) -> Generator[Dict[str, Any], None, None]:
-    if not path.exists():
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Mapped cells kept in the ingest rollup for UI previews
+MAPPED_SAMPLE_SIZE = 8
+
+# Canonical (interned) upper-case levels; str.upper() only runs for levels outside this set.
+# Missing/empty levels are INFO.
+_LEVEL_CANON: Dict[Any, str] = {k: sys.intern(k) for k in ("INFO", "WARNING", "ERROR", "FATAL", "DEBUG")}
+_LEVEL_CANON.update({k.lower(): v for k, v in list(_LEVEL_CANON.items())})
+_LEVEL_CANON[None] = _LEVEL_CANON[""] = _LEVEL_CANON["INFO"]
+
+
+def normalize_level(level: Any) -> str:
+    """Upper-case severity for a log record's ``level``; missing or empty levels are ``INFO``."""
+    return _LEVEL_CANON.get(level) or str(level).upper()
+
+
+def iter_jsonl(path: Union[str, Path]) -> Generator[Dict[str, Any], None, None]:
+    """Yield records from a JSONL file one at a time (bytes straight to orjson when available).
+
+    Blank, malformed and non-object lines are skipped; a missing file yields nothing.
+    """
+    p = Path(path)
+    if not p.exists():
         return
-    with path.open("r", encoding="utf-8") as f:
+    with p.open("rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if not line.strip():
                 continue
             try:
-                yield json.loads(line)
+                rec = _loads(line)
             except Exception:
                 continue
+            if isinstance(rec, dict):
+                yield rec
 
 
 def _normalize_entry(rec: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "ts": rec.get("ts"),
-        "level": (rec.get("level") or "").upper(),
+        "level": normalize_level(rec.get("level")),
         "code": rec.get("code") or "",
         "message": rec.get("message") or "",
         "ref": rec.get("ref"),
@@ -50,20 +80,23 @@ def _index_mapping_by_qname(mapped: Iterable[MappedCell]) -> Dict[str, List[Mapp
     return idx
 
 
-def ingest_jsonl(
-    jsonl_path: str,
-    dpm_sqlite: Optional[str] = None,
-    dpm_schema: str = "dpm35_10",
-    model_xbrl_path: Optional[str] = None,
-) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[str, List[Dict[str, Any]]]]:
-    """
-    Ingest Arelle JSONL logs, normalize fields, and optionally enrich with DPM-mapped cells.
-    Returns: (messages, rollup, grouped_by_file)
-    """
-    p = Path(jsonl_path)
-    raw_entries = list(_stream_jsonl(p))
-    msgs = [_normalize_entry(e) for e in raw_entries]
+def _mapped_cell_payload(mc: MappedCell) -> Dict[str, Any]:
+    return {
+        "template_id": mc.template_id,
+        "table_id": mc.table_id,
+        "table_version": mc.table_version,
+        "cell_id": mc.cell_id,
+        "axes": mc.axes,
+        "concept": mc.concept,
+        "period": mc.period,
+        "unit": mc.unit,
+    }
+
 
+def _mapped_cell_index(
+    dpm_sqlite: Optional[str], dpm_schema: str, model_xbrl_path: Optional[str]
+) -> Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Map qname -> (mappedCell payload, mapped-sample row) for the instance; empty without DPM inputs."""
     # Optional deterministic mapping
     mapping_idx: Dict[str, List[MappedCell]] = {}
     if dpm_sqlite and model_xbrl_path:
@@ -80,79 +113,132 @@ def ingest_jsonl(
                 mapping_idx = _index_mapping_by_qname(mapped)
         except Exception:
             mapping_idx = {}
+    # First mapped cell per qname, built once and shared (read-only) by every message on that qname,
+    # together with its preview row for the mapped sample
+    cell_by_qname: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+    for qn, cells in mapping_idx.items():
+        if cells:
+            mc = cells[0]
+            cell_by_qname[qn] = (
+                _mapped_cell_payload(mc),
+                {"concept": mc.concept or qn, "template": mc.template_id, "table": mc.table_id, "cell": mc.cell_id},
+            )
+    return cell_by_qname
+
 
-    # Attach first matching mapped cell by qname
-    for m in msgs:
-        qn = m.get("modelObjectQname") or ""
-        if qn and qn in mapping_idx and mapping_idx[qn]:
-            mc = mapping_idx[qn][0]
-            m["mappedCell"] = {
-                "template_id": mc.template_id,
-                "table_id": mc.table_id,
-                "table_version": mc.table_version,
-                "cell_id": mc.cell_id,
-                "axes": mc.axes,
-                "concept": mc.concept,
-                "period": mc.period,
-                "unit": mc.unit,
-            }
-
-    # Rollups
+def ingest_jsonl(
+    jsonl_path: str,
+    dpm_sqlite: Optional[str] = None,
+    dpm_schema: str = "dpm35_10",
+    model_xbrl_path: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Ingest Arelle JSONL logs, normalize fields, and optionally enrich with DPM-mapped cells.
+    The log is streamed once; normalization, mapping, rollups and grouping share that pass.
+    ``rollup["mappedSample"]`` holds up to ``MAPPED_SAMPLE_SIZE`` mapped cells for previews.
+    Returns: (messages, rollup, grouped_by_file)
+    """
+    cell_by_qname = _mapped_cell_index(dpm_sqlite, dpm_schema, model_xbrl_path)
+
+    msgs: List[Dict[str, Any]] = []
     by_sev: Dict[str, int] = {}
     by_code: Dict[str, int] = {}
-    for m in msgs:
-        sev = m["level"] or "INFO"
+    by_file: Dict[str, List[Dict[str, Any]]] = {}
+    mapped_sample: List[Dict[str, Any]] = []
+    for rec in iter_jsonl(jsonl_path):
+        m = _normalize_entry(rec)
+        # Attach first matching mapped cell by qname
+        qn = m["modelObjectQname"]
+        hit = cell_by_qname.get(qn) if qn and cell_by_qname else None
+        if hit is not None:
+            m["mappedCell"], row = hit
+            if len(mapped_sample) < MAPPED_SAMPLE_SIZE:
+                mapped_sample.append(row)
+        msgs.append(m)
+        # Rollups
+        sev = m["level"]
         by_sev[sev] = by_sev.get(sev, 0) + 1
-        code = m["code"] or ""
+        code = m["code"]
         if code:
             by_code[code] = by_code.get(code, 0) + 1
+        # Grouped by file
+        by_file.setdefault(m.get("docUri") or "(unknown)", []).append(m)
+
     rollup = {
         "total": len(msgs),
         "bySeverity": by_sev,
         "byCode": dict(sorted(by_code.items(), key=lambda kv: kv[1], reverse=True)),
+        "mappedSample": mapped_sample,
     }
+    return msgs, rollup, by_file
 
-    # Grouped by file
-    by_file: Dict[str, List[Dict[str, Any]]] = {}
-    for m in msgs:
-        doc = m.get("docUri") or "(unknown)"
-        by_file.setdefault(doc, []).append(m)
 
-    return msgs, rollup, by_file
+def iter_ingest_batches(
+    jsonl_path: Union[str, Path],
+    dpm_sqlite: Optional[str] = None,
+    dpm_schema: str = "dpm35_10",
+    model_xbrl_path: Optional[str] = None,
+    batch_size: int = 512,
+) -> Generator[List[Dict[str, Any]], None, None]:
+    """Yield the messages ``ingest_jsonl`` would return, normalized and mapped, in lists of ``batch_size``
+    as the log is read, for callers that show results before the whole log is parsed (no rollups).
+    """
+    cell_by_qname = _mapped_cell_index(dpm_sqlite, dpm_schema, model_xbrl_path)
+    batch: List[Dict[str, Any]] = []
+    for rec in iter_jsonl(jsonl_path):
+        m = _normalize_entry(rec)
+        qn = m["modelObjectQname"]
+        hit = cell_by_qname.get(qn) if qn and cell_by_qname else None
+        if hit is not None:
+            m["mappedCell"] = hit[0]
+        batch.append(m)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 
+_MESSAGE_CSV_FIELDS = [
+    "ts",
+    "level",
+    "code",
+    "message",
+    "docUri",
+    "line",
+    "col",
+    "modelObjectQname",
+    "assertionId",
+    "assertionSeverity",
+]
 
-def write_validation_messages_csv(messages: Iterable[Dict[str, Any]], out_path: str) -> None:
+
+def write_validation_messages_csv(messages: Iterable[Dict[str, Any]], out_path: Union[str, Path], chunk_size: int = 50_000) -> None:
+    """Write messages as CSV, ``chunk_size`` rows per ``writerows`` call through a 1 MiB buffer."""
     path = Path(out_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(
-            f,
-            fieldnames=[
-                "ts",
-                "level",
-                "code",
-                "message",
-                "docUri",
-                "line",
-                "col",
-                "modelObjectQname",
-                "assertionId",
-                "assertionSeverity",
-            ],
-        )
-        w.writeheader()
-        for m in messages:
-            w.writerow({k: m.get(k) for k in w.fieldnames})
-
-
-def write_results_by_file_json(grouped: Dict[str, List[Dict[str, Any]]], out_path: str) -> None:
+    rows = ([m.get(k) for k in _MESSAGE_CSV_FIELDS] for m in messages)
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(_MESSAGE_CSV_FIELDS)
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            w.writerows(chunk)
+
+
+def write_results_by_file_json(grouped: Dict[str, List[Dict[str, Any]]], out_path: Union[str, Path]) -> None:
     path = Path(out_path)
     path.parent.mkdir(parents=True, exist_ok=True)
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(grouped, option=orjson.OPT_INDENT_2, default=str))
+        return
     with path.open("w", encoding="utf-8") as f:
         json.dump(grouped, f, ensure_ascii=False, indent=2)
 
 
-def write_formula_rollup_csv(messages: Iterable[Dict[str, Any]], out_path: str) -> None:
+def write_formula_rollup_csv(messages: Iterable[Dict[str, Any]], out_path: Union[str, Path]) -> None:
     counts: Dict[Tuple[str, str], int] = {}
     for m in messages:
         a = m.get("assertionId") or ""
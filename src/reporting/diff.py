@@ -1,25 +1,12 @@
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Dict, Any, List, Tuple
-import json
+
+from src.pipeline import iter_jsonl
 
 
 def _load_jsonl(path: str) -> List[Dict[str, Any]]:
-    p = Path(path)
-    if not p.exists():
-        return []
-    out: List[Dict[str, Any]] = []
-    with p.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                out.append(json.loads(line))
-            except Exception:
-                continue
-    return out
+    return list(iter_jsonl(path))
 
 
 def diff_runs(baseline_path: str, current_path: str) -> Dict[str, Any]:
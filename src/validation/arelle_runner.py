@@ -2,21 +2,39 @@ from __future__ import annotations
 
 import json
 import logging
+import multiprocessing
 import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 
 from xbrl_validator.results_parser import parse_arelle_text_output
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _jsonl_line(payload: Dict) -> bytes:
+    """One JSONL record as UTF-8 bytes; non-JSON values are stringified rather than dropped."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=str) + b"\n"
+    return (json.dumps(payload, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
 class _JsonlHandler(logging.Handler):
     def __init__(self, path: str) -> None:
         super().__init__(level=logging.INFO)
         self.path = path
         Path(self.path).parent.mkdir(parents=True, exist_ok=True)
-        self._fh = open(self.path, "a", encoding="utf-8")
+        self._fh = open(self.path, "ab")
 
     def emit(self, record: logging.LogRecord) -> None:  # type: ignore[override]
         try:
@@ -38,7 +56,7 @@ class _JsonlHandler(logging.Handler):
                 "assertionSeverity": getattr(record, "assertionSeverity", None),
                 "dimensionInfo": getattr(record, "dimensionInfo", None),
             }
-            self._fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            self._fh.write(_jsonl_line(payload))
             self._fh.flush()
         except Exception:
             # Never raise on logging
@@ -180,13 +198,12 @@ def _run_subprocess_validation(
         formula_sat = 0
         formula_unsat = 0
         
-        with path.open("r", encoding="utf-8") as fh:
+        with path.open("rb") as fh:
             for line in fh:
-                line = line.strip()
-                if not line:
+                if not line.strip():
                     continue
                 try:
-                    rec = json.loads(line)
+                    rec = _loads(line)
                 except Exception:
                     continue
                 summary["total"] += 1
@@ -242,7 +259,7 @@ def _run_subprocess_validation(
         if issues:
             try:
                 path.parent.mkdir(parents=True, exist_ok=True)
-                with path.open("a", encoding="utf-8") as fh:
+                with path.open("ab") as fh:
                     for i in issues:
                         payload = {
                             "level": i.severity,
@@ -251,7 +268,7 @@ def _run_subprocess_validation(
                             "docUri": i.file_path,
                             "modelObjectQname": i.fact_qname,
                         }
-                        fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
+                        fh.write(_jsonl_line(payload))
                 # Recompute summary quickly from issues
                 level_counts: Dict[str, int] = {}
                 code_counts: Dict[str, int] = {}
@@ -352,13 +369,12 @@ def run_validation(
 
     path = Path(log_jsonl_path)
     if path.exists():
-        with path.open("r", encoding="utf-8") as fh:
+        with path.open("rb") as fh:
             for line in fh:
-                line = line.strip()
-                if not line:
+                if not line.strip():
                     continue
                 try:
-                    rec = json.loads(line)
+                    rec = _loads(line)
                 except Exception:
                     continue
                 summary["total"] += 1
@@ -387,6 +403,86 @@ def run_validation(
     return summary
 
 
+def _warm_worker() -> None:
+    """Pool initializer: import Arelle and its formula plugin once per worker process."""
+    try:
+        import arelle.CntlrCmdLine  # type: ignore  # noqa: F401
+        import arelle.plugin.formulaLoader  # type: ignore  # noqa: F401
+    except Exception:
+        pass
+
+
+def _noop() -> None:
+    return None
+
+
+class ArelleWorkerPool:
+    """Persistent spawn-context worker processes for in-process Arelle runs.
+
+    Each worker imports Arelle once and then serves ``submit_call`` calls (``run_validation``),
+    so jobs after the first skip interpreter start-up and Arelle/plugin imports. Separate
+    processes also keep concurrent runs from sharing ``sys.argv`` and the ``arelle`` logger
+    handlers.
+    Arelle does not share a loaded DTS between model loads, so taxonomy parsing itself is
+    still done per run.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker,
+                )
+            return self._executor
+
+    def submit_call(self, fn, *args, **kwargs) -> Future:
+        """Schedule a picklable (module-level) callable on a worker."""
+        return self._get_executor().submit(fn, *args, **kwargs)
+
+    def warm(self) -> None:
+        """Start all worker processes (and their Arelle imports) now rather than on first use."""
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_noop)
+
+    def reset(self) -> None:
+        """Drop a broken executor; the next submit starts fresh workers."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def shutdown(self) -> None:
+        self.reset()
+
+
+_worker_pool: Optional[ArelleWorkerPool] = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> Optional[ArelleWorkerPool]:
+    """Shared worker pool, sized by ``XBRL_ARELLE_WORKERS`` (0 disables it and returns None)."""
+    global _worker_pool
+    raw = os.environ.get("XBRL_ARELLE_WORKERS", "").strip()
+    if raw == "0":
+        return None
+    try:
+        n = int(raw) if raw else None
+    except ValueError:
+        n = None
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = ArelleWorkerPool(max_workers=n)
+        return _worker_pool
+
+
 def run_batch_validation_parallel(
     input_paths: List[str],
     taxonomy_paths: List[str],
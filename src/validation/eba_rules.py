@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 import json
 
@@ -1051,7 +1051,7 @@ def apply_eba_rules(
     return extra, coverage
 
 
-def write_rules_coverage_csv(coverage: Dict[str, Any], out_path: str) -> None:
+def write_rules_coverage_csv(coverage: Dict[str, Any], out_path: Union[str, Path]) -> None:
     try:
         import csv
         from pathlib import Path as _P
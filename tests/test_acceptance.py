@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.acceptance import assert_deterministic, load_jsonl
+
+
+def _write(path: Path, records) -> Path:
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+    return path
+
+
+def _records(ts: str, n: int = 30):
+    return [
+        {"ts": ts, "level": "ERROR", "code": f"eba_v{i % 4}", "docUri": "a.xbrl", "line": i, "col": 1}
+        for i in range(n)
+    ]
+
+
+def test_matching_logs_pass_despite_timestamps_and_order(tmp_path: Path):
+    cur = _write(tmp_path / "cur.jsonl", _records("2024-01-02T10:00:00"))
+    exp = _write(tmp_path / "exp.jsonl", list(reversed(_records("2023-12-31T08:00:00"))))
+
+    cur_rows, exp_rows = assert_deterministic(cur, exp)
+    assert len(cur_rows) == len(exp_rows) == 30
+    assert cur_rows[0]["ts"] == "2024-01-02T10:00:00"
+
+
+def test_field_check_compares_positions_in_order(tmp_path: Path):
+    cur = _write(tmp_path / "cur.jsonl", _records("t1"))
+    same = _write(tmp_path / "same.jsonl", _records("t2"))
+    reordered = _write(tmp_path / "reordered.jsonl", list(reversed(_records("t2"))))
+
+    assert_deterministic(cur, same, check_fields=True)
+    with pytest.raises(AssertionError, match="signature differs"):
+        assert_deterministic(cur, reordered, check_fields=True)
+
+
+def test_mismatching_logs_fail(tmp_path: Path):
+    cur = _write(tmp_path / "cur.jsonl", _records("t1"))
+    shorter = _write(tmp_path / "shorter.jsonl", _records("t1", n=29))
+    with pytest.raises(AssertionError, match="message count differs: 30 != 29"):
+        assert_deterministic(cur, shorter)
+
+    other = _records("t1")
+    for r in other[:10]:
+        r["code"] = "eba_new"
+    other_codes = _write(tmp_path / "other.jsonl", other)
+    with pytest.raises(AssertionError, match="top codes histogram differs"):
+        assert_deterministic(cur, other_codes)
+    # Ignoring the codes that differ makes the histograms comparable again
+    assert_deterministic(cur, other_codes, ignore_codes={"eba_new", "eba_v0", "eba_v1", "eba_v2", "eba_v3"})
+
+
+def test_missing_logs_compare_as_empty(tmp_path: Path):
+    assert assert_deterministic(tmp_path / "a.jsonl", tmp_path / "b.jsonl") == ((), ())
+    with pytest.raises(AssertionError):
+        assert_deterministic(_write(tmp_path / "c.jsonl", _records("t")), tmp_path / "b.jsonl")
+
+
+def test_load_jsonl_skips_bad_lines_and_spans_chunks(tmp_path: Path):
+    big = "x" * 700_000
+    path = tmp_path / "log.jsonl"
+    path.write_bytes(
+        b'{"code": "A", "pad": "' + big.encode() + b'"}\n'
+        b"\n   \nnot json\n"
+        b'{"code": "B", "pad": "' + big.encode() + b'"}\r\n'
+        b'{"code": "C"}'
+    )
+    assert [r["code"] for r in load_jsonl(path)] == ["A", "B", "C"]
+    assert load_jsonl(path) is load_jsonl(path)
+
+    path.write_text('{"code": "D"}\n', encoding="utf-8")
+    assert [r["code"] for r in load_jsonl(path)] == ["D"]
+
+
+def test_build_cases_rejects_duplicate_names(tmp_path: Path):
+    from scripts.acceptance import build_cases
+
+    runs = [
+        {"path": str(tmp_path / "a" / "inst.xbrl"), "eba_version": "3.5", "jsonl": "a.jsonl"},
+        {"path": str(tmp_path / "b" / "other.xbrl"), "eba_version": 3.4, "jsonl": "b.jsonl"},
+    ]
+    cases = build_cases(runs)
+    assert [(c.name, c.eba_version) for c in cases] == [("inst", "3.5"), ("other", "3.4")]
+
+    runs.append({"path": str(tmp_path / "c" / "inst.xbrl"), "eba_version": "3.5", "jsonl": "c.jsonl"})
+    with pytest.raises(ValueError, match="duplicate case name 'inst'"):
+        build_cases(runs)
@@ -0,0 +1,114 @@
+import csv
+import json
+from pathlib import Path
+
+from scripts.altova_diff import ValidationDiff, ValidationMessage, ValidationResultLoader
+
+
+def _write_csv(path: Path, header, rows) -> Path:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        w.writerows(rows)
+    return path
+
+
+def _fields(msgs):
+    return [(m.level, m.code, m.message, m.file_path, m.line, m.column, m.element) for m in msgs]
+
+
+def test_load_altova_csv_uses_first_non_empty_column(tmp_path: Path):
+    header = ["Severity", "Level", "ErrorCode", "Code", "Description", "Uri", "Line", "Column", "QName"]
+    rows = [
+        ["", "warning", "E1", "", "First", "x.xbrl", "4", "9", "q:a"],
+        ["Error", "info", "E2", "C2", "Second", "", "", "", ""],
+    ]
+    msgs = ValidationResultLoader.load_altova_csv(str(_write_csv(tmp_path / "altova.csv", header, rows)))
+    assert _fields(msgs) == [
+        ("WARNING", "E1", "First", "x.xbrl", 4, 9, "q:a"),
+        ("ERROR", "C2", "Second", "", None, None, ""),
+    ]
+
+
+def test_load_altova_csv_missing_file_is_empty(tmp_path: Path, capsys):
+    assert ValidationResultLoader.load_altova_csv(str(tmp_path / "missing.csv")) == []
+    assert "Error loading Altova CSV" in capsys.readouterr().out
+
+
+def test_load_our_csv_matches_dictreader(tmp_path: Path):
+    header = ["ts", "level", "code", "message", "docUri", "line", "col", "modelObjectQname"]
+    rows = [
+        ["t", "error", " eba_v1 ", "Value  is\nmissing", "a.xbrl", "12", "3", "eba_met:mi1"],
+        [],
+        ["t", "WARNING", "eba_v2", "Other", "b.xbrl", "x", "", "eba_met:mi2"],
+        ["t", "", "", "", "", "", "", ""],
+    ]
+    path = _write_csv(tmp_path / "ours.csv", header, rows)
+    with path.open("a", encoding="utf-8", newline="") as f:
+        f.write("t,info,eba_v3\n")  # short row
+
+    expected = []
+    with path.open(encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            line, col = row.get("line") or "", row.get("col") or ""
+            expected.append(ValidationMessage(
+                level=row.get("level") or "", code=row.get("code") or "", message=row.get("message") or "",
+                file_path=row.get("docUri") or "", line=int(line) if line.isdigit() else None,
+                column=int(col) if col.isdigit() else None, element=row.get("modelObjectQname") or "",
+            ))
+    msgs = ValidationResultLoader.load_our_csv(str(path))
+    assert _fields(msgs) == _fields(expected)
+    assert _fields(msgs)[0] == ("ERROR", "eba_v1", "Value is missing", "a.xbrl", 12, 3, "eba_met:mi1")
+    assert msgs[2].level == "UNKNOWN"
+    assert msgs[3].code == "eba_v3" and msgs[3].file_path == ""
+
+
+def test_load_altova_json_shapes(tmp_path: Path):
+    items = [
+        {"severity": "error", "code": "E1", "message": "One", "file": "a.xbrl", "line": 1, "column": 2, "element": "q:a"},
+        {"type": "warning", "errorCode": "E2", "text": "Two"},
+        "not a message",
+    ]
+    as_list = tmp_path / "list.json"
+    as_list.write_text(json.dumps(items), encoding="utf-8")
+    as_dict = tmp_path / "dict.json"
+    as_dict.write_text(json.dumps({"results": items}), encoding="utf-8")
+
+    for path in (as_list, as_dict):
+        msgs = ValidationResultLoader.load_altova_json(str(path))
+        assert _fields(msgs) == [
+            ("ERROR", "E1", "One", "a.xbrl", 1, 2, "q:a"),
+            ("WARNING", "E2", "Two", "", None, None, ""),
+        ]
+
+
+def _sample_diff():
+    ours = [
+        ValidationMessage("error", "E1", "Same message"),
+        ValidationMessage("ERROR", "E1", "Same   message"),
+        ValidationMessage("warning", "W1", "Only ours"),
+    ]
+    theirs = [
+        ValidationMessage("ERROR", "E1", "Same message"),
+        ValidationMessage("info", "I1", "Only Altova"),
+    ]
+    return ValidationDiff(ours, theirs)
+
+
+def test_validation_diff_analyze_counts():
+    analysis = _sample_diff().analyze()
+    assert analysis["our_total"] == 3
+    assert analysis["altova_total"] == 2
+    assert analysis["common_messages"] == 1
+    assert analysis["our_unique"] == 1
+    assert analysis["altova_unique"] == 1
+    assert analysis["our_by_level"] == {"ERROR": 2, "WARNING": 1}
+    assert analysis["altova_top_codes"] == {"E1": 1, "I1": 1}
+    assert analysis["similarity_score"] == 2 * 1 / 5
+    assert ValidationDiff([], []).analyze()["similarity_score"] == 1.0
+
+
+def test_validation_diff_unique_messages():
+    diff = _sample_diff()
+    assert [m.code for m in diff.get_unique_messages()] == ["W1"]
+    assert [m.code for m in diff.get_unique_messages(ours_only=False)] == ["I1"]
@@ -0,0 +1,334 @@
+import asyncio
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    # Importing the server creates ./exports; keep that out of the checkout
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("api"))
+    try:
+        import api.server as server
+    finally:
+        os.chdir(cwd)
+    return server
+
+
+@pytest.fixture(scope="module")
+def client(server):
+    from fastapi.testclient import TestClient
+
+    # No lifespan: the tests don't need the Arelle worker pool
+    return TestClient(server.app)
+
+
+def _job_with_log(server, log_path: Path) -> str:
+    job_id = str(uuid.uuid4())
+    asyncio.run(server.job_store.create(job_id, {"job_id": job_id, "status": "completed", "log_path": str(log_path)}))
+    return job_id
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-", (0, 9)),
+        ("bytes=2-4", (2, 4)),
+        ("bytes=5-100", (5, 9)),
+        ("bytes=-3", (7, 9)),
+        ("bytes=-100", (0, 9)),
+        (" bytes=1-1 ", (1, 1)),
+        ("bytes=10-", None),
+        ("bytes=10-20", None),
+        ("bytes=-0", None),
+        ("bytes=4-2", None),
+        ("bytes=0-1,3-4", None),
+        ("bytes=-", None),
+        ("bytes=a-b", None),
+        ("items=0-1", None),
+        ("", None),
+    ],
+)
+def test_parse_byte_range(server, header, expected):
+    assert server._parse_byte_range(header, 10) == expected
+
+
+def test_parse_byte_range_empty_file(server):
+    assert server._parse_byte_range("bytes=0-", 0) is None
+
+
+def test_log_range_requests(server, client, tmp_path):
+    log = tmp_path / "run.jsonl"
+    data = b"".join(b'{"i": %d}\n' % i for i in range(100))
+    log.write_bytes(data)
+    job_id = _job_with_log(server, log)
+    url = f"/jobs/{job_id}/log"
+
+    r = client.get(url)
+    assert r.status_code == 200
+    assert r.headers["accept-ranges"] == "bytes"
+    assert r.content == data
+
+    r = client.get(url, headers={"Range": "bytes=0-"})
+    assert r.status_code == 206
+    assert r.headers["content-range"] == f"bytes 0-{len(data) - 1}/{len(data)}"
+    assert r.content == data
+
+    r = client.get(url, headers={"Range": "bytes=-9"})
+    assert r.status_code == 206
+    assert r.headers["content-range"] == f"bytes {len(data) - 9}-{len(data) - 1}/{len(data)}"
+    assert r.content == data[-9:]
+
+    r = client.get(url, headers={"Range": "bytes=9-17"})
+    assert r.status_code == 206
+    assert r.headers["content-length"] == "9"
+    assert r.content == data[9:18]
+
+    for bad in (f"bytes={len(data)}-", "bytes=0-1,5-6", "bytes=x-y", "lines=0-1"):
+        r = client.get(url, headers={"Range": bad})
+        assert r.status_code == 416, bad
+        assert r.headers["content-range"] == f"bytes */{len(data)}"
+
+    r = client.get(url, params={"format": "json"})
+    assert r.status_code == 200
+    assert r.json()["content"] == data.decode("utf-8")
+
+
+def test_log_missing_job_or_file(server, client, tmp_path):
+    assert client.get(f"/jobs/{uuid.uuid4()}/log").status_code == 404
+    job_id = _job_with_log(server, tmp_path / "missing.jsonl")
+    assert client.get(f"/jobs/{job_id}/log").status_code == 404
+
+
+@pytest.fixture
+def exports(server, tmp_path):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    app.mount("/exports", server.ExportFiles(directory=str(tmp_path)), name="exports")
+    return tmp_path, TestClient(app)
+
+
+def test_export_etag_and_not_modified(exports):
+    root, client = exports
+    (root / "report.csv").write_text("a,b\n1,2\n", encoding="utf-8")
+
+    r = client.get("/exports/report.csv", headers={"Accept-Encoding": "identity"})
+    assert r.status_code == 200
+    assert r.text == "a,b\n1,2\n"
+    etag = r.headers["etag"]
+    assert r.headers["cache-control"] == "public, max-age=3600"
+
+    r = client.get("/exports/report.csv", headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert r.status_code == 304
+
+    (root / "report.csv").write_text("a,b\n3,4\n", encoding="utf-8")
+    r = client.get("/exports/report.csv", headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+
+
+def test_export_precompressed_companion_follows_accept_encoding(server, exports):
+    import gzip
+
+    root, client = exports
+    body = "code,count\n" + "".join(f"C{i},{i}\n" for i in range(200))
+    (root / "messages.csv").write_text(body, encoding="utf-8")
+    (root / "messages.csv.gz").write_bytes(gzip.compress(body.encode("utf-8")))
+    (root / "messages.csv.br").write_bytes(b"not really brotli")
+
+    r = client.get("/exports/messages.csv", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["content-type"].startswith("text/csv")
+    assert r.headers["vary"] == "Accept-Encoding"
+    assert r.text == body
+
+    r = client.head("/exports/messages.csv", headers={"Accept-Encoding": "gzip, br"})
+    assert r.headers["content-encoding"] == "br"
+    assert r.headers["content-length"] == str(len(b"not really brotli"))
+
+    r = client.head("/exports/messages.csv", headers={"Accept-Encoding": "br;q=0, gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+
+    r = client.get("/exports/messages.csv", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in r.headers
+    assert r.text == body
+
+
+def test_export_stale_companion_is_not_served(server, exports):
+    root, client = exports
+    src = root / "results.json"
+    src.write_text('{"v": 1}', encoding="utf-8")
+    server._precompress_exports(root)
+    companion = root / ("results.json.br" if server.BROTLI_AVAILABLE else "results.json.gz")
+    encoding = "br" if server.BROTLI_AVAILABLE else "gzip"
+    assert client.head("/exports/results.json", headers={"Accept-Encoding": encoding}).headers["content-encoding"] == encoding
+
+    # Rewrite the export without recompressing it
+    src.write_text('{"v": 2}', encoding="utf-8")
+    st = src.stat()
+    os.utime(companion, ns=(st.st_atime_ns, st.st_mtime_ns - 1_000_000_000))
+    r = client.get("/exports/results.json", headers={"Accept-Encoding": encoding})
+    assert "content-encoding" not in r.headers
+    assert r.json() == {"v": 2}
+
+    server._precompress_exports(root)
+    r = client.get("/exports/results.json", headers={"Accept-Encoding": encoding})
+    assert r.headers["content-encoding"] == encoding
+    assert r.json() == {"v": 2}
+
+
+def test_jsonl_reader_waits_for_complete_lines(server, tmp_path):
+    log = tmp_path / "live.jsonl"
+    reader = server._JsonlReader(log)
+    try:
+        assert reader.read_new() == []
+
+        with log.open("ab") as f:
+            f.write(b'{"code": "A", "level": "error"}\n{"code": "B", "le')
+        assert reader.read_new() == [{"code": "A", "level": "error"}]
+        assert reader.read_new() == []
+
+        with log.open("ab") as f:
+            f.write(b'vel": "warning"}\n')
+        assert reader.read_new() == [{"code": "B", "level": "warning"}]
+        assert reader.read_new() == []
+
+        with log.open("ab") as f:
+            f.write(b'\n  {"code": "C"}\nnot json\n{"broken": \n')
+        assert reader.read_new() == [{"code": "C"}]
+        assert [r["code"] for r in reader.records] == ["A", "B", "C"]
+    finally:
+        reader.close()
+
+
+def _sse_data(body: str):
+    import json
+
+    events, data = [], []
+    for line in body.split("\n"):
+        if line.startswith("event: "):
+            events.append(line[len("event: "):])
+        elif line.startswith("data: "):
+            data.append(json.loads(line[len("data: "):]))
+    return events, data
+
+
+def test_workflow_events_replay_and_end_of_stream(server, client):
+    job_id = str(uuid.uuid4())
+    published = [
+        {"event": "step", "name": "Validation", "status": "running"},
+        {"event": "logs", "phase": "validation", "entries": [{"code": "A"}, {"code": "B"}]},
+        {"event": "step", "name": "Validation", "status": "completed"},
+    ]
+
+    async def setup():
+        await server.job_store.create(job_id, {"job_id": job_id, "status": "completed"})
+        await server.job_store.publish_many(job_id, published + [None])
+
+    asyncio.run(setup())
+    r = client.get(f"/workflow/{job_id}/events")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+    events, data = _sse_data(r.text)
+    assert events == ["ping"]
+    assert data == [{}] + published
+    assert client.get(f"/workflow/{uuid.uuid4()}/events").status_code == 404
+
+
+def _tail_events(server, log: Path, write_late=None):
+    """Run _tail_jsonl over ``log`` for a moment, optionally write more right before stopping it."""
+
+    async def scenario():
+        queue: asyncio.Queue = asyncio.Queue()
+        reader = server._JsonlReader(log)
+        task = asyncio.create_task(server._tail_jsonl(reader, queue, asyncio.Event(), tag="validation"))
+        await asyncio.sleep(0.5)
+        if write_late is not None:
+            write_late()
+        await server._stop_task(task)
+        reader.close()
+        return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    return asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("use_watchfiles", [True, False])
+def test_tail_jsonl_batches_records_into_logs_events(server, tmp_path, monkeypatch, use_watchfiles):
+    import json
+
+    if use_watchfiles and not server.WATCHFILES_AVAILABLE:
+        pytest.skip("watchfiles not installed")
+    monkeypatch.setattr(server, "WATCHFILES_AVAILABLE", use_watchfiles)
+
+    log = tmp_path / "run.jsonl"
+    n = server._LOG_BATCH * 2 + 7
+    log.write_text("".join(json.dumps({"i": i}) + "\n" for i in range(n)), encoding="utf-8")
+
+    events = _tail_events(server, log)
+    assert {e["event"] for e in events} == {"logs"}
+    assert {e["phase"] for e in events} == {"validation"}
+    assert [len(e["entries"]) for e in events] == [server._LOG_BATCH, server._LOG_BATCH, 7]
+    assert [r["i"] for e in events for r in e["entries"]] == list(range(n))
+
+
+def test_tail_jsonl_flushes_records_written_just_before_stop(server, tmp_path, monkeypatch):
+    # Polling every 250ms: the line completed right before the stop is not picked up by a poll
+    monkeypatch.setattr(server, "WATCHFILES_AVAILABLE", False)
+    log = tmp_path / "run.jsonl"
+    log.write_bytes(b'{"i": 0}\n{"i": ')
+
+    def finish_line():
+        with log.open("ab") as f:
+            f.write(b'1}\n{"i": 2}\n')
+
+    events = _tail_events(server, log, write_late=finish_line)
+    assert [r["i"] for e in events for r in e["entries"]] == [0, 1, 2]
+
+
+def test_workflow_cancel_sets_the_store_flag(server, client):
+    job_id = str(uuid.uuid4())
+    asyncio.run(server.job_store.create(job_id, {"job_id": job_id, "status": "running"}))
+
+    assert client.post(f"/workflow/{job_id}/cancel").json() == {"ok": True}
+    assert asyncio.run(server.job_store.is_cancelled(job_id))
+    assert asyncio.run(server.job_store.get(job_id))["status"] == "cancelled"
+    assert client.post(f"/workflow/{uuid.uuid4()}/cancel").status_code == 404
+
+
+def test_arelle_worker_death_fails_the_run_instead_of_rerunning_it(server, monkeypatch):
+    from concurrent.futures import Future
+    from concurrent.futures.process import BrokenProcessPool
+
+    import src.validation.arelle_runner as arelle_runner
+
+    class DeadPool:
+        resets = 0
+
+        def submit_call(self, fn, *args, **kwargs):
+            fut: Future = Future()
+            fut.set_exception(BrokenProcessPool("worker died"))
+            return fut
+
+        def reset(self):
+            self.resets += 1
+
+    pool = DeadPool()
+    calls = []
+    monkeypatch.setattr(arelle_runner, "get_worker_pool", lambda: pool)
+    with pytest.raises(BrokenProcessPool):
+        asyncio.run(server._run_on_arelle_worker(calls.append, "run"))
+    # Not rerun on the thread pool: that would append to the same log a second time
+    assert calls == []
+    assert pool.resets == 1
+
+
+def test_run_validate_cli_returns_the_subprocess_exit_code(server):
+    # argparse rejects the flag and exits with 2
+    assert asyncio.run(server._run_validate_cli(["--bogus"], timeout=120)) == 2
@@ -0,0 +1,27 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src.validation.arelle_runner import ArelleWorkerPool
+
+
+def test_submit_call_runs_in_worker_process():
+    pool = ArelleWorkerPool(max_workers=1)
+    try:
+        assert pool.submit_call(os.getpid).result(timeout=60) != os.getpid()
+    finally:
+        pool.shutdown()
+
+
+def test_reset_recycles_a_pool_whose_worker_died():
+    pool = ArelleWorkerPool(max_workers=1)
+    try:
+        first_pid = pool.submit_call(os.getpid).result(timeout=60)
+        with pytest.raises(BrokenProcessPool):
+            pool.submit_call(os._exit, 3).result(timeout=60)
+        pool.reset()
+        # The next call gets a fresh worker
+        assert pool.submit_call(os.getpid).result(timeout=60) not in (first_pid, os.getpid())
+    finally:
+        pool.shutdown()
@@ -29,3 +29,96 @@ def test_cli_jsonl_exports(tmp_path: Path):
     assert (exports_dir / "validation_summary.pdf").exists()
 
 
+
+
+def _write_log(path: Path) -> None:
+    import json
+
+    levels = ["error", "ERROR", "warning", "Warning", "info", None, "", "fatal", "debug"]
+    lines = []
+    for i in range(1300):
+        rec = {
+            "ts": f"2024-01-01T00:00:{i % 60:02d}",
+            "code": f"code.{i % 7}" if i % 5 else "",
+            "message": f"message {i}",
+            "modelObjectQname": f"eba_met:mi{i % 11}" if i % 3 else None,
+            "docUri": f"file{i % 4}.xbrl" if i % 6 else None,
+            "line": i,
+        }
+        level = levels[i % len(levels)]
+        if level is not None:
+            rec["level"] = level
+        lines.append(json.dumps(rec))
+        if i % 250 == 0:
+            lines.extend(["", "not json", "[1, 2]"])
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _plain_ingest(path: Path, cells: dict):
+    """Reference ingest: stdlib json, one record at a time, no shortcuts."""
+    import json
+
+    msgs, by_sev, by_code, sample = [], {}, {}, []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            rec = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(rec, dict):
+            continue
+        level = (rec.get("level") or "INFO").upper()
+        by_sev[level] = by_sev.get(level, 0) + 1
+        if rec.get("code"):
+            by_code[rec["code"]] = by_code.get(rec["code"], 0) + 1
+        qn = rec.get("modelObjectQname")
+        msgs.append((level, rec.get("code") or "", rec.get("message"), qn, rec.get("line")))
+        if qn in cells and len(sample) < 8:
+            sample.append(cells[qn][1])
+    return msgs, by_sev, by_code, sample
+
+
+def _fake_cells(qnames):
+    return {
+        qn: ({"template_id": "T", "table_id": f"t{n}", "cell_id": f"c{n}"}, {"concept": qn, "template": "T", "table": f"t{n}", "cell": f"c{n}"})
+        for n, qn in enumerate(qnames)
+    }
+
+
+def test_ingest_rollup_and_batches_match_plain_ingest(tmp_path: Path, monkeypatch):
+    import importlib
+
+    # The package re-exports a function of the same name, so import the module itself
+    ingest_mod = importlib.import_module("src.pipeline.ingest_jsonl")
+    log = tmp_path / "run.jsonl"
+    _write_log(log)
+    cells = _fake_cells(["eba_met:mi1", "eba_met:mi5", "eba_met:mi7"])
+    monkeypatch.setattr(ingest_mod, "_mapped_cell_index", lambda *_args: cells)
+
+    msgs, rollup, by_file = ingest_mod.ingest_jsonl(str(log), dpm_sqlite="db", model_xbrl_path="x.xbrl")
+    plain, by_sev, by_code, sample = _plain_ingest(log, cells)
+
+    assert [(m["level"], m["code"], m["message"], m["modelObjectQname"], m["line"]) for m in msgs] == plain
+    assert rollup["total"] == len(plain)
+    assert rollup["bySeverity"] == by_sev
+    assert rollup["byCode"] == by_code
+    assert list(rollup["byCode"].values()) == sorted(by_code.values(), reverse=True)
+    assert rollup["mappedSample"] == sample
+    assert len(sample) == ingest_mod.MAPPED_SAMPLE_SIZE
+    for m in msgs:
+        hit = cells.get(m["modelObjectQname"])
+        assert m.get("mappedCell") == (hit[0] if hit else None)
+    assert sum(len(v) for v in by_file.values()) == len(msgs)
+    assert [m["line"] for m in by_file["(unknown)"]] == [m["line"] for m in msgs if not m["docUri"]]
+
+    batches = list(ingest_mod.iter_ingest_batches(str(log), dpm_sqlite="db", model_xbrl_path="x.xbrl", batch_size=512))
+    assert [len(b) for b in batches] == [512, 512, len(msgs) - 1024]
+    assert [m for b in batches for m in b] == msgs
+
+
+def test_ingest_missing_log_is_empty(tmp_path: Path):
+    from src.pipeline import ingest_jsonl, iter_ingest_batches
+
+    msgs, rollup, by_file = ingest_jsonl(str(tmp_path / "missing.jsonl"))
+    assert (msgs, by_file) == ([], {})
+    assert rollup == {"total": 0, "bySeverity": {}, "byCode": {}, "mappedSample": []}
+    assert list(iter_ingest_batches(tmp_path / "missing.jsonl")) == []
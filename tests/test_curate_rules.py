@@ -0,0 +1,16 @@
+import json
+from pathlib import Path
+
+import scripts.curate_rules as curate_rules
+
+
+def test_load_rules_returns_copies_of_cached_rules(tmp_path: Path, monkeypatch):
+    cache = tmp_path / "assets" / "cache" / "eba_rules_cache.json"
+    cache.parent.mkdir(parents=True)
+    cache.write_text(json.dumps({"rules": [{"id": "v1", "severity": "ERROR"}]}), encoding="utf-8")
+    monkeypatch.setattr(curate_rules, "BASE", tmp_path)
+
+    first = curate_rules.load_rules()
+    first[0]["severity"] = "INFO"
+    first.append({"id": "extra"})
+    assert curate_rules.load_rules() == [{"id": "v1", "severity": "ERROR"}]
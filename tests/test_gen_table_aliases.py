@@ -0,0 +1,66 @@
+import sqlite3
+from pathlib import Path
+
+import scripts.gen_table_aliases as gen_table_aliases
+
+
+def _aliases_per_row(sqlite_path: Path, schema_prefix: str) -> dict:
+    """The per-row Python loop build_aliases used before it moved into SQL."""
+    conn = sqlite3.connect(sqlite_path)
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute(
+        f"""
+        SELECT TV.tableversioncode, TV.tableversionlabel, TV.xbrltablecode,
+               T.templatecode, T.templatelabel
+        FROM {schema_prefix}_tableversion AS TV
+        LEFT JOIN {schema_prefix}_template AS T ON T.conceptid = TV.conceptid
+        """
+    ).fetchall()
+    conn.close()
+    aliases: dict = {}
+    for r in rows:
+        xbrl = (r["xbrltablecode"] or "").strip()
+        ver = (r["tableversioncode"] or "").strip()
+        templ = (r["templatecode"] or "").strip()
+        canonical = xbrl or ver
+        if not canonical:
+            continue
+        for k in (xbrl, xbrl.lower(), ver, ver.lower(), templ, templ.lower(), templ.replace(" ", "")):
+            if k and k not in aliases:
+                aliases[k] = canonical
+    return aliases
+
+
+def test_build_aliases_matches_the_per_row_loop(tmp_path: Path):
+    db = tmp_path / "dpm.sqlite"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE t_tableversion (conceptid INTEGER, tableversioncode TEXT, tableversionlabel TEXT, xbrltablecode TEXT)")
+    conn.execute("CREATE TABLE t_template (conceptid INTEGER, templatecode TEXT, templatelabel TEXT)")
+    conn.executemany(
+        "INSERT INTO t_tableversion VALUES (?, ?, ?, ?)",
+        [
+            (1, "C 01.00", "Own funds", "C_01.00"),
+            (2, " C 02.00\t", None, None),
+            (3, "\x0bF 01.01\xa0", None, " F_01.01\x1c"),
+            (4, None, None, None),
+            (5, "c_01.00", None, "C_99.00"),  # lower-case key already taken by row 1
+            (6, "", None, "  "),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO t_template VALUES (?, ?, ?)",
+        [(1, "C 01.00", None), (2, " C 02.00 ", None), (3, "F 01.01\x0c", None), (4, "Z 00.01", None), (6, "X 1", None)],
+    )
+    conn.commit()
+    conn.close()
+
+    expected = _aliases_per_row(db, "t")
+    aliases = gen_table_aliases.build_aliases(str(db), schema_prefix="t")["aliases"]
+    assert aliases == expected
+    assert list(aliases) == list(expected)
+    assert aliases["F 01.01"] == "F_01.01"
+    assert aliases["c_01.00"] == "C_01.00"
+
+
+def test_build_aliases_missing_database(tmp_path: Path):
+    assert gen_table_aliases.build_aliases(str(tmp_path / "absent.sqlite")) == {"aliases": {}}
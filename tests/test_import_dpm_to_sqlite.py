@@ -0,0 +1,58 @@
+import sqlite3
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import scripts.import_dpm_to_sqlite as import_dpm
+
+
+def _dpm_zip(tmp_path: Path) -> Path:
+    path = tmp_path / "dpm.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("TableVersion.csv", "TableVersionCode,XbrlTableCode\nC 01.00,C_01.00\nC 02.00,C_02.00\n")
+    return path
+
+
+def _existing_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE keep (v TEXT)")
+    conn.execute("INSERT INTO keep VALUES ('x')")
+    conn.commit()
+    conn.close()
+
+
+def _tables(path: Path) -> dict:
+    conn = sqlite3.connect(path)
+    try:
+        names = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")]
+        return {n: conn.execute(f'SELECT * FROM "{n}"').fetchall() for n in names}
+    finally:
+        conn.close()
+
+
+def test_import_adds_tables_to_an_existing_database(tmp_path: Path):
+    db = tmp_path / "dpm.sqlite"
+    _existing_db(db)
+    import_dpm.import_zip_to_sqlite(_dpm_zip(tmp_path), db, "dpm")
+    assert _tables(db) == {
+        "dpm_tableversion": [("C 01.00", "C_01.00"), ("C 02.00", "C_02.00")],
+        "keep": [("x",)],
+    }
+    assert not (tmp_path / "dpm.sqlite.importing").exists()
+
+
+def test_failed_import_leaves_the_existing_database_untouched(tmp_path: Path, monkeypatch):
+    db = tmp_path / "dpm.sqlite"
+    _existing_db(db)
+
+    def crash(conn, table, path):
+        conn.execute(f'CREATE TABLE "{table}" (v TEXT)')
+        raise RuntimeError("interrupted")
+
+    monkeypatch.setattr(import_dpm, "import_csv", crash)
+    with pytest.raises(RuntimeError):
+        import_dpm.import_zip_to_sqlite(_dpm_zip(tmp_path), db, "dpm")
+    assert _tables(db) == {"keep": [("x",)]}
+    assert not (tmp_path / "dpm.sqlite.importing").exists()
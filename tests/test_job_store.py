@@ -0,0 +1,212 @@
+import asyncio
+import time
+
+import pytest
+
+from api.job_store import InMemoryJobStore, RedisJobStore, put_event_nowait
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_create_get_update_list():
+    async def scenario():
+        store = InMemoryJobStore()
+        await store.create("a", {"status": "queued", "n": 1})
+        await store.create("b", {"status": "queued", "n": 2})
+        await store.update("a", status="running")
+        await store.update("missing", status="running")
+
+        job = await store.get("a")
+        assert job == {"status": "running", "n": 1}
+        job["status"] = "changed"
+        assert (await store.get("a"))["status"] == "running"
+        assert await store.get("missing") is None
+
+        assert await store.list() == [{"status": "running", "n": 1}, {"status": "queued", "n": 2}]
+        assert await store.list(offset=1, limit=1) == [{"status": "queued", "n": 2}]
+        assert await store.list(fields=["n", "absent"]) == [{"n": 1, "absent": None}, {"n": 2, "absent": None}]
+
+        await store.request_cancel("b")
+        assert await store.is_cancelled("b")
+        assert not await store.is_cancelled("a")
+
+    _run(scenario())
+
+
+def test_expired_jobs_are_pruned_on_create():
+    async def scenario():
+        store = InMemoryJobStore(ttl=60)
+        await store.create("old", {"status": "completed"})
+        store._created["old"] -= 120
+        await store.create("new", {"status": "queued"})
+        assert await store.get("old") is None
+        assert [j["status"] for j in await store.list()] == ["queued"]
+
+    _run(scenario())
+
+
+def test_backlog_keeps_status_events_but_caps_log_events():
+    async def scenario():
+        store = InMemoryJobStore(max_backlog_logs=2)
+        await store.create("j", {})
+        await store.publish("j", {"event": "step", "step": 1})
+        for i in range(5):
+            await store.publish("j", {"event": "logs", "i": i})
+        await store.publish("j", {"event": "status", "status": "completed"})
+        await store.publish("j", None)
+
+        sub = store.subscribe("j")
+        events = await sub.get_many(timeout=1, max_items=100)
+        await sub.close()
+        assert events == [
+            {"event": "step", "step": 1},
+            {"event": "logs", "i": 0},
+            {"event": "logs", "i": 1},
+            {"event": "status", "status": "completed"},
+            None,
+        ]
+
+    _run(scenario())
+
+
+def test_put_event_nowait_drops_logs_and_evicts_oldest_for_other_events():
+    async def scenario():
+        q: asyncio.Queue = asyncio.Queue(maxsize=2)
+        assert put_event_nowait(q, {"event": "step", "step": 1})
+        assert put_event_nowait(q, {"event": "log", "i": 0})
+        # Full: log events are dropped, the queue is unchanged
+        assert not put_event_nowait(q, {"event": "logs", "i": 1})
+        assert list(q._queue) == [{"event": "step", "step": 1}, {"event": "log", "i": 0}]
+        # Other events (and the end marker) evict the oldest item
+        assert put_event_nowait(q, {"event": "status", "status": "completed"})
+        assert put_event_nowait(q, None)
+        assert list(q._queue) == [{"event": "status", "status": "completed"}, None]
+
+    _run(scenario())
+
+
+def test_subscribe_replays_backlog_then_live_events_in_order():
+    async def scenario():
+        store = InMemoryJobStore()
+        await store.create("j", {})
+        await store.publish_many("j", [{"event": "step", "step": 1}, {"event": "logs", "i": 0}])
+
+        sub = store.subscribe("j")
+        await store.publish("j", {"event": "step", "step": 2})
+        await store.publish("j", None)
+
+        assert await sub.get(timeout=1) == {"event": "step", "step": 1}
+        assert await sub.get_many(timeout=1) == [{"event": "logs", "i": 0}, {"event": "step", "step": 2}, None]
+        with pytest.raises(asyncio.TimeoutError):
+            await sub.get(timeout=0.01)
+        await sub.close()
+        assert store._subscribers["j"] == []
+
+    _run(scenario())
+
+
+def test_get_many_stops_at_end_of_stream_and_max_items():
+    async def scenario():
+        store = InMemoryJobStore()
+        await store.create("j", {})
+        sub = store.subscribe("j")
+        await store.publish_many("j", [{"event": "logs", "i": i} for i in range(3)] + [None, {"event": "late"}])
+        assert await sub.get_many(timeout=1, max_items=2) == [{"event": "logs", "i": 0}, {"event": "logs", "i": 1}]
+        assert await sub.get_many(timeout=1) == [{"event": "logs", "i": 2}, None]
+        await sub.close()
+
+    _run(scenario())
+
+
+def _fake_redis_store(ttl: int = 60, **kwargs) -> RedisJobStore:
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("redis")
+    # from_url does not connect; the client is swapped for an in-process fake
+    store = RedisJobStore("redis://localhost:6379/0", ttl=ttl, **kwargs)
+    store.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return store
+
+
+def test_redis_list_prunes_expired_ids_and_skips_missing_hashes():
+    store = _fake_redis_store(ttl=60)
+
+    async def scenario():
+        await store.create("a", {"status": "completed"})
+        await store.create("b", {"status": "queued"})
+        # "a" indexed long ago; "gone" indexed but its hash has already expired
+        await store.redis.zadd("jobs", {"a": time.time() - 120, "gone": time.time()})
+        assert await store.list() == [{"status": "queued"}]
+        assert await store.redis.zrange("jobs", 0, -1) == ["b"]
+        assert await store.list(fields=["status"]) == [{"status": "queued"}]
+
+    _run(scenario())
+
+
+def test_redis_subscribe_replays_backlog_then_live_events():
+    store = _fake_redis_store()
+
+    async def scenario():
+        await store.create("j", {"status": "queued"})
+        await store.publish_many("j", [{"event": "step", "step": 1}, {"event": "logs", "i": 0}])
+        sub = store.subscribe("j")
+        assert await sub.get(timeout=1) == {"event": "step", "step": 1}
+        await store.publish("j", None)
+        events = await sub.get_many(timeout=1)
+        while events[-1] is not None:
+            events += await sub.get_many(timeout=1)
+        assert events == [{"event": "logs", "i": 0}, None]
+        await sub.close()
+
+    _run(scenario())
+
+
+def test_redis_backlog_caps_log_events_like_memory_store():
+    redis_store = _fake_redis_store(max_backlog_logs=2)
+    memory_store = InMemoryJobStore(max_backlog_logs=2)
+
+    async def replay(store):
+        await store.create("j", {"status": "running"})
+        await store.publish("j", {"event": "step", "step": 1})
+        await store.publish_many("j", [{"event": "logs", "i": i} for i in range(3)])
+        await store.publish_many("j", [{"event": "log", "i": 3}, {"event": "status", "status": "completed"}, None])
+        sub = store.subscribe("j")
+        events = [await sub.get(timeout=1)]
+        while events[-1] is not None:
+            events += await sub.get_many(timeout=1)
+        await sub.close()
+        return events
+
+    expected = [
+        {"event": "step", "step": 1},
+        {"event": "logs", "i": 0},
+        {"event": "logs", "i": 1},
+        {"event": "status", "status": "completed"},
+        None,
+    ]
+    assert _run(replay(memory_store)) == expected
+
+    async def redis_replay():
+        events = await replay(redis_store)
+        return events, await redis_store.redis.llen("job:j:backlog")
+
+    assert _run(redis_replay()) == (expected, 5)
+
+
+def test_redis_live_subscribers_get_log_events_beyond_the_backlog_cap():
+    store = _fake_redis_store(max_backlog_logs=1)
+
+    async def scenario():
+        await store.create("j", {"status": "running"})
+        await store.publish("j", {"event": "logs", "i": 0})
+        sub = store.subscribe("j")
+        assert await sub.get(timeout=1) == {"event": "logs", "i": 0}
+        await store.publish_many("j", [{"event": "logs", "i": i} for i in (1, 2)] + [None])
+        events = await sub.get_many(timeout=1)
+        while events[-1] is not None:
+            events += await sub.get_many(timeout=1)
+        await sub.close()
+        return events
+
+    assert _run(scenario()) == [{"event": "logs", "i": 1}, {"event": "logs", "i": 2}, None]
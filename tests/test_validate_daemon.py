@@ -0,0 +1,61 @@
+import io
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.validate_daemon import serve
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def test_serve_answers_one_line_per_request():
+    # Missing --file makes argparse exit before any validation, so Arelle isn't needed
+    inp = io.StringIO('{"argv": ["--out", "x.jsonl"]}\n\n{"nope": 1}\nnot json\n{"argv": []}\n')
+    out = io.StringIO()
+    serve(inp, out)
+    replies = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert replies[0] == {"returnCode": 2}
+    assert set(replies[1]) == {"error"}
+    assert set(replies[2]) == {"error"}
+    assert replies[3] == {"returnCode": 2}
+    assert len(replies) == 4
+
+
+def test_daemon_process_keeps_stdout_for_replies():
+    proc = subprocess.run(
+        [sys.executable, "-m", "app.validate_daemon"],
+        input='{"argv": ["--bogus"]}\n{"argv": ["--help"]}\n',
+        capture_output=True, text=True, cwd=str(PROJECT_ROOT), timeout=120,
+    )
+    assert proc.returncode == 0
+    # Usage/help text goes to devnull or stderr; stdout carries only the JSON replies
+    assert [json.loads(line) for line in proc.stdout.splitlines()] == [{"returnCode": 2}, {"returnCode": 0}]
+
+
+def test_gui_reuses_and_restarts_the_daemon(monkeypatch):
+    pytest.importorskip("tkinter")
+    from gui.xbrl_validator_app import XbrlValidatorGui as cls
+    monkeypatch.chdir(PROJECT_ROOT)
+
+    fake = SimpleNamespace(_daemon=None, _daemon_lock=threading.Lock())
+    fake._start_validate_daemon = lambda: cls._start_validate_daemon(fake)
+    try:
+        assert cls._daemon_validate(fake, ["--bogus"]) == 2
+        first = fake._daemon
+        assert cls._daemon_validate(fake, ["--bogus"]) == 2
+        assert fake._daemon is first
+
+        # A dead daemon is replaced on the next run
+        first.kill()
+        first.wait()
+        assert cls._daemon_validate(fake, ["--bogus"]) == 2
+        assert fake._daemon is not first and fake._daemon.poll() is None
+    finally:
+        if fake._daemon is not None:
+            fake._daemon.kill()
+            fake._daemon.wait()
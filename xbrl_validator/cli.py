@@ -68,6 +68,7 @@ def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
     # Exports unified with app.validate
     parser.add_argument("--exports", required=False, default="exports", help="Exports directory (CSV/JSON/Excel/PDF)")
     parser.add_argument("--out-jsonl", required=False, help="Write raw JSONL validation log to this path")
+    parser.add_argument("--no-reports", action="store_true", help="Skip the Excel/PDF reports (CSV/JSON exports only)")
     parser.add_argument(
         "--dpm-sqlite",
         required=False,
@@ -197,7 +198,8 @@ def main(argv: Optional[list] = None) -> int:
         write_validation_messages_csv(msgs, str(exp_dir / "validation_messages.csv"))
         write_results_by_file_json(by_file, str(exp_dir / "results_by_file.json"))
         write_formula_rollup_csv(msgs, str(exp_dir / "formula_rollup.csv"))
-        _paths = generate_reports(messages=msgs, exports_dir=str(exp_dir))
+        if not args.no_reports:
+            _paths = generate_reports(messages=msgs, exports_dir=str(exp_dir))
         if args.out_json:
             write_results_by_file_json(by_file, args.out_json)
         if args.out_csv:
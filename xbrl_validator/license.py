@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+import functools
 import json
 import os
 from dataclasses import dataclass
@@ -97,6 +98,13 @@ def set_license_path(path: str) -> None:
     _save_settings(s)
 
 
+@functools.lru_cache(maxsize=8)
+def _ed25519_public_key(pub_b64: str) -> Any:
+    # Key objects are immutable; reusing one skips re-importing the raw bytes on every check
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+    return Ed25519PublicKey.from_public_bytes(base64.b64decode(pub_b64))
+
+
 def _verify_signature(payload: Dict[str, Any], signature_b64: str) -> bool:
     try:
         signed = dict(payload)
@@ -104,14 +112,12 @@ def _verify_signature(payload: Dict[str, Any], signature_b64: str) -> bool:
             signed.pop("signature")
         blob = json.dumps(signed, sort_keys=True, separators=(",", ":")).encode("utf-8")
         sig = base64.b64decode(signature_b64)
-        pub = base64.b64decode(_get_public_key_b64())
         try:
-            from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
             from cryptography.exceptions import InvalidSignature
         except Exception:
             # cryptography not installed
             return False
-        key = Ed25519PublicKey.from_public_bytes(pub)
+        key = _ed25519_public_key(_get_public_key_b64())
         try:
             key.verify(sig, blob)
             return True